@@ -0,0 +1,193 @@
+"""
+HTTP client for the admin backend, used to seed and remove test data without the UI
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+import requests
+from requests.adapters import HTTPAdapter
+from config import TestConfig
+from backend_snapshot import ledger
+from log_backend import get_logger
+
+
+logger = get_logger("API")
+
+
+class AdminApiClient:
+    """
+    Thin client for the admin server's REST resources.
+    
+    All calls share one requests.Session, so TCP connections are kept alive
+    and reused; bulk calls run concurrently over that session's pool.
+    """
+    
+    # Resource path (relative to API_URL) per entity kind
+    ENDPOINTS = {
+        "blog": "blogs",
+        "project": "portfolio",
+        "gallery": "gallery",
+        "backup": "backups",
+    }
+    
+    # Resource path of the site configuration, a single document
+    CONFIG_ENDPOINT = "site-config"
+    
+    # Field used as identifier when the server does not return an id
+    KEY_FIELDS = {
+        "blog": "slug",
+        "project": "title",
+        "gallery": "id",
+        "backup": "filename",
+    }
+    
+    def __init__(self, base_url=None, concurrency=None, timeout=None):
+        self.base_url = (base_url or TestConfig.API_URL).rstrip("/")
+        self.concurrency = concurrency or TestConfig.SEED_CONCURRENCY
+        self.timeout = timeout or TestConfig.EXPLICIT_WAIT
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Content-Type"] = "application/json"
+        if TestConfig.API_TOKEN:
+            self.session.headers["Authorization"] = f"Bearer {TestConfig.API_TOKEN}"
+    
+    def url(self, kind, entity_id=None):
+        """Resource URL of a collection or of one entity"""
+        url = f"{self.base_url}/{self.ENDPOINTS[kind]}"
+        return f"{url}/{quote(str(entity_id), safe='')}" if entity_id is not None else url
+    
+    def fetch_all(self, kind):
+        """All entities of a kind"""
+        response = self.session.get(self.url(kind), timeout=self.timeout)
+        response.raise_for_status()
+        return self.unwrap(response.json())
+    
+    def fetch(self, kind, entity_id):
+        """One entity, or None if it does not exist; non-JSON bodies as text"""
+        response = self.session.get(self.url(kind, entity_id), timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        try:
+            return self.unwrap(response.json())
+        except ValueError:
+            return response.text
+    
+    def fetch_many(self, kind, entity_ids):
+        """Fetch entities concurrently; returns them in the order given"""
+        if not entity_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            return list(pool.map(lambda entity_id: self.fetch(kind, entity_id), entity_ids))
+    
+    def entity_id(self, kind, entity):
+        """Id of an entity as returned by fetch_all"""
+        if not isinstance(entity, dict):
+            return entity
+        if entity.get("id") is not None:
+            return entity["id"]
+        return entity.get(self.KEY_FIELDS[kind])
+    
+    def fetch_config(self):
+        """The site configuration, or None if the backend has none"""
+        response = self.session.get(f"{self.base_url}/{self.CONFIG_ENDPOINT}", timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return self.unwrap(response.json())
+    
+    def save_config(self, config):
+        """Replace the site configuration"""
+        with ledger.write(config=True):
+            response = self.session.put(f"{self.base_url}/{self.CONFIG_ENDPOINT}", json=config, timeout=self.timeout)
+        response.raise_for_status()
+    
+    def create(self, kind, data):
+        """Create one entity; returns its id"""
+        with ledger.write():
+            return self._create(kind, data)
+    
+    def _create(self, kind, data):
+        """POST one entity without recording the write"""
+        response = self.session.post(self.url(kind), json=data, timeout=self.timeout)
+        response.raise_for_status()
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = None
+        return self.created_id(kind, data, payload)
+    
+    def created_id(self, kind, data, payload):
+        """Id of a created entity: the one in the response, else its key field"""
+        created = self.unwrap(payload)
+        if isinstance(created, dict) and created.get("id") is not None:
+            return created["id"]
+        return data.get(self.KEY_FIELDS[kind])
+    
+    def create_many(self, kind, items):
+        """Create entities concurrently; returns their ids in the order given"""
+        start = time.perf_counter()
+        with ledger.write():
+            if len(items) == 1:
+                ids = [self._create(kind, items[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                    ids = list(pool.map(lambda data: self._create(kind, data), items))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.log(f"Seeded {len(items)} {kind} entities in {elapsed_ms:.0f}ms")
+        return ids
+    
+    def update(self, kind, entity_id, data):
+        """Replace one entity"""
+        with ledger.write():
+            self._update(kind, entity_id, data)
+    
+    def _update(self, kind, entity_id, data):
+        """PUT one entity without recording the write"""
+        response = self.session.put(self.url(kind, entity_id), json=data, timeout=self.timeout)
+        response.raise_for_status()
+    
+    def update_many(self, kind, updates):
+        """Apply (entity_id, data) updates concurrently"""
+        start = time.perf_counter()
+        with ledger.write(), ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            list(pool.map(lambda update: self._update(kind, *update), updates))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.log(f"Applied {len(updates)} {kind} updates in {elapsed_ms:.0f}ms")
+    
+    def delete(self, kind, entity_id):
+        """Delete one entity; returns False if it was already gone"""
+        with ledger.write():
+            return self._delete(kind, entity_id)
+    
+    def _delete(self, kind, entity_id):
+        """DELETE one entity without recording the write; False if it was already gone"""
+        response = self.session.delete(self.url(kind, entity_id), timeout=self.timeout)
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
+    
+    def delete_many(self, kind, entity_ids):
+        """Delete entities concurrently; returns how many existed"""
+        if not entity_ids:
+            return 0
+        with ledger.write(), ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            return sum(pool.map(lambda entity_id: self._delete(kind, entity_id), entity_ids))
+    
+    def close(self):
+        """Close the pooled connections"""
+        self.session.close()
+    
+    @staticmethod
+    def unwrap(payload):
+        """Accept both bare payloads and {"data": ...} envelopes"""
+        if isinstance(payload, dict) and "data" in payload:
+            return payload["data"]
+        return payload
+    
+    def log(self, message):
+        """Log info message"""
+        logger.info(message)
@@ -0,0 +1,162 @@
+"""
+Failure artifacts (screenshot, DOM, console log) written by a background thread
+"""
+import base64
+import gzip
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+from config import TestConfig
+from log_backend import get_logger
+
+
+logger = get_logger("ARTIFACT")
+
+
+class ArtifactWriter:
+    """
+    Captures failure artifacts on the test thread, writes them on another.
+    
+    The test thread only talks to the browser and compresses in memory:
+    screenshots come from Chrome as JPEG, the DOM is gzipped. Files are
+    named by content hash, so a screenshot identical to an earlier one is
+    not written again and the report links to the existing file. Once this
+    process has used its share of ARTIFACT_BUDGET_MB, further artifacts
+    are dropped.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, directory=None, budget_bytes=None):
+        self.directory = directory or TestConfig.ARTIFACTS_DIR
+        if budget_bytes is None:
+            workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+            budget_bytes = TestConfig.ARTIFACT_BUDGET_MB * 1024 * 1024 // workers
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.seen = set()
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.stats = {"captured": 0, "deduplicated": 0, "over_budget": 0, "written_kb": 0}
+    
+    def capture(self, driver, test_name):
+        """
+        Grab screenshot, DOM and console log of a failed test
+        
+        Args:
+            driver: WebDriver of the failed test
+            test_name: Node id, recorded in the manifest
+        
+        Returns:
+            Dict of artifact kind -> file path; files appear shortly after
+        """
+        payloads = {}
+        screenshot = self._screenshot(driver)
+        if screenshot:
+            payloads["screenshot"] = screenshot
+        if TestConfig.CAPTURE_DOM:
+            dom = self._call(lambda: driver.page_source)
+            if dom:
+                payloads["dom"] = (gzip.compress(dom.encode("utf-8"), compresslevel=6, mtime=0), ".html.gz")
+        if TestConfig.CAPTURE_CONSOLE:
+            entries = self._call(lambda: driver.get_log("browser"))
+            if entries:
+                payloads["console"] = (json.dumps(entries, indent=1).encode("utf-8"), ".console.json")
+        
+        paths = {}
+        for kind, (data, extension) in payloads.items():
+            path = self.submit(data, extension)
+            if path:
+                paths[kind] = path
+        if paths:
+            self.stats["captured"] += 1
+            self._enqueue(("manifest", {"test": test_name, "time": time.time(), **paths}))
+        return paths
+    
+    def submit(self, data, extension):
+        """Queue bytes for writing under their content hash; returns the path or None"""
+        path = os.path.join(self.directory, hashlib.sha1(data).hexdigest()[:16] + extension)
+        if path in self.seen:
+            self.stats["deduplicated"] += 1
+            return path
+        if self.used_bytes + len(data) > self.budget_bytes:
+            self.stats["over_budget"] += 1
+            return None
+        self.seen.add(path)
+        self.used_bytes += len(data)
+        self._enqueue(("file", (path, data)))
+        return path
+    
+    def close(self):
+        """Wait for queued writes; returns the statistics"""
+        if self.thread is not None:
+            self.queue.put(self._STOP)
+            self.thread.join()
+            self.thread = None
+        self.stats["written_kb"] = self.used_bytes // 1024
+        return self.stats
+    
+    def _enqueue(self, job):
+        """Hand a job to the writer thread, starting it on first use"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+            self.thread.start()
+        self.queue.put(job)
+    
+    def _run(self):
+        """Writer thread: files atomically, manifest lines appended"""
+        os.makedirs(self.directory, exist_ok=True)
+        manifest_path = os.path.join(self.directory, "manifest.jsonl")
+        while True:
+            job = self.queue.get()
+            if job is self._STOP:
+                return
+            kind, payload = job
+            try:
+                if kind == "file":
+                    path, data = payload
+                    # Written by an earlier run or another worker already
+                    if os.path.exists(path):
+                        continue
+                    tmp_path = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp_path, path)
+                else:
+                    with open(manifest_path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(payload) + "\n")
+            except OSError as e:
+                logger.warning(f"Could not write artifact: {e}")
+    
+    def _screenshot(self, driver):
+        """(bytes, extension) of a JPEG screenshot through CDP, else WebDriver's PNG"""
+        result = self._call(lambda: driver.execute_cdp_cmd(
+            "Page.captureScreenshot", {"format": "jpeg", "quality": TestConfig.SCREENSHOT_QUALITY}
+        ))
+        if result and result.get("data"):
+            return base64.b64decode(result["data"]), ".jpg"
+        png = self._call(driver.get_screenshot_as_png)
+        return (png, ".png") if png else None
+    
+    @staticmethod
+    def _call(func):
+        """Run a driver call, returning None if the session cannot answer"""
+        try:
+            return func()
+        except (WebDriverException, AttributeError):
+            return None
+    
+    @staticmethod
+    def format_stats(stats):
+        """Human readable summary"""
+        return (
+            f"{stats['captured']} failures captured, {stats['written_kb']} KB written, "
+            f"{stats['deduplicated']} duplicates skipped, {stats['over_budget']} dropped over budget"
+        )
+
+
+writer = ArtifactWriter()
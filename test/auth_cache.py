@@ -0,0 +1,192 @@
+"""
+Login-once cache of the admin panel's authenticated browser state
+"""
+import json
+import time
+from urllib.parse import urlparse
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from config import TestConfig
+from pages.login_page import LoginPage
+from pages.dashboard_page import DashboardPage
+from log_backend import get_logger
+
+
+logger = get_logger("AUTH")
+
+
+class AuthStateCache:
+    """
+    Perform the real UI login once per worker and replay it afterwards.
+    
+    The captured state (cookies, localStorage, sessionStorage) is restored
+    into each fresh or reset session before its first navigation. If the
+    state has expired or the app rejects it, a real login is performed and
+    the cache is refreshed.
+    """
+    
+    def __init__(self, password=None, ttl=None, enabled=None):
+        self.password = password or TestConfig.ADMIN_PASSWORD
+        self.ttl = TestConfig.AUTH_CACHE_TTL if ttl is None else ttl
+        self.enabled = TestConfig.AUTH_CACHE if enabled is None else enabled
+        self.origin = "{0.scheme}://{0.netloc}".format(urlparse(TestConfig.ADMIN_URL))
+        self.state = None
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "rejected": 0}
+    
+    def authenticate(self, driver):
+        """Leave the driver logged in on the dashboard, using the cache when possible"""
+        if self.enabled and self.state:
+            if self.is_expired():
+                self.stats["expired"] += 1
+                self.log("Cached auth state expired, logging in again")
+            elif self.restore(driver) and self.is_authenticated(driver):
+                self.stats["hits"] += 1
+                self.log("Restored cached auth state")
+                return True
+            else:
+                self.stats["rejected"] += 1
+                self.log("Cached auth state rejected, logging in again")
+            self.state = None
+        
+        self.stats["misses"] += 1
+        self.login(driver)
+        return False
+    
+    def login(self, driver):
+        """Log in through the UI and capture the resulting state"""
+        login_page = LoginPage(driver)
+        login_page.navigate()
+        login_page.login(self.password)
+        
+        if not self.enabled:
+            return
+        try:
+            WebDriverWait(driver, TestConfig.EXPLICIT_WAIT).until(lambda d: "login" not in d.current_url)
+            self.state = self.capture(driver)
+        except TimeoutException:
+            self.log("Login did not leave the login page, nothing cached")
+    
+    def capture(self, driver):
+        """Snapshot cookies and web storage of the logged-in session"""
+        storage = driver.execute_script(
+            "return {local: Object.assign({}, window.localStorage),"
+            " session: Object.assign({}, window.sessionStorage)};"
+        )
+        return {
+            "cookies": driver.get_cookies(),
+            "local_storage": storage.get("local", {}),
+            "session_storage": storage.get("session", {}),
+            "captured_at": time.time(),
+        }
+    
+    def restore(self, driver):
+        """Inject the cached state so the next page load is already authenticated"""
+        try:
+            script_id = self._restore_with_cdp(driver)
+        except (WebDriverException, AttributeError):
+            return self._restore_with_navigation(driver)
+        
+        try:
+            driver.get(TestConfig.ADMIN_URL)
+        finally:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id})
+        return True
+    
+    def is_expired(self):
+        """Check the cache TTL and the expiry of every captured cookie"""
+        now = time.time()
+        if self.ttl and now - self.state["captured_at"] > self.ttl:
+            return True
+        return any(c.get("expiry") and c["expiry"] <= now for c in self.state["cookies"])
+    
+    def is_authenticated(self, driver):
+        """Check that the app shows the dashboard rather than redirecting to login"""
+        if not driver.current_url.startswith(self.origin):
+            driver.get(TestConfig.ADMIN_URL)
+        
+        def landed(d):
+            if "login" in d.current_url:
+                return "login"
+            ready = d.execute_script(
+                "return document.readyState === 'complete' && !!document.querySelector(arguments[0]);",
+                DashboardPage.SIDEBAR[1]
+            )
+            return "dashboard" if ready else False
+        
+        try:
+            return WebDriverWait(driver, TestConfig.EXPLICIT_WAIT).until(landed) == "dashboard"
+        except TimeoutException:
+            return False
+    
+    def report(self):
+        """Print hit/miss statistics for this worker"""
+        self.log(self.format_stats(self.stats))
+    
+    @staticmethod
+    def format_stats(stats):
+        """Human readable hit/miss summary"""
+        total = stats["hits"] + stats["misses"]
+        rate = (stats["hits"] / total * 100) if total else 0.0
+        return (
+            f"Auth cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({rate:.0f}% hit rate), {stats['expired']} expired, {stats['rejected']} rejected"
+        )
+    
+    def _restore_with_cdp(self, driver):
+        """Set cookies and register a storage-seeding script through CDP"""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCookies", {
+            "cookies": [self._to_cdp_cookie(c) for c in self.state["cookies"]]
+        })
+        
+        script = (
+            "if (window.location.origin === %s) {"
+            " var local = %s, session = %s;"
+            " Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });"
+            " Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });"
+            "}"
+        ) % (
+            json.dumps(self.origin),
+            json.dumps(self.state["local_storage"]),
+            json.dumps(self.state["session_storage"]),
+        )
+        result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+        return result["identifier"]
+    
+    def _restore_with_navigation(self, driver):
+        """Fallback for drivers without CDP: seed state from the login page"""
+        try:
+            driver.get(TestConfig.ADMIN_URL + "/login")
+            for cookie in self.state["cookies"]:
+                driver.add_cookie(cookie)
+            driver.execute_script(
+                "var local = arguments[0], session = arguments[1];"
+                "Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });"
+                "Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });",
+                self.state["local_storage"],
+                self.state["session_storage"]
+            )
+            driver.get(TestConfig.ADMIN_URL)
+            return True
+        except WebDriverException:
+            return False
+    
+    def _to_cdp_cookie(self, cookie):
+        """Convert a Selenium cookie dict to a CDP Network.CookieParam"""
+        param = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie.get("domain") or urlparse(self.origin).hostname,
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if cookie.get("expiry"):
+            param["expires"] = cookie["expiry"]
+        if cookie.get("sameSite"):
+            param["sameSite"] = cookie["sameSite"]
+        return param
+    
+    def log(self, message):
+        """Log info message"""
+        logger.info(message)
@@ -0,0 +1,307 @@
+"""
+Run-level restore of the admin backend: the run's own entities, the backups
+its writes caused and the site config it saved are put back afterwards
+"""
+import ctypes
+import glob
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+import requests
+from config import TestConfig
+from log_backend import get_logger
+
+
+logger = get_logger("SNAPSHOT")
+
+# Windows process access right and exit code of a process that has not exited
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+STILL_ACTIVE = 259
+ERROR_ACCESS_DENIED = 5
+
+# Entity kinds the data factory namespaces
+CONTENT_KINDS = ("blog", "project", "gallery")
+
+
+def owned_by(marker):
+    """Predicate for entities whose content mentions marker, e.g. a namespace"""
+    return lambda entity: marker in json.dumps(entity, ensure_ascii=False)
+
+
+def sweep(api, marker):
+    """Delete every blog, project and gallery item that mentions marker; returns how many existed"""
+    owned = owned_by(marker)
+    deleted = 0
+    for kind in CONTENT_KINDS:
+        entity_ids = [api.entity_id(kind, e) for e in api.fetch_all(kind) if owned(e)]
+        deleted += api.delete_many(kind, entity_ids)
+    return deleted
+
+
+class WriteLedger:
+    """
+    Backups caused by this process's own writes, and whether it saved the
+    site config.
+    
+    The backend writes a backup on every content change, whoever makes it,
+    and every backup holds all content, so its content says nothing about
+    who caused it. While recording, each write of the suite (AdminApiClient
+    writes and page object saves) lists the backups before and after it;
+    only those that appeared in between are recorded. With a path, records
+    are also appended to a file every process of the run shares, so the
+    end of the run, or the next run after a crash, removes the backups of
+    all workers.
+    """
+    
+    def __init__(self):
+        self.api = None
+        self.path = None
+        self.backups = []
+        self.config_saved = False
+        self._seen = set()
+        self._lock = threading.Lock()
+    
+    @property
+    def recording(self):
+        """Whether writes are being recorded"""
+        return self.api is not None
+    
+    def record(self, api, path=None):
+        """Start recording writes, listing backups with api; path shares the records with the run"""
+        self.api = api
+        self.path = path
+    
+    def stop(self):
+        """Stop recording; the records are kept"""
+        self.api = None
+        self.path = None
+    
+    def mark(self):
+        """Position in the records, for since()"""
+        return len(self.backups)
+    
+    def since(self, mark):
+        """Backups recorded after a mark()"""
+        return self.backups[mark:]
+    
+    @contextmanager
+    def write(self, config=False):
+        """Record the backups that appear while the block writes; config marks a site config save"""
+        api = self.api
+        before = self.listing(api)
+        try:
+            yield
+        finally:
+            after = self.listing(api) if before is not None else None
+            if after is not None:
+                self._add([b for b in after if b not in before], config)
+    
+    @staticmethod
+    def listing(api):
+        """Backup ids on the server, or None when not recording or the list is unavailable"""
+        if api is None:
+            return None
+        try:
+            return {api.entity_id("backup", b) for b in api.fetch_all("backup")}
+        except requests.RequestException as e:
+            logger.warning(f"Backup list unavailable, write not recorded: {e.__class__.__name__}")
+            return None
+    
+    def _add(self, backups, config):
+        """Keep new records in memory and append them to the run's file"""
+        with self._lock:
+            backups = [b for b in backups if b not in self._seen]
+            self._seen.update(backups)
+            self.backups.extend(backups)
+            self.config_saved = self.config_saved or config
+            if self.path and (backups or config):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"pid": os.getpid(), "backups": backups, "config": config}) + "\n")
+    
+    @staticmethod
+    def read(path):
+        """(backup ids, config saved) of all records in a run's file"""
+        backups, config = [], False
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Line cut short by a process that was killed
+                        continue
+                    backups.extend(entry["backups"])
+                    config = config or entry["config"]
+        except FileNotFoundError:
+            pass
+        return list(dict.fromkeys(backups)), config
+
+
+# Shared by the API client and the page objects of this process
+ledger = WriteLedger()
+
+
+class SessionSnapshot:
+    """
+    Site config taken at the start of a run, and the restore of everything
+    the run changed at its end.
+    
+    The suite writes three things on a shared backend: entities in its own
+    namespace, the site config, and the backups the server writes for each
+    change. At the end the run's namespace is swept, the site config is put
+    back if the run saved it, and the backups the WriteLedger recorded for
+    the run's writes are deleted. Other people's entities, edits and
+    backups are never touched.
+    
+    Runs sharing a backend each keep a file named after their run id until
+    they have been restored. If a run dies before that, the next run finds
+    the file and restores it first.
+    """
+    
+    def __init__(self, api, run_id, directory=None):
+        self.api = api
+        self.run_id = run_id
+        self.directory = directory or TestConfig.BACKEND_SNAPSHOT_DIR
+        self.path = os.path.join(self.directory, f"{run_id}.json")
+        self.ledger_path = self.ledger_file(run_id, self.directory)
+        self.config = None
+        self.started = False
+        self.stats = None
+    
+    @staticmethod
+    def ledger_file(run_id, directory=None):
+        """File the WriteLedger of every process of a run appends to"""
+        return os.path.join(directory or TestConfig.BACKEND_SNAPSHOT_DIR, f"{run_id}.ledger.jsonl")
+    
+    def start(self):
+        """Recover from interrupted runs, capture the site config and start recording writes"""
+        try:
+            for path in glob.glob(os.path.join(self.directory, "*.json")):
+                leftover = self._load(path)
+                if leftover is None or path == self.path or self._is_running(leftover.get("pid")):
+                    continue
+                self.log_warning(f"Restoring backend state left behind by interrupted run {leftover['run_id']}")
+                self.log(self.format_stats(self._restore(leftover["run_id"], leftover.get("config"))))
+                self._remove(path)
+                self._remove(self.ledger_file(leftover["run_id"], self.directory))
+            self.config = self.api.fetch_config()
+            self._save()
+        except requests.RequestException as e:
+            self.log_warning(f"Backend snapshot unavailable, run is not hermetic: {e.__class__.__name__}")
+            return
+        ledger.record(self.api, self.ledger_path)
+        self.started = True
+        self.log(f"Captured site config; recording the backups of run {self.run_id}")
+    
+    def finish(self):
+        """Restore what the run changed"""
+        if not self.started:
+            return None
+        # The restore brackets its own writes
+        ledger.stop()
+        try:
+            self.stats = self._restore(self.run_id, self.config)
+        except requests.RequestException as e:
+            self.log_warning(f"Backend restore failed, will retry on the next run: {e.__class__.__name__}")
+            return None
+        self._remove(self.path)
+        self._remove(self.ledger_path)
+        return self.stats
+    
+    def _restore(self, run_id, config):
+        """Sweep a run's namespace, put its site config back and delete its backups; timed"""
+        start = time.perf_counter()
+        backups, config_saved = WriteLedger.read(self.ledger_file(run_id, self.directory))
+        before = WriteLedger.listing(self.api)
+        deleted = sweep(self.api, f"{run_id}-")
+        config_restored = False
+        if config_saved and config is not None and not self._same(config, self.api.fetch_config()):
+            self.api.save_config(config)
+            config_restored = True
+        after = WriteLedger.listing(self.api)
+        if before is not None and after is not None:
+            # The restore's own writes leave backups as well
+            backups += [b for b in after if b not in before]
+        return {
+            "deleted": deleted,
+            "config_restored": config_restored,
+            "backups_deleted": self.api.delete_many("backup", backups),
+            "seconds": time.perf_counter() - start,
+        }
+    
+    def _save(self):
+        """Atomically write the run's file, so an interrupted run can still be restored"""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"pid": os.getpid(), "run_id": self.run_id, "taken_at": time.time(), "config": self.config}, f)
+        os.replace(tmp_path, self.path)
+    
+    @staticmethod
+    def _load(path):
+        """Contents of a run's file, or None if it is unreadable"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return payload if isinstance(payload, dict) and payload.get("run_id") else None
+    
+    @staticmethod
+    def _same(a, b):
+        """Compare two JSON values independent of key order"""
+        return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+    
+    @staticmethod
+    def _remove(path):
+        """Delete a file another run may already have removed"""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    
+    @staticmethod
+    def format_stats(stats):
+        """Human readable restore summary"""
+        config = ", site config restored" if stats.get("config_restored") else ""
+        return (
+            f"Backend restored in {stats.get('seconds', 0):.1f}s: {stats['deleted']} entities deleted, "
+            f"{stats['backups_deleted']} backups removed{config}"
+        )
+    
+    @staticmethod
+    def _is_running(pid):
+        """Whether the run that wrote a snapshot is still alive"""
+        if not pid or pid == os.getpid():
+            return False
+        if os.name == "nt":
+            # os.kill would terminate the process on Windows
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if not handle:
+                return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+            try:
+                exit_code = ctypes.c_ulong()
+                if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                    return False
+                return exit_code.value == STILL_ACTIVE
+            finally:
+                kernel32.CloseHandle(handle)
+        try:
+            os.kill(pid, 0)
+        except PermissionError:
+            return True
+        except OSError:
+            return False
+        return True
+    
+    def log(self, message):
+        """Log info message"""
+        logger.info(message)
+    
+    def log_warning(self, message):
+        """Log warning message"""
+        logger.warning(message)
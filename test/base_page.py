@@ -9,33 +9,289 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException,
-    ElementClickInterceptedException
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    NoAlertPresentException,
+    JavascriptException
 )
 from config import TestConfig
-from colorama import Fore, Style
+from network_monitor import NetworkMonitor
+from backend_snapshot import ledger
+from traffic import recorder as traffic_recorder
+from timing import caller_name, timed, traced_sleep
+from log_backend import get_logger
+import re
 import time
 
 
+logger = get_logger()
+
+
+# Methods the admin panel uses to write to the backend
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+# How often network waits drain CDP events
+NETWORK_POLL_INTERVAL = 0.05
+
+
+# Installed once per document: counts in-flight fetch/XHR calls and stamps
+# the last DOM mutation, scroll or request activity.
+QUIESCENCE_TRACKER_JS = """
+(function () {
+    if (window.__quiescence) { return; }
+    var state = window.__quiescence = {pending: 0, lastActivity: performance.now()};
+    function touch() { state.lastActivity = performance.now(); }
+    function start() { state.pending++; touch(); }
+    function done() { state.pending = Math.max(0, state.pending - 1); touch(); }
+
+    new MutationObserver(function (records) {
+        for (var i = 0; i < records.length; i++) {
+            if (records[i].attributeName !== 'style') { touch(); return; }
+        }
+    }).observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    window.addEventListener('scroll', touch, true);
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            start();
+            return originalFetch.apply(this, arguments).then(
+                function (response) { done(); return response; },
+                function (error) { done(); throw error; }
+            );
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        start();
+        this.addEventListener('loadend', done, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+})();
+"""
+
+# Resolves once nothing has changed and no request has been pending for
+# the quiet window, or when the timeout expires.
+QUIESCENCE_WAIT_JS = """
+var quietMs = arguments[0], timeoutMs = arguments[1], callback = arguments[arguments.length - 1];
+var state = window.__quiescence, started = performance.now();
+(function check() {
+    var now = performance.now(), idle = now - state.lastActivity;
+    if (state.pending === 0 && idle >= quietMs) {
+        callback({settled: true, pending: 0});
+    } else if (now - started >= timeoutMs) {
+        callback({settled: false, pending: state.pending});
+    } else {
+        setTimeout(check, Math.max(10, Math.min(50, quietMs - idle)));
+    }
+})();
+"""
+
+# Reads a whole data table in one round trip. Rows whose only cell spans
+# several columns are empty-state placeholders and are skipped.
+TABLE_SNAPSHOT_JS = """
+var table = typeof arguments[0] === 'string' ? document.querySelector(arguments[0]) : arguments[0];
+var withActions = arguments[1];
+if (!table) { return null; }
+function text(node) { return (node.innerText || node.textContent || '').trim(); }
+var headers = Array.prototype.map.call(table.querySelectorAll('thead th'), text);
+var rows = [], trs = table.querySelectorAll('tbody tr');
+for (var i = 0; i < trs.length; i++) {
+    var tds = trs[i].querySelectorAll('td');
+    if (tds.length === 1 && tds[0].colSpan > 1) { continue; }
+    var row = {cells: Array.prototype.map.call(tds, text), element: null, actions: []};
+    if (withActions) {
+        row.element = trs[i];
+        row.actions = Array.prototype.map.call(trs[i].querySelectorAll('button, a[role="button"]'), function (btn) {
+            var label = btn.getAttribute('aria-label') || btn.getAttribute('title') || text(btn);
+            return {label: label.trim(), element: btn};
+        });
+    }
+    rows.push(row);
+}
+return {headers: headers, rows: rows};
+"""
+
+# Sets many input/textarea values at once. The native value setter bypasses
+# React's value tracker so the dispatched input event updates component
+# state; the value is read back after React has re-rendered the field.
+FORM_FILL_JS = """
+var fields = arguments[0];
+function lookup(by, value) {
+    if (by === 'id') { return document.getElementById(value); }
+    if (by === 'name') { return document.getElementsByName(value)[0] || null; }
+    if (by === 'css selector') { return document.querySelector(value); }
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return null;
+}
+return fields.map(function (field) {
+    var el = lookup(field.by, field.selector);
+    if (!el) { return {status: 'missing'}; }
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : el instanceof HTMLInputElement ? HTMLInputElement.prototype : null;
+    if (!proto || el.type === 'file' || el.type === 'checkbox' || el.type === 'radio' || el.disabled || el.readOnly) {
+        return {status: 'unsupported'};
+    }
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, field.text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return {status: el.value === field.text ? 'ok' : 'mismatch', value: el.value};
+});
+"""
+
+# Clicks the confirming button of an open confirmation dialog, if any
+CONFIRM_DIALOG_JS = """
+var dialog = document.querySelector('[role="alertdialog"], [role="dialog"]');
+if (!dialog) { return false; }
+var buttons = dialog.querySelectorAll('button');
+for (var i = 0; i < buttons.length; i++) {
+    if (/delete|confirm|continue|yes/i.test(buttons[i].innerText || '')) {
+        buttons[i].click();
+        return true;
+    }
+}
+return false;
+"""
+
+
+class TableRow:
+    """One data row of a TableSnapshot"""
+    
+    def __init__(self, index, cells, headers, element=None, actions=None):
+        self.index = index
+        self.cells = cells
+        self.headers = headers
+        self.element = element
+        self.actions = actions or []
+    
+    def get(self, column):
+        """Cell text for a column name or index"""
+        position = column if isinstance(column, int) else TableSnapshot.column_index(self.headers, column)
+        if position is None or position >= len(self.cells):
+            return None
+        return self.cells[position]
+    
+    def contains(self, value, column=None):
+        """Check whether the row (or one column of it) contains the value"""
+        if column is not None:
+            cell = self.get(column)
+            return cell is not None and value in cell
+        return any(value in cell for cell in self.cells)
+    
+    def action_labels(self):
+        """Labels of the row's action buttons"""
+        return [a["label"] for a in self.actions]
+    
+    def action(self, name):
+        """Row button whose label contains name (case-insensitive)"""
+        for action in self.actions:
+            if name.lower() in action["label"].lower():
+                return action["element"]
+        return None
+    
+    def as_dict(self):
+        """Cells keyed by header text"""
+        return dict(zip(self.headers, self.cells))
+
+
+class TableSnapshot:
+    """Headers, cell text and row actions of a data table, read in one script call"""
+    
+    def __init__(self, headers, rows):
+        self.headers = headers
+        self.rows = rows
+    
+    @classmethod
+    def from_script_result(cls, result):
+        """Build a snapshot from the TABLE_SNAPSHOT_JS return value"""
+        if not result:
+            return cls([], [])
+        headers = result["headers"]
+        rows = [
+            TableRow(i, r["cells"], headers, r.get("element"), r.get("actions"))
+            for i, r in enumerate(result["rows"])
+        ]
+        return cls(headers, rows)
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def __iter__(self):
+        return iter(self.rows)
+    
+    @staticmethod
+    def column_index(headers, name):
+        """Index of a column by exact, then partial, case-insensitive header match"""
+        wanted = name.lower()
+        lowered = [h.lower() for h in headers]
+        if wanted in lowered:
+            return lowered.index(wanted)
+        for i, header in enumerate(lowered):
+            if wanted in header:
+                return i
+        return None
+    
+    def has_column(self, name):
+        """Check whether a header matches the name"""
+        return self.column_index(self.headers, name) is not None
+    
+    def column(self, name):
+        """All cell values of one column"""
+        return [row.get(name) for row in self.rows]
+    
+    def row(self, index):
+        """Row by position, or None"""
+        return self.rows[index] if -len(self.rows) <= index < len(self.rows) else None
+    
+    def find(self, value, column=None):
+        """First row containing the value"""
+        return next((row for row in self.rows if row.contains(value, column)), None)
+    
+    def find_all(self, value, column=None):
+        """All rows containing the value"""
+        return [row for row in self.rows if row.contains(value, column)]
+
+
 class BasePage:
     """Base class for all page objects"""
     
+    # Every DOM-quiescence wait of this process, for the end-of-run summary
+    wait_records = []
+    
+    # Element whose appearance means the page can be used; page objects
+    # override it with the element that shows their data (page-load benchmark)
+    READY = (By.TAG_NAME, "body")
+    
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, TestConfig.EXPLICIT_WAIT)
         self.actions = ActionChains(driver)
     
+    @property
+    def network(self):
+        """CDP network monitor of this page's browser session"""
+        return NetworkMonitor.for_driver(self.driver)
+    
+    @timed("driver")
     def navigate(self, url):
         """Navigate to a URL"""
         self.log(f"Navigating to: {url}")
+        if traffic_recorder.enabled:
+            # Response bodies are only available while their page is open
+            self.network.poll()
         self.driver.get(url)
         self.wait_for_page_load()
     
+    @timed("wait")
     def wait_for_page_load(self):
         """Wait for page to fully load"""
         self.wait.until(
             lambda driver: driver.execute_script("return document.readyState") == "complete"
         )
     
+    @timed("wait")
     def find_element(self, locator, timeout=None):
         """Find element with explicit wait"""
         try:
@@ -46,6 +302,7 @@ class BasePage:
             self.log_error(f"Element not found: {locator}")
             raise
     
+    @timed("wait")
     def find_elements(self, locator, timeout=None):
         """Find multiple elements"""
         try:
@@ -56,6 +313,7 @@ class BasePage:
             self.log_error(f"Elements not found: {locator}")
             return []
     
+    @timed("driver")
     def click(self, locator, timeout=None):
         """Click element with retry logic"""
         try:
@@ -72,6 +330,7 @@ class BasePage:
         locator = (By.XPATH, f"//{tag}[contains(text(), '{text}')]")
         self.click(locator, timeout)
     
+    @timed("driver")
     def type_text(self, locator, text, clear_first=True):
         """Type text into input field"""
         element = self.find_element(locator)
@@ -80,15 +339,61 @@ class BasePage:
         element.send_keys(text)
         self.log(f"Typed text into: {locator}")
     
+    @timed("driver")
     def type_slowly(self, locator, text, delay=0.1):
         """Type text character by character (for special inputs)"""
         element = self.find_element(locator)
         element.clear()
         for char in text:
             element.send_keys(char)
-            time.sleep(delay)
+            traced_sleep(delay)
         self.log(f"Typed text slowly into: {locator}")
     
+    @timed("driver")
+    def fill_form(self, fields):
+        """
+        Set all form fields in a single script call
+        
+        Values are written with the native setter plus input/change events
+        and read back in the same call. Fields the script cannot set (missing
+        yet, not a text input, value rejected by the input) are typed with
+        send_keys instead. Inputs that must see real key events, like the
+        search box, are typed with type_text directly.
+        
+        Args:
+            fields: Dict of locator -> value, in fill order
+        
+        Returns:
+            Dict of locator -> "script" or "keys"
+        """
+        methods = {}
+        scripted = [(locator, str(value)) for locator, value in fields.items()]
+        
+        if scripted:
+            try:
+                results = self.driver.execute_script(FORM_FILL_JS, [
+                    {"by": locator[0], "selector": locator[1], "text": text} for locator, text in scripted
+                ])
+            except JavascriptException as e:
+                self.log_warning(f"Bulk form fill failed, typing every field: {e.msg}")
+                results = [{"status": "error"}] * len(scripted)
+            
+            for (locator, text), result in zip(scripted, results):
+                if result["status"] == "ok":
+                    methods[locator] = "script"
+                elif result["status"] == "mismatch":
+                    self.log_warning(f"{locator} kept {result['value']!r} instead of {text!r}, typing it")
+        
+        for locator, value in fields.items():
+            if locator not in methods:
+                self.type_text(locator, str(value))
+                methods[locator] = "keys"
+        
+        typed = sum(1 for method in methods.values() if method == "keys")
+        self.log(f"Filled {len(methods)} fields ({typed} typed)")
+        return {locator: methods[locator] for locator in fields}
+    
+    @timed("driver")
     def select_dropdown(self, locator, value):
         """Select dropdown option by value"""
         element = self.find_element(locator)
@@ -96,16 +401,19 @@ class BasePage:
         option_locator = (By.XPATH, f"//option[@value='{value}']")
         self.click(option_locator)
     
+    @timed("wait")
     def wait_for_clickable(self, locator, timeout=None):
         """Wait for element to be clickable"""
         wait = WebDriverWait(self.driver, timeout or TestConfig.EXPLICIT_WAIT)
         return wait.until(EC.element_to_be_clickable(locator))
     
+    @timed("wait")
     def wait_for_visible(self, locator, timeout=None):
         """Wait for element to be visible"""
         wait = WebDriverWait(self.driver, timeout or TestConfig.EXPLICIT_WAIT)
         return wait.until(EC.visibility_of_element_located(locator))
     
+    @timed("wait")
     def wait_for_invisible(self, locator, timeout=None):
         """Wait for element to become invisible"""
         try:
@@ -115,6 +423,7 @@ class BasePage:
         except TimeoutException:
             return False
     
+    @timed("wait")
     def is_element_present(self, locator, timeout=2):
         """Check if element exists"""
         try:
@@ -123,6 +432,7 @@ class BasePage:
         except (TimeoutException, NoSuchElementException):
             return False
     
+    @timed("wait")
     def is_element_visible(self, locator, timeout=2):
         """Check if element is visible"""
         try:
@@ -131,32 +441,38 @@ class BasePage:
         except (TimeoutException, NoSuchElementException):
             return False
     
+    @timed("driver")
     def get_text(self, locator):
         """Get text from element"""
         element = self.find_element(locator)
         return element.text
     
+    @timed("driver")
     def get_attribute(self, locator, attribute):
         """Get attribute value from element"""
         element = self.find_element(locator)
         return element.get_attribute(attribute)
     
+    @timed("driver")
     def scroll_to_element(self, locator):
         """Scroll to element"""
         element = self.find_element(locator)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)
+        self.wait_for_dom_quiet(replaces=0.5)
     
+    @timed("driver")
     def scroll_to_bottom(self):
         """Scroll to bottom of page"""
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.5)
+        self.wait_for_dom_quiet(replaces=0.5)
     
+    @timed("driver")
     def scroll_to_top(self):
         """Scroll to top of page"""
         self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(0.5)
+        self.wait_for_dom_quiet(replaces=0.5)
     
+    @timed("driver")
     def press_key(self, locator, key):
         """Press keyboard key on element"""
         element = self.find_element(locator)
@@ -166,11 +482,13 @@ class BasePage:
         """Press Enter key"""
         self.press_key(locator, Keys.RETURN)
     
+    @timed("driver")
     def hover(self, locator):
         """Hover over element"""
         element = self.find_element(locator)
         self.actions.move_to_element(element).perform()
     
+    @timed("wait")
     def wait_for_toast(self, timeout=5):
         """Wait for toast notification to appear"""
         try:
@@ -183,34 +501,315 @@ class BasePage:
             self.log_warning("Toast notification not found")
             return None
     
+    @timed("wait")
+    def wait_for_dom_quiet(self, quiet_ms=None, timeout=None, replaces=None, label=None):
+        """
+        Wait until the DOM and network have settled
+        
+        Args:
+            quiet_ms: How long there must be no DOM mutation, scroll or
+                pending fetch/XHR (defaults to QUIET_WINDOW_MS)
+            timeout: Give up after this many seconds (defaults to EXPLICIT_WAIT)
+            replaces: Fixed sleep (seconds) this wait stands in for, used to
+                report the time saved
+            label: Name recorded with the timing (defaults to the caller)
+        
+        Returns:
+            True if the page settled, False if the timeout expired
+        """
+        quiet_ms = TestConfig.QUIET_WINDOW_MS if quiet_ms is None else quiet_ms
+        timeout = timeout or TestConfig.EXPLICIT_WAIT
+        label = label or caller_name()
+        
+        start = time.perf_counter()
+        deadline = start + timeout
+        settled = False
+        
+        while not settled:
+            remaining_ms = (deadline - time.perf_counter()) * 1000
+            if remaining_ms <= 0:
+                break
+            try:
+                result = self.driver.execute_async_script(
+                    QUIESCENCE_TRACKER_JS + QUIESCENCE_WAIT_JS, quiet_ms, remaining_ms
+                )
+                settled = result["settled"]
+                if not settled:
+                    break
+            except (JavascriptException, TimeoutException):
+                # Document was replaced mid-wait; the next attempt re-installs the tracker
+                continue
+        
+        elapsed = self._record_wait(label, start, replaces, settled)
+        if settled:
+            self.log(f"Page settled in {elapsed * 1000:.0f}ms ({label})")
+        else:
+            self.log_warning(f"Page still busy after {timeout}s ({label})")
+        return settled
+    
+    @timed("wait")
+    def wait_for_network_idle(self, idle_ms=None, timeout=None, replaces=None, label=None):
+        """
+        Wait until no fetch/XHR call has been in flight for idle_ms
+        
+        Uses CDP Network events; falls back to wait_for_dom_quiet() when the
+        browser does not expose them.
+        
+        Returns:
+            True if the network went idle, False if the timeout expired
+        """
+        idle_ms = TestConfig.QUIET_WINDOW_MS if idle_ms is None else idle_ms
+        timeout = timeout or TestConfig.EXPLICIT_WAIT
+        label = label or caller_name()
+        monitor = self.network
+        
+        start = time.perf_counter()
+        deadline = start + timeout
+        idle = False
+        
+        while time.perf_counter() < deadline:
+            if not monitor.poll():
+                return self.wait_for_dom_quiet(idle_ms, timeout, replaces, label)
+            quiet_for_ms = (time.monotonic() - monitor.last_activity) * 1000
+            if not monitor.in_flight() and quiet_for_ms >= idle_ms:
+                idle = True
+                break
+            time.sleep(NETWORK_POLL_INTERVAL)
+        
+        elapsed = self._record_wait(label, start, replaces, idle)
+        if idle:
+            self.log(f"Network idle after {elapsed * 1000:.0f}ms ({label})")
+        else:
+            pending = ", ".join(r.url for r in monitor.in_flight())
+            self.log_warning(f"Network still busy after {timeout}s ({label}): {pending}")
+        return idle
+    
+    @timed("wait")
+    def wait_for_request(self, url_pattern, method=None, timeout=None, since=0, idle_ms=None, label=None):
+        """
+        Wait for a fetch/XHR call matching url_pattern to finish
+        
+        Args:
+            url_pattern: Regex searched for in the request URL
+            method: HTTP method, or tuple of methods, to accept
+            timeout: Give up after this many seconds (defaults to EXPLICIT_WAIT)
+            since: Only consider requests newer than this network.mark()
+            idle_ms: Give up early when no matching request has started and
+                the network has been idle this long (e.g. a save blocked by
+                form validation)
+            label: Name recorded with the timing (defaults to the caller)
+        
+        Returns:
+            NetworkRequest with status, duration_ms and server_ms, or None
+        """
+        timeout = timeout or TestConfig.EXPLICIT_WAIT
+        label = label or caller_name()
+        monitor = self.network
+        
+        start = time.perf_counter()
+        start_monotonic = time.monotonic()
+        deadline = start + timeout
+        request = None
+        
+        while time.perf_counter() < deadline:
+            if not monitor.poll():
+                self.wait_for_dom_quiet(timeout=timeout, label=label)
+                return None
+            request = monitor.find(url_pattern, method, since)
+            if request is not None and request.finished:
+                request.consumed = True
+                break
+            if request is None and idle_ms is not None and not monitor.in_flight():
+                quiet_for_ms = (time.monotonic() - max(monitor.last_activity, start_monotonic)) * 1000
+                if quiet_for_ms >= idle_ms:
+                    break
+            time.sleep(NETWORK_POLL_INTERVAL)
+        
+        found = request is not None and request.finished
+        self._record_wait(label, start, None, found)
+        if found:
+            self.log(f"Request finished: {request.describe()}")
+            return request
+        
+        methods = "/".join((method,) if isinstance(method, str) else method or ("any",))
+        self.log_warning(f"No finished {methods} request matching {url_pattern} ({label})")
+        return None
+    
+    def wait_for_save_request(self, since, replaces=None):
+        """Wait for the write request a save button sends to SERVER_URL, then for the UI"""
+        request = self.wait_for_request(
+            re.escape(TestConfig.SERVER_URL),
+            method=WRITE_METHODS,
+            since=since,
+            idle_ms=500
+        )
+        self.wait_for_dom_quiet(replaces=replaces)
+        return request
+    
+    def _record_wait(self, label, start, replaces, settled):
+        """Record the duration of a wait; returns the elapsed seconds"""
+        elapsed = time.perf_counter() - start
+        BasePage.wait_records.append({
+            "label": label,
+            "elapsed": elapsed,
+            "replaces": replaces or 0.0,
+            "settled": settled,
+        })
+        return elapsed
+    
+    @classmethod
+    def wait_summary(cls):
+        """Totals of all DOM-quiescence waits recorded in this process"""
+        return {
+            "waits": len(cls.wait_records),
+            "timeouts": sum(1 for r in cls.wait_records if not r["settled"]),
+            "waited_ms": int(sum(r["elapsed"] for r in cls.wait_records) * 1000),
+            "replaced_ms": int(sum(r["replaces"] for r in cls.wait_records) * 1000),
+        }
+    
+    @timed("driver")
+    def table_snapshot(self, table_locator=None, with_actions=True, settle_timeout=None):
+        """
+        Read a data table in a single execute_script call
+        
+        Args:
+            table_locator: Locator of the table (defaults to the first table)
+            with_actions: Also return row and button elements so rows can be
+                acted on without re-querying
+            settle_timeout: Seconds to wait for the DOM to settle when the
+                table is empty (defaults to EXPLICIT_WAIT, 0 reads it once)
+        
+        Returns:
+            TableSnapshot (empty if the table is not rendered)
+        """
+        result = self._read_table(table_locator, with_actions)
+        if (not result or not result["rows"]) and settle_timeout != 0:
+            # Table may still be loading its data
+            self.wait_for_dom_quiet(timeout=settle_timeout)
+            result = self._read_table(table_locator, with_actions)
+        return TableSnapshot.from_script_result(result)
+    
+    def _read_table(self, table_locator, with_actions):
+        """TABLE_SNAPSHOT_JS result for a table locator, or None if it is not rendered"""
+        if not table_locator:
+            target = "table"
+        elif table_locator[0] == By.CSS_SELECTOR:
+            target = table_locator[1]
+        else:
+            # Other strategies (XPath, id...) are resolved by Selenium first
+            tables = self.driver.find_elements(*table_locator)
+            if not tables:
+                return None
+            target = tables[0]
+        return self.driver.execute_script(TABLE_SNAPSHOT_JS, target, with_actions)
+    
+    @timed("wait")
+    def find_table_row(self, value, column=None, timeout=5, table_locator=None):
+        """Wait until a row containing value shows up; returns the TableRow or None"""
+        try:
+            # The poll loop is the wait; a single read must not block past the timeout
+            return WebDriverWait(
+                self.driver, timeout, poll_frequency=0.1, ignored_exceptions=(StaleElementReferenceException,)
+            ).until(lambda d: self.table_snapshot(table_locator, settle_timeout=0).find(value, column))
+        except TimeoutException:
+            return None
+    
+    @timed("driver")
+    def click_row_action(self, index, action, table_locator=None, snapshot=None):
+        """
+        Click an action button (Edit, Delete, View...) of a table row
+        
+        Uses the element references of the snapshot; the table is only read
+        again if the row was re-rendered in between.
+        
+        Returns:
+            True if the button was found and clicked
+        """
+        for attempt in range(2):
+            snapshot = snapshot or self.table_snapshot(table_locator)
+            row = snapshot.row(index)
+            button = row.action(action) if row else None
+            if button is None:
+                return False
+            try:
+                try:
+                    button.click()
+                except ElementClickInterceptedException:
+                    self.driver.execute_script("arguments[0].click();", button)
+                return True
+            except StaleElementReferenceException:
+                snapshot = None
+        return False
+    
+    @timed("driver")
+    def delete_table_row(self, value, column=None, table_locator=None):
+        """
+        Delete the first table row containing value
+        
+        Confirms a browser confirm() or the app's confirmation dialog if one
+        appears, then waits for the delete request.
+        
+        Returns:
+            True if the row was found and is gone afterwards
+        """
+        snapshot = self.table_snapshot(table_locator)
+        row = snapshot.find(value, column)
+        if row is None:
+            return False
+        
+        with ledger.write():
+            since = self.network.mark()
+            if not self.click_row_action(row.index, "Delete", table_locator, snapshot):
+                return False
+            try:
+                self.driver.switch_to.alert.accept()
+            except NoAlertPresentException:
+                self.wait_for_dom_quiet()
+                self.driver.execute_script(CONFIRM_DIALOG_JS)
+            self.wait_for_save_request(since)
+        
+        deleted = self.table_snapshot(table_locator, with_actions=False).find(value, column) is None
+        if deleted:
+            self.log(f"Deleted table row: {value}")
+        else:
+            self.log_warning(f"Table row still present after delete: {value}")
+        return deleted
+    
+    @timed("driver")
     def get_current_url(self):
         """Get current page URL"""
         return self.driver.current_url
     
+    @timed("driver")
     def refresh_page(self):
         """Refresh current page"""
         self.log("Refreshing page")
         self.driver.refresh()
         self.wait_for_page_load()
     
+    @timed("driver")
     def switch_to_tab(self, tab_index):
         """Switch to browser tab by index"""
         self.driver.switch_to.window(self.driver.window_handles[tab_index])
     
+    @timed("driver")
     def close_current_tab(self):
         """Close current browser tab"""
         self.driver.close()
     
+    @timed("wait")
     def accept_alert(self):
         """Accept browser alert"""
         alert = self.wait.until(EC.alert_is_present())
         alert.accept()
     
+    @timed("wait")
     def dismiss_alert(self):
         """Dismiss browser alert"""
         alert = self.wait.until(EC.alert_is_present())
         alert.dismiss()
     
+    @timed("driver")
     def take_screenshot(self, name):
         """Take screenshot"""
         import os
@@ -224,20 +823,20 @@ class BasePage:
     
     def log(self, message):
         """Log info message"""
-        print(f"{Fore.CYAN}[INFO] {message}{Style.RESET_ALL}")
+        logger.info(message)
     
     def log_success(self, message):
         """Log success message"""
-        print(f"{Fore.GREEN}[SUCCESS] {message}{Style.RESET_ALL}")
+        logger.success(message)
     
     def log_warning(self, message):
         """Log warning message"""
-        print(f"{Fore.YELLOW}[WARNING] {message}{Style.RESET_ALL}")
+        logger.warning(message)
     
     def log_error(self, message):
         """Log error message"""
-        print(f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}")
+        logger.error(message)
     
     def wait(self, seconds):
         """Explicit wait"""
-        time.sleep(seconds)
+        traced_sleep(seconds)
@@ -16,18 +16,114 @@ class TestConfig:
     # Credentials
     ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin")
     
+    # Backend API (test data seeding, hermetic runs)
+    API_URL = os.getenv("API_URL", SERVER_URL.rstrip("/") + "/api")
+    API_TOKEN = os.getenv("API_TOKEN", "")
+    SEED_CONCURRENCY = int(os.getenv("SEED_CONCURRENCY", "8"))
+    HERMETIC_BACKEND = os.getenv("HERMETIC_BACKEND", "True").lower() == "true"
+    
     # Browser Settings
     HEADLESS_MODE = os.getenv("HEADLESS_MODE", "False").lower() == "true"
     IMPLICIT_WAIT = int(os.getenv("IMPLICIT_WAIT", "10"))
     EXPLICIT_WAIT = int(os.getenv("EXPLICIT_WAIT", "20"))
+    QUIET_WINDOW_MS = int(os.getenv("QUIET_WINDOW_MS", "150"))
+    
+    # Driver Pool
+    REUSE_BROWSER = os.getenv("REUSE_BROWSER", "True").lower() == "true"
+    DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+    
+    # Driver Resolution
+    CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH", "")
+    CHROMEDRIVER_VERSION = os.getenv("CHROMEDRIVER_VERSION", "")
+    DRIVER_OFFLINE = os.getenv("DRIVER_OFFLINE", "False").lower() == "true"
+    
+    # Auth State Cache
+    AUTH_CACHE = os.getenv("AUTH_CACHE", "True").lower() == "true"
+    AUTH_CACHE_TTL = int(os.getenv("AUTH_CACHE_TTL", "1800"))
+    
+    # Parallel Execution
+    PARALLEL_WORKERS = os.getenv("PARALLEL_WORKERS", "4")
+    DEFAULT_TEST_DURATION = float(os.getenv("DEFAULT_TEST_DURATION", "10"))
     
     # Test Settings
     SCREENSHOT_ON_FAILURE = os.getenv("SCREENSHOT_ON_FAILURE", "True").lower() == "true"
     SCREENSHOT_DIR = os.path.join(os.path.dirname(__file__), "screenshots")
     REPORTS_DIR = os.path.join(os.path.dirname(__file__), "reports")
+    CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+    DRIVER_CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+    DURATIONS_FILE = os.path.join(CACHE_DIR, "durations.json")
+    BACKEND_SNAPSHOT_DIR = os.path.join(CACHE_DIR, "backend_snapshots")
+    
+    # Streamed Results
+    RESULTS_DIR = os.path.join(REPORTS_DIR, "runs")
+    RESULTS_LONGREPR_CHARS = int(os.getenv("RESULTS_LONGREPR_CHARS", "8000"))
+    REPORT_PAGE_SIZE = int(os.getenv("REPORT_PAGE_SIZE", "100"))
+    
+    # Run History
+    HISTORY_DB = os.getenv("HISTORY_DB", os.path.join(REPORTS_DIR, "history.sqlite"))
+    HISTORY_RUNS = int(os.getenv("HISTORY_RUNS", "20"))
+    
+    # Page-Load Benchmark
+    PERF_ITERATIONS = int(os.getenv("PERF_ITERATIONS", "5"))
+    PERF_READY_TIMEOUT = int(os.getenv("PERF_READY_TIMEOUT", "20"))
+    PERF_DIR = os.path.join(REPORTS_DIR, "perf")
+    PERF_SETTLE_MS = int(os.getenv("PERF_SETTLE_MS", "500"))
+    BACKUP_SCALE_SIZES = [int(n) for n in os.getenv("BACKUP_SCALE_SIZES", "100,1000,10000").split(",") if n.strip()]
+    BLOG_SCALE_SIZES = [int(n) for n in os.getenv("BLOG_SCALE_SIZES", "1000,10000,50000").split(",") if n.strip()]
+    
+    # Performance Regression Gate
+    PERF_BASELINE_FILE = os.getenv("PERF_BASELINE_FILE", os.path.join(os.path.dirname(__file__), "perf_baseline.json"))
+    PERF_GATE_ALPHA = float(os.getenv("PERF_GATE_ALPHA", "0.05"))
+    PERF_GATE_THRESHOLD = float(os.getenv("PERF_GATE_THRESHOLD", "0.10"))
+    PERF_GATE_MIN_SAMPLES = int(os.getenv("PERF_GATE_MIN_SAMPLES", "5"))
+    
+    # Load Mode
+    LOAD_STAGES = [int(n) for n in os.getenv("LOAD_STAGES", "1,2,4,8").split(",") if n.strip()]
+    LOAD_STAGE_SECONDS = int(os.getenv("LOAD_STAGE_SECONDS", "60"))
+    LOAD_MIX = os.getenv("LOAD_MIX", "create_blog=3,create_project=2,save_config=1,view_backup=4")
+    
+    # HTTP Load
+    HTTP_LOAD_MODE = os.getenv("HTTP_LOAD_MODE", "closed")
+    HTTP_LOAD_USERS = int(os.getenv("HTTP_LOAD_USERS", "50"))
+    HTTP_LOAD_RATE = float(os.getenv("HTTP_LOAD_RATE", "20"))
+    HTTP_LOAD_SECONDS = int(os.getenv("HTTP_LOAD_SECONDS", "60"))
+    HTTP_LOAD_CONNECTIONS = int(os.getenv("HTTP_LOAD_CONNECTIONS", "100"))
+    HTTP_LOAD_MAX_INFLIGHT = int(os.getenv("HTTP_LOAD_MAX_INFLIGHT", "1000"))
+    HTTP_LOAD_MIX = os.getenv(
+        "HTTP_LOAD_MIX",
+        "create_blog=3,create_portfolio_project=2,create_gallery_item=2,save_configuration=1,list_backups=4"
+    )
+    
+    # Test Ordering
+    FAILURE_FIRST = os.getenv("FAILURE_FIRST", "True").lower() == "true"
+    FAILURE_FIRST_RUNS = int(os.getenv("FAILURE_FIRST_RUNS", "5"))
+    FAIL_FAST_MARKERS = [m.strip() for m in os.getenv("FAIL_FAST_MARKERS", "smoke,critical").split(",") if m.strip()]
+    
+    # Failure Artifacts
+    ARTIFACTS_DIR = os.path.join(REPORTS_DIR, "artifacts")
+    ARTIFACT_BUDGET_MB = int(os.getenv("ARTIFACT_BUDGET_MB", "200"))
+    SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "60"))
+    CAPTURE_DOM = os.getenv("CAPTURE_DOM", "True").lower() == "true"
+    CAPTURE_CONSOLE = os.getenv("CAPTURE_CONSOLE", "True").lower() == "true"
+    
+    # Logging
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_BUFFER_SIZE = int(os.getenv("LOG_BUFFER_SIZE", "500"))
+    LOG_COLOR = os.getenv("LOG_COLOR", "True").lower() == "true"
+    LOG_JSONL = os.getenv("LOG_JSONL", "True").lower() == "true"
+    LOG_DIR = os.path.join(REPORTS_DIR, "logs")
+    
+    # Timing Spans
+    TIMING_SPANS = os.getenv("TIMING_SPANS", "False").lower() == "true"
+    TIMELINE_DIR = os.path.join(REPORTS_DIR, "timelines")
     
     # Test Data
     TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "test_data")
+    TEST_RUN_ID = os.getenv("TEST_RUN_ID", "")
+    
+    # Traffic Recording
+    RECORD_TRAFFIC = os.getenv("RECORD_TRAFFIC", "False").lower() == "true"
+    TRAFFIC_ARCHIVE = os.getenv("TRAFFIC_ARCHIVE", os.path.join(TEST_DATA_DIR, "traffic.json.gz"))
     
     @classmethod
     def ensure_dirs(cls):
@@ -35,3 +131,4 @@ class TestConfig:
         os.makedirs(cls.SCREENSHOT_DIR, exist_ok=True)
         os.makedirs(cls.REPORTS_DIR, exist_ok=True)
         os.makedirs(cls.TEST_DATA_DIR, exist_ok=True)
+        os.makedirs(cls.CACHE_DIR, exist_ok=True)
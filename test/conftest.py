@@ -2,20 +2,58 @@
 Pytest configuration and fixtures for Selenium tests
 """
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from datetime import datetime
 import os
+import time
+import requests
 from config import TestConfig
-from colorama import init, Fore, Style
+from driver_pool import DriverPool, chrome_options
+from auth_cache import AuthStateCache
+from base_page import BasePage
+from api_client import AdminApiClient
+from data_factory import DataFactory
+from backend_snapshot import SessionSnapshot, ledger, sweep
+from scheduler import DurationRecorder, FailFast, LptScheduling, base_nodeid, priority_order
+from timing import tracer, SpanTracer
+from log_backend import backend as log_backend, get_logger
+from artifacts import writer as artifact_writer, ArtifactWriter
+from results_sink import ResultsSink
+from history import HistoryDB
+from page_load import recorder as page_load_recorder, PageLoadRecorder
+from traffic import recorder as traffic_recorder, TrafficArchive
+from colorama import init
 
 # Initialize colorama for colored terminal output
 init(autoreset=True)
 
 TestConfig.ensure_dirs()
 
+# Per-worker counters, shipped to the xdist controller at session end
+run_stats_key = pytest.StashKey[dict]()
+
+# LPT scheduler of the xdist controller, with the expected per-worker loads
+scheduler_key = pytest.StashKey[LptScheduling]()
+
+# Backend state captured by the controller before the first test
+session_snapshot_key = pytest.StashKey[SessionSnapshot]()
+
+# Recent failures and the previous run's start, read by the controller
+failure_first_key = pytest.StashKey[dict]()
+
+# How many tests failure-first ordering moved up, reported by the workers
+priority_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    """Command line options of the suite"""
+    parser.addoption(
+        "--fail-fast", action="store_true", default=False,
+        help=f"Stop every worker after the first failure of a {'/'.join(TestConfig.FAIL_FAST_MARKERS)} test"
+    )
+    parser.addoption(
+        "--record-traffic", action="store_true", default=False,
+        help="Record the admin API traffic of passing tests for the replay suite"
+    )
+
 def pytest_configure(config):
     """Configure pytest with custom markers"""
     config.addinivalue_line("markers", "login: Login page tests")
@@ -28,81 +66,493 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "smoke: Smoke tests")
     config.addinivalue_line("markers", "regression: Regression tests")
     config.addinivalue_line("markers", "critical: Critical path tests")
+    config.addinivalue_line("markers", "perf: Page-load benchmarks (python run_tests.py perf)")
+    config.addinivalue_line("markers", "replay: API-only replay of recorded traffic (python run_tests.py replay)")
+    config.addinivalue_line("markers", "unit: Pure-Python tests of the suite's own helpers, no browser or backend")
+    config.stash[run_stats_key] = {}
+    
+    if config.getoption("record_traffic"):
+        traffic_recorder.enabled = True
+    
+    if TestConfig.LOG_JSONL and not config.option.collectonly:
+        log_backend.open_sink()
+    
+    if not hasattr(config, "workerinput"):
+        # One run id for the controller and every worker: namespaces and the backend snapshot
+        TestConfig.TEST_RUN_ID = DataFactory.default_run_id()
+        config.pluginmanager.register(DurationRecorder(), "duration_recorder")
+        if not config.option.collectonly:
+            history = HistoryDB()
+            if TestConfig.FAILURE_FIRST:
+                # Runs that never finished were not imported by their own session
+                history.import_all()
+                config.stash[failure_first_key] = {
+                    "failures": history.recent_failures(TestConfig.FAILURE_FIRST_RUNS),
+                    "since": history.last_started(),
+                }
+            config.pluginmanager.register(ResultsSink(history=history, suffix=TestConfig.TEST_RUN_ID), "results_sink")
+        if config.getoption("fail_fast"):
+            fail_fast = FailFast(
+                os.path.join(TestConfig.CACHE_DIR, f"fail_fast_{os.getpid()}.flag"), TestConfig.FAIL_FAST_MARKERS
+            )
+            fail_fast.clear()
+            config.pluginmanager.register(fail_fast, "fail_fast")
+    else:
+        TestConfig.TEST_RUN_ID = config.workerinput.get("run_id", TestConfig.TEST_RUN_ID)
+        if "failure_first" in config.workerinput:
+            config.stash[failure_first_key] = config.workerinput["failure_first"]
+        if "fail_fast_flag" in config.workerinput:
+            config.pluginmanager.register(
+                FailFast(config.workerinput["fail_fast_flag"], TestConfig.FAIL_FAST_MARKERS), "fail_fast"
+            )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the run id, the failure-first input and the fail-fast flag to a starting worker"""
+    config = node.config
+    node.workerinput["run_id"] = TestConfig.TEST_RUN_ID
+    if failure_first_key in config.stash:
+        node.workerinput["failure_first"] = config.stash[failure_first_key]
+    fail_fast = config.pluginmanager.get_plugin("fail_fast")
+    if fail_fast is not None:
+        node.workerinput["fail_fast_flag"] = fail_fast.path
+
+
+def edited_files(config, nodeids):
+    """Test files (node id prefixes) changed since the previous run started"""
+    since = config.stash[failure_first_key]["since"]
+    if since is None:
+        return set()
+    files = {nodeid.split("::")[0] for nodeid in nodeids}
+    return {name for name in files if (config.rootpath / name).stat().st_mtime > since}
+
+
+def moved_up(config, nodeids):
+    """Node ids failure-first ordering puts in front: recent failures and tests of edited files"""
+    failure_first = config.stash.get(failure_first_key, None)
+    if not failure_first:
+        return set()
+    edited = edited_files(config, nodeids)
+    return {
+        nodeid for nodeid in nodeids
+        if base_nodeid(nodeid) in failure_first["failures"] or nodeid.split("::")[0] in edited
+    }
+
+
+def order_failure_first(config, items):
+    """Move recent failures and tests of recently edited files to the front"""
+    failure_first = config.stash.get(failure_first_key, None)
+    if not failure_first:
+        return set()
+    by_nodeid = {base_nodeid(item.nodeid): item for item in items}
+    edited = edited_files(config, by_nodeid)
+    ordered = priority_order(list(by_nodeid), failure_first["failures"], edited)
+    items[:] = [by_nodeid[nodeid] for nodeid in ordered]
+    
+    failed = {nodeid for nodeid in by_nodeid if nodeid in failure_first["failures"]}
+    moved = failed | {nodeid for nodeid in by_nodeid if nodeid.split("::")[0] in edited}
+    config.stash[priority_key] = {"failures": len(failed), "edited": len(moved) - len(failed)}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Run recent failures first, once deselection has run"""
+    yield
+    
+    order_failure_first(config, items)
+    if hasattr(config, "workeroutput") and priority_key in config.stash:
+        config.workeroutput["priority"] = config.stash[priority_key]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Assign tests to xdist workers longest-first under --dist loadgroup"""
+    if config.getvalue("dist") != "loadgroup":
+        return None
+    scheduler = LptScheduling(config, log, first=lambda nodeids: moved_up(config, nodeids))
+    config.stash[scheduler_key] = scheduler
+    return scheduler
+
+
+def pytest_sessionstart(session):
+    """Capture the site config once per run, before any worker starts; workers record their writes"""
+    config = session.config
+    if not TestConfig.HERMETIC_BACKEND or config.option.collectonly:
+        return
+    if hasattr(config, "workerinput"):
+        ledger.record(AdminApiClient(), SessionSnapshot.ledger_file(TestConfig.TEST_RUN_ID))
+        return
+    snapshot = SessionSnapshot(AdminApiClient(), TestConfig.TEST_RUN_ID)
+    snapshot.start()
+    config.stash[session_snapshot_key] = snapshot
+
+
+def record_run_stats(config, section, stats):
+    """Add counters to the run-wide statistics for the end-of-run summary"""
+    totals = config.stash[run_stats_key].setdefault(section, {})
+    for key, value in stats.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def pytest_sessionfinish(session):
+    """Hand this worker's statistics to the xdist controller"""
+    wait_summary = BasePage.wait_summary()
+    if wait_summary["waits"]:
+        record_run_stats(session.config, "waits", wait_summary)
+    if tracer.enabled:
+        record_run_stats(session.config, "timing", tracer.breakdown_ms())
+    artifact_stats = artifact_writer.close()
+    if artifact_stats["captured"]:
+        record_run_stats(session.config, "artifacts", artifact_stats)
+    
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["run_stats"] = session.config.stash[run_stats_key]
+        session.config.workeroutput["page_loads"] = page_load_recorder.samples
+        session.config.workeroutput["traffic"] = traffic_recorder.tests
+    
+    snapshot = session.config.stash.get(session_snapshot_key, None)
+    if snapshot is not None:
+        snapshot.finish()
+        snapshot.api.close()
+    elif ledger.recording:
+        ledger.api.close()
+        ledger.stop()
+
+
+def pytest_unconfigure(config):
+    """Write out the JSONL log and remove the fail-fast flag"""
+    log_backend.close_sink()
+    fail_fast = config.pluginmanager.get_plugin("fail_fast")
+    if fail_fast is not None and not hasattr(config, "workerinput"):
+        fail_fast.clear()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge statistics reported by a finished xdist worker"""
+    workeroutput = getattr(node, "workeroutput", {})
+    for section, stats in workeroutput.get("run_stats", {}).items():
+        record_run_stats(node.config, section, stats)
+    if "priority" in workeroutput:
+        node.config.stash[priority_key] = workeroutput["priority"]
+    page_load_recorder.samples.extend(workeroutput.get("page_loads", []))
+    traffic_recorder.tests.update(workeroutput.get("traffic", {}))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print run-wide statistics collected by the fixtures"""
+    auth_stats = config.stash[run_stats_key].get("auth_cache")
+    if auth_stats:
+        terminalreporter.write_line(f"[AUTH] {AuthStateCache.format_stats(auth_stats)}", cyan=True)
+    
+    wait_stats = config.stash[run_stats_key].get("waits")
+    if wait_stats:
+        saved_s = (wait_stats["replaced_ms"] - wait_stats["waited_ms"]) / 1000
+        terminalreporter.write_line(
+            f"[WAIT] {wait_stats['waits']} DOM-quiescence waits took {wait_stats['waited_ms'] / 1000:.1f}s "
+            f"instead of {wait_stats['replaced_ms'] / 1000:.1f}s of fixed sleeps "
+            f"({saved_s:.1f}s saved, {wait_stats['timeouts']} timed out)",
+            cyan=True
+        )
+    
+    artifact_stats = config.stash[run_stats_key].get("artifacts")
+    if artifact_stats:
+        terminalreporter.write_line(
+            f"[ARTIFACT] {ArtifactWriter.format_stats(artifact_stats)} ({TestConfig.ARTIFACTS_DIR})", cyan=True
+        )
+    
+    timing_stats = config.stash[run_stats_key].get("timing")
+    if timing_stats:
+        terminalreporter.write_line(f"[TIMING] {SpanTracer.format_breakdown(timing_stats)}", cyan=True)
+        terminalreporter.write_line(f"[TIMING] Per-test timelines in {tracer.timeline_dir}", cyan=True)
+    
+    priority = config.stash.get(priority_key, None)
+    if priority and (priority["failures"] or priority["edited"]):
+        terminalreporter.write_line(
+            f"[ORDER] Ran first: {priority['failures']} recent failures, "
+            f"{priority['edited']} tests of edited files",
+            cyan=True
+        )
+    
+    fail_fast = config.pluginmanager.get_plugin("fail_fast")
+    if fail_fast is not None and fail_fast.reason():
+        terminalreporter.write_line(f"[FAIL-FAST] Stopped after {fail_fast.reason()} failed", red=True)
+    
+    if page_load_recorder.samples:
+        terminalreporter.section("page load (ms since navigation start)")
+        for line in PageLoadRecorder.format_summary(page_load_recorder.summary()):
+            terminalreporter.write_line(line)
+        scaling = page_load_recorder.scaling()
+        if scaling:
+            terminalreporter.section("latency growth with data set size")
+            for line in PageLoadRecorder.format_scaling(scaling):
+                terminalreporter.write_line(line)
+        terminalreporter.write_line(f"[PERF] Samples saved to {page_load_recorder.save()}", cyan=True)
+    
+    if traffic_recorder.tests:
+        archive = TrafficArchive().load()
+        archive.merge(traffic_recorder.tests)
+        requests_recorded = sum(len(test["entries"]) for test in traffic_recorder.tests.values())
+        terminalreporter.write_line(
+            f"[TRAFFIC] Recorded {requests_recorded} requests of {len(traffic_recorder.tests)} tests "
+            f"to {archive.save()} ({len(archive.tests)} tests in total)",
+            cyan=True
+        )
+    
+    snapshot = config.stash.get(session_snapshot_key, None)
+    if snapshot is not None and snapshot.stats:
+        terminalreporter.write_line(f"[SNAPSHOT] {SessionSnapshot.format_stats(snapshot.stats)}", cyan=True)
+    
+    recorder = config.pluginmanager.get_plugin("duration_recorder")
+    if recorder and recorder.busy:
+        makespan = recorder.makespan()
+        scheduler = config.stash.get(scheduler_key, None)
+        if scheduler is not None and scheduler.loads:
+            terminalreporter.write_line(
+                f"[SCHED] LPT over {len(scheduler.loads)} workers: expected makespan "
+                f"{max(scheduler.loads):.1f}s, actual {makespan:.1f}s",
+                cyan=True
+            )
+        else:
+            terminalreporter.write_line(f"[SCHED] Makespan {makespan:.1f}s (not scheduled by duration)", cyan=True)
+        idle = recorder.idle()
+        terminalreporter.write_line(
+            "[SCHED] " + ", ".join(
+                f"{worker}: busy {recorder.busy[worker]:.1f}s, idle {idle[worker]:.1f}s" for worker in idle
+            ),
+            cyan=True
+        )
 
 
 @pytest.fixture(scope="session")
 def browser_options():
     """Configure Chrome browser options"""
-    chrome_options = Options()
-    
-    if TestConfig.HEADLESS_MODE:
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
+    return chrome_options()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(browser_options):
+    """Pool of browser sessions shared by all tests of this worker"""
+    pool = DriverPool(browser_options)
     
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option("useAutomationExtension", False)
+    yield pool
     
-    return chrome_options
+    get_logger("TEARDOWN").info("Shutting down WebDriver pool...")
+    pool.close()
 
 
 @pytest.fixture(scope="function")
-def driver(browser_options):
-    """Create and configure WebDriver instance for each test"""
-    print(f"\n{Fore.CYAN}[SETUP] Initializing Chrome WebDriver...{Style.RESET_ALL}")
+def driver(driver_pool):
+    """Lease a clean WebDriver session from the pool for each test"""
+    start = time.perf_counter()
+    driver = driver_pool.acquire()
+    elapsed_ms = (time.perf_counter() - start) * 1000
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=browser_options)
-    driver.implicitly_wait(TestConfig.IMPLICIT_WAIT)
-    driver.maximize_window()
-    
-    print(f"{Fore.GREEN}[SETUP] WebDriver initialized successfully{Style.RESET_ALL}")
+    get_logger("SETUP").success(f"WebDriver session leased in {elapsed_ms:.0f}ms")
     
     yield driver
     
-    print(f"\n{Fore.CYAN}[TEARDOWN] Closing WebDriver...{Style.RESET_ALL}")
-    driver.quit()
-    print(f"{Fore.GREEN}[TEARDOWN] WebDriver closed successfully{Style.RESET_ALL}")
+    start = time.perf_counter()
+    driver_pool.release(driver)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    get_logger("TEARDOWN").success(f"WebDriver session returned to pool in {elapsed_ms:.0f}ms")
+
+
+@pytest.fixture(scope="session")
+def auth_cache(request):
+    """Login state captured once per worker and replayed into later sessions"""
+    cache = AuthStateCache()
+    
+    yield cache
+    
+    cache.report()
+    record_run_stats(request.config, "auth_cache", cache.stats)
 
 
 @pytest.fixture(scope="function")
-def authenticated_driver(driver):
+def authenticated_driver(driver, auth_cache):
     """Provide an authenticated driver (logged in)"""
-    from pages.login_page import LoginPage
-    
-    print(f"\n{Fore.CYAN}[AUTH] Logging into admin panel...{Style.RESET_ALL}")
-    login_page = LoginPage(driver)
-    login_page.navigate()
-    login_page.login(TestConfig.ADMIN_PASSWORD)
+    logger = get_logger("AUTH")
+    logger.info("Logging into admin panel...")
     
-    print(f"{Fore.GREEN}[AUTH] Successfully logged in{Style.RESET_ALL}")
+    if auth_cache.authenticate(driver):
+        logger.success("Session restored from auth cache")
+    else:
+        logger.success("Successfully logged in")
     
     return driver
 
 
+@pytest.fixture(scope="session")
+def api_client():
+    """Pooled HTTP session to the admin backend for seeding test data"""
+    client = AdminApiClient()
+    if traffic_recorder.enabled:
+        # Seeding and cleanup are part of what a replay has to repeat
+        client.session.hooks["response"].append(traffic_recorder.record_response)
+    
+    yield client
+    
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def data_factory(api_client):
+    """Run- and worker-namespaced test data for this worker"""
+    return DataFactory(api=api_client)
+
+
+@pytest.fixture(scope="function")
+def test_data(request, data_factory):
+    """Namespaced test data; entities the test created are deleted afterwards through the API"""
+    # Only a test that has a browser anyway lends it as fallback for the cleanup
+    driver = None
+    if "authenticated_driver" in request.fixturenames:
+        driver = request.getfixturevalue("authenticated_driver")
+    yield data_factory
+    
+    data_factory.cleanup(driver)
+
+
+@pytest.fixture(scope="class")
+def backend_checkpoint(api_client, data_factory):
+    """
+    Remove what the class left on the backend once the class is done
+    
+    The worker's namespace is swept and the backups the class's own writes
+    caused are deleted, so other workers and other runs sharing the backend
+    keep their data and their backups.
+    """
+    started = not ledger.recording
+    if started:
+        ledger.record(api_client)
+    mark = ledger.mark()
+    
+    yield
+    
+    backups = ledger.since(mark)
+    if started:
+        ledger.stop()
+    start = time.perf_counter()
+    try:
+        stats = {
+            "deleted": sweep(api_client, data_factory.namespace),
+            "backups_deleted": api_client.delete_many("backup", backups),
+        }
+    except requests.RequestException as e:
+        get_logger("SNAPSHOT").warning(f"Checkpoint restore failed: {e.__class__.__name__}")
+        return
+    stats["seconds"] = time.perf_counter() - start
+    if stats["deleted"] or stats["backups_deleted"]:
+        get_logger("SNAPSHOT").info(SessionSnapshot.format_stats(stats))
+
+
+@pytest.fixture(scope="function")
+def seeded_blog(test_data):
+    """A blog created through the API; deleted after the test"""
+    return test_data.seed("blog")[0]
+
+
+@pytest.fixture(scope="function")
+def seeded_project(test_data):
+    """A portfolio project created through the API; deleted after the test"""
+    return test_data.seed("project")[0]
+
+
+@pytest.fixture(scope="function")
+def seeded_gallery_item(test_data):
+    """A gallery item created through the API; deleted after the test"""
+    return test_data.seed("gallery")[0]
+
+
+@pytest.fixture(scope="function")
+def seeded_backups(test_data):
+    """Three separate content writes, each of which leaves a backup behind"""
+    return [test_data.seed("blog")[0] for _ in range(3)]
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Buffer log records under this test until it has been reported"""
+    log_backend.begin_test(base_nodeid(nodeid))
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    """Drop the buffer of a finished test"""
+    log_backend.end_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    """Start the test's timeline; fixture setup is one span"""
+    if traffic_recorder.enabled:
+        traffic_recorder.begin_test(base_nodeid(item.nodeid))
+    if not tracer.enabled:
+        yield
+        return
+    tracer.begin_test(base_nodeid(item.nodeid))
+    with tracer.span("setup", "setup"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Test body span; primitives called by the test are nested in it"""
+    with tracer.span("test", item.name):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Fixture teardown span, then write the test's timeline and traffic recording"""
+    factory = item.funcargs.get("data_factory")
+    if not tracer.enabled:
+        yield
+    else:
+        with tracer.span("teardown", "teardown"):
+            yield
+        tracer.end_test()
+    if traffic_recorder.enabled:
+        traffic_recorder.end_test(factory.namespace if factory else None)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Hook to capture test results and take screenshots on failure"""
+    """Hook to capture test results and failure artifacts"""
     outcome = yield
     report = outcome.get_result()
     
+    if report.failed and traffic_recorder.enabled:
+        traffic_recorder.failed = True
+    
     if report.when == "call":
         if report.failed and TestConfig.SCREENSHOT_ON_FAILURE:
             driver = item.funcargs.get("driver") or item.funcargs.get("authenticated_driver")
             if driver:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                screenshot_name = f"{item.name}_{timestamp}.png"
-                screenshot_path = os.path.join(TestConfig.SCREENSHOT_DIR, screenshot_name)
+                # Browser calls and in-memory compression only; the files are
+                # written by the artifact writer thread
+                paths = artifact_writer.capture(driver, item.nodeid)
+                if paths:
+                    get_logger("FAILURE").error(f"Artifacts: {', '.join(paths.values())}")
+                    # Picked up by the results sink, relative to reports/
+                    report.user_properties.append(("artifacts", {
+                        kind: os.path.relpath(path, TestConfig.REPORTS_DIR) for kind, path in paths.items()
+                    }))
                 
-                driver.save_screenshot(screenshot_path)
-                print(f"\n{Fore.RED}[FAILURE] Screenshot saved: {screenshot_path}{Style.RESET_ALL}")
-                
-                # Add screenshot to HTML report
-                if hasattr(report, "extra"):
-                    report.extra.append(pytest.html.extras.image(screenshot_path))
+                # Link the artifacts from the HTML report instead of embedding them
+                pytest_html = item.config.pluginmanager.getplugin("html")
+                if pytest_html and paths:
+                    report.extras = getattr(report, "extras", []) + [
+                        pytest_html.extras.url(os.path.relpath(path, TestConfig.REPORTS_DIR), name=kind)
+                        for kind, path in paths.items()
+                    ]
+    
+    # Step spans for the run history, carried to the controller by xdist
+    if report.when == "teardown" and tracer.enabled and tracer.spans:
+        report.user_properties.append(("spans", tracer.timeline_spans()))
+    
+    if report.failed and log_backend.buffer:
+        report.sections.append((f"Buffered log ({report.when})", log_backend.buffered_text()))
 
 
 def pytest_html_report_title(report):
@@ -113,13 +563,9 @@ def pytest_html_report_title(report):
 @pytest.fixture(scope="function", autouse=True)
 def test_logger(request):
     """Log test execution details"""
-    test_name = request.node.name
-    print(f"\n{'='*80}")
-    print(f"{Fore.YELLOW}[TEST START] {test_name}{Style.RESET_ALL}")
-    print(f"{'='*80}")
+    logger = get_logger("TEST")
+    logger.debug(f"Started {request.node.name}")
     
     yield
     
-    print(f"\n{'='*80}")
-    print(f"{Fore.YELLOW}[TEST END] {test_name}{Style.RESET_ALL}")
-    print(f"{'='*80}\n")
+    logger.debug(f"Finished {request.node.name}")
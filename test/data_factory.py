@@ -0,0 +1,278 @@
+"""
+Run- and worker-namespaced test data with teardown cleanup
+"""
+import hashlib
+import itertools
+import os
+import re
+import uuid
+import requests
+from selenium.common.exceptions import WebDriverException
+from config import TestConfig
+from pages.blogs_page import BlogsPage
+from pages.portfolio_page import PortfolioPage
+from pages.gallery_page import GalleryPage
+from log_backend import get_logger
+
+
+logger = get_logger("DATA")
+
+
+# Data seeded through the API when a test does not pass its own template
+SEED_TEMPLATES = {
+    "blog": {
+        "title": "Seeded Blog",
+        "slug": "seeded-blog",
+        "excerpt": "Blog seeded through the admin API",
+        "date": "2025-01-01",
+        "category": "Testing",
+        "author": "Test Automation",
+        "readTime": "3",
+        "tags": ["seeded"],
+        "image": "/images/test-blog.jpg",
+        "content": "Seeded content"
+    },
+    "project": {
+        "title": "Seeded Project",
+        "description": "Project seeded through the admin API",
+        "image": "/images/test-project.jpg",
+        "link": "https://seeded-project.example.com",
+        "github": "https://github.com/test/seeded-project",
+        "techStack": ["Python", "Selenium"],
+        "category": "Testing",
+        "featured": False
+    },
+    "gallery": {
+        "id": "seeded-image",
+        "src": "/images/gallery/test-image.jpg",
+        "alt": "Image seeded through the admin API",
+        "title": "Seeded Image",
+        "category": "Testing"
+    },
+}
+
+
+class SeededEntity:
+    """Handle to an entity created through the API"""
+    
+    def __init__(self, kind, entity_id, tag, data):
+        self.kind = kind
+        self.id = entity_id
+        self.tag = tag
+        self.data = data
+    
+    @property
+    def title(self):
+        """Title (or id) as shown in the admin table"""
+        return self.data.get("title") or self.data.get("id")
+    
+    @property
+    def lookup(self):
+        """Value that finds this entity's row with BasePage.find_table_row"""
+        return self.tag
+    
+    def __repr__(self):
+        return f"SeededEntity({self.kind}, {self.id!r})"
+
+
+class DataFactory:
+    """
+    Make test data unique to this run, this worker and this entity.
+    
+    Every generated entity carries a tag like "3f9a1c-gw1-0007" in its title
+    and in its slug/id, so parallel workers and concurrent CI jobs that share
+    one admin backend never create the same record. The tag also finds the
+    entity again at cleanup time.
+    """
+    
+    # Fields that get the tag, per entity kind: "text" fields as " [tag]",
+    # "key" fields (slugs, ids) as "-tag"
+    NAMESPACED_FIELDS = {
+        "blog": {"title": "text", "slug": "key"},
+        "project": {"title": "text"},
+        "gallery": {"id": "key", "title": "text"},
+    }
+    
+    # Page objects whose tables list each entity kind
+    PAGES = {"blog": BlogsPage, "project": PortfolioPage, "gallery": GalleryPage}
+    
+    def __init__(self, run_id=None, worker_id=None, api=None):
+        self.run_id = run_id or self.default_run_id()
+        self.worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.namespace = f"{self.run_id}-{self.worker_id}"
+        self.api = api
+        self.created = []
+        self._counter = itertools.count(1)
+    
+    @staticmethod
+    def default_run_id():
+        """
+        Six hex digits from TEST_RUN_ID, else the id xdist shares with all workers of a run
+        
+        Any other TEST_RUN_ID is hashed, not cut short, so CI job ids that
+        differ only at the end get different namespaces; a fixed width also
+        keeps one run id from being a prefix of another.
+        """
+        run_id = TestConfig.TEST_RUN_ID
+        if run_id and not re.fullmatch(r"[0-9a-f]{6}", run_id):
+            return hashlib.sha1(run_id.encode("utf-8")).hexdigest()[:6]
+        return (run_id or os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex)[:6].lower()
+    
+    def tag(self):
+        """A new tag, unique across runs, workers and entities"""
+        # Fixed width, so no tag is a prefix of another one
+        return f"{self.namespace}-{next(self._counter):04d}"
+    
+    def text(self, label, tag=None):
+        """Human readable value with the tag appended, e.g. a title"""
+        return f"{label} [{tag or self.tag()}]"
+    
+    def key(self, value, tag=None):
+        """Identifier with the tag appended, e.g. a slug or id"""
+        return f"{value}-{tag or self.tag()}"
+    
+    def make(self, kind, template, **overrides):
+        """
+        Copy a data template with its identifying fields namespaced
+        
+        Empty fields stay empty so validation tests keep their meaning. The
+        entity is registered for cleanup; templates stay untouched so
+        module-level test data can be reused by every test.
+        
+        Args:
+            kind: "blog", "project" or "gallery"
+            template: Test data dict
+            overrides: Fields to set before namespacing
+        
+        Returns:
+            New data dict
+        """
+        tag = self.tag()
+        data = self._namespaced(kind, template, tag, overrides)
+        self.register(kind, tag)
+        return data
+    
+    def seed(self, kind, template=None, count=1, register=True, **overrides):
+        """
+        Create entities directly through the admin API, bypassing the UI
+        
+        Args:
+            kind: "blog", "project" or "gallery"
+            template: Test data dict (defaults to SEED_TEMPLATES[kind])
+            count: Number of entities, created concurrently
+            register: Register the entities for cleanup; off when something
+                else removes them, e.g. the backend_checkpoint fixture
+            overrides: Fields to set before namespacing
+        
+        Returns:
+            List of SeededEntity handles
+        """
+        if self.api is None:
+            raise RuntimeError("DataFactory has no API client to seed with")
+        template = template or SEED_TEMPLATES[kind]
+        tags = [self.tag() for _ in range(count)]
+        items = [self._namespaced(kind, template, tag, overrides) for tag in tags]
+        
+        ids = self.api.create_many(kind, items)
+        entities = []
+        for tag, data, entity_id in zip(tags, items, ids):
+            if register:
+                self.register(kind, tag, entity_id)
+            entities.append(SeededEntity(kind, entity_id, tag, data))
+        return entities
+    
+    def _namespaced(self, kind, template, tag, overrides):
+        """Copy of a template with the tag added to its identifying fields"""
+        data = dict(template, **overrides)
+        for field, style in self.NAMESPACED_FIELDS[kind].items():
+            if data.get(field):
+                data[field] = self.text(data[field], tag) if style == "text" else self.key(data[field], tag)
+        return data
+    
+    def blog(self, template, **overrides):
+        """Namespaced blog data"""
+        return self.make("blog", template, **overrides)
+    
+    def project(self, template, **overrides):
+        """Namespaced portfolio project data"""
+        return self.make("project", template, **overrides)
+    
+    def gallery_item(self, template, **overrides):
+        """Namespaced gallery item data"""
+        return self.make("gallery", template, **overrides)
+    
+    def register(self, kind, tag, entity_id=None):
+        """Remember an entity so cleanup() removes it"""
+        self.created.append((kind, tag, entity_id))
+    
+    def find_tagged(self, kind, tags):
+        """Ids of the entities whose namespaced fields carry one of the tags, via the API"""
+        wanted = set(tags)
+        found = {}
+        for entity in self.api.fetch_all(kind):
+            if not isinstance(entity, dict):
+                continue
+            values = [str(entity.get(field) or "") for field in self.NAMESPACED_FIELDS[kind]]
+            for tag in wanted:
+                if any(tag in value for value in values):
+                    found.setdefault(tag, []).append(self.api.entity_id(kind, entity))
+        return found
+    
+    def cleanup(self, driver=None):
+        """
+        Delete every registered entity that still exists
+        
+        Seeded entities are deleted through the API by id. Entities created
+        through the UI are looked up by their tag through the API as well;
+        only without an API, or if the lookup fails, are they located in the
+        admin tables, which needs a driver. Failures are logged but never
+        fail the test that is being torn down.
+        
+        Returns:
+            Number of deleted entities
+        """
+        created, self.created = self.created, []
+        deleted = 0
+        for kind, page_class in self.PAGES.items():
+            entity_ids = [entity_id for entity_kind, _, entity_id in created
+                          if entity_kind == kind and entity_id is not None]
+            tags = [tag for entity_kind, tag, entity_id in created
+                    if entity_kind == kind and entity_id is None]
+            if tags and self.api is not None:
+                try:
+                    found = self.find_tagged(kind, tags)
+                except requests.RequestException as e:
+                    self.log_warning(f"API lookup of {kind} entities failed: {e.__class__.__name__}")
+                else:
+                    # Entities the test never managed to create are simply not found
+                    entity_ids += [entity_id for tag in tags for entity_id in found.get(tag, [])]
+                    tags = []
+            
+            if entity_ids:
+                try:
+                    deleted += self.api.delete_many(kind, entity_ids)
+                except requests.RequestException as e:
+                    self.log_warning(f"API cleanup of {kind} entities failed: {e.__class__.__name__}")
+            
+            if not tags or driver is None:
+                continue
+            page = page_class(driver)
+            try:
+                page.navigate()
+                for tag in tags:
+                    if page.delete_table_row(tag):
+                        deleted += 1
+            except WebDriverException as e:
+                self.log_warning(f"Cleanup of {kind} entities failed: {e.__class__.__name__}")
+        
+        if deleted:
+            self.log(f"Cleaned up {deleted} of {len(created)} test entities")
+        return deleted
+    
+    def log(self, message):
+        """Log info message"""
+        logger.info(message)
+    
+    def log_warning(self, message):
+        """Log warning message"""
+        logger.warning(message)
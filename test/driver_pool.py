@@ -0,0 +1,248 @@
+"""
+Reusable pool of Chrome WebDriver sessions leased to tests
+"""
+import threading
+import time
+from urllib.parse import urlparse
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoAlertPresentException,
+    WebDriverException
+)
+from config import TestConfig
+from driver_resolver import DriverResolver
+from base_page import QUIESCENCE_TRACKER_JS
+from network_monitor import NetworkMonitor
+from traffic import recorder as traffic_recorder
+from log_backend import get_logger
+
+
+logger = get_logger("POOL")
+
+
+def chrome_options(headless=None):
+    """
+    Chrome options shared by the test sessions and the load driver
+    
+    Args:
+        headless: Run without a window (defaults to HEADLESS_MODE)
+    """
+    options = Options()
+    
+    if TestConfig.HEADLESS_MODE if headless is None else headless:
+        options.add_argument("--headless")
+        options.add_argument("--disable-gpu")
+    
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    
+    # CDP Network events for BasePage.wait_for_request / wait_for_network_idle
+    # Browser console messages for failure artifacts
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL", "browser": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    
+    return options
+
+
+class DriverPool:
+    """
+    Pool of browser sessions scoped to one pytest worker.
+    
+    Sessions are leased with acquire() and handed back with release().
+    Between leases the session is reset (cookies, storage, extra tabs,
+    open dialogs, URL) instead of restarting Chrome. Sessions that fail
+    the health check are quit and replaced transparently. All sessions of
+    the pool talk to a single shared chromedriver process.
+    """
+    
+    BLANK_URL = "about:blank"
+    
+    def __init__(self, options, max_size=None, reuse=None):
+        self.options = options
+        self.max_size = max_size or TestConfig.DRIVER_POOL_SIZE
+        self.reuse = TestConfig.REUSE_BROWSER if reuse is None else reuse
+        self.stats = {"created": 0, "reused": 0, "replaced": 0, "leases": 0}
+        self._idle = []
+        self._sessions = set()
+        self._reserved = 0
+        self._service = None
+        self._cond = threading.Condition()
+    
+    def acquire(self, timeout=None):
+        """Lease a healthy session, starting a new browser only when needed"""
+        timeout = timeout or TestConfig.EXPLICIT_WAIT
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            driver = None
+            with self._cond:
+                while not self._idle and self._size() >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutException(f"No WebDriver session free after {timeout}s")
+                    self._cond.wait(remaining)
+                
+                if self._idle:
+                    driver = self._idle.pop()
+                else:
+                    self._reserved += 1
+            
+            if driver is None:
+                return self._create()
+            
+            if self.is_healthy(driver):
+                self._count("reused")
+                return driver
+            
+            self.log_warning("Unhealthy WebDriver session detected, replacing it")
+            self._retire(driver)
+            self._count("replaced")
+    
+    def release(self, driver):
+        """Reset a leased session and return it to the pool"""
+        if self.reuse and self.reset(driver):
+            with self._cond:
+                self._idle.append(driver)
+                self._cond.notify()
+        else:
+            self._retire(driver)
+    
+    def reset(self, driver):
+        """Return a session to a blank state without restarting the browser"""
+        try:
+            self._dismiss_alert(driver)
+            if traffic_recorder.enabled:
+                # Record the last responses before the page goes away
+                NetworkMonitor.for_driver(driver).poll()
+            
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            self._dismiss_alert(driver)
+            
+            if driver.current_url.startswith("http"):
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            self._clear_browser_state(driver)
+            
+            driver.get(self.BLANK_URL)
+            NetworkMonitor.for_driver(driver).reset()
+            return True
+        except (WebDriverException, IndexError) as e:
+            self.log_warning(f"Session reset failed: {e.__class__.__name__}")
+            return False
+    
+    def is_healthy(self, driver):
+        """Check that the session still responds and has an open window"""
+        try:
+            return bool(driver.window_handles) and driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+    
+    def close(self):
+        """Quit every session owned by the pool"""
+        with self._cond:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+            self._idle.clear()
+        
+        for driver in sessions:
+            self._quit(driver)
+        if self._service is not None:
+            self._service.shutdown()
+        
+        self.log(
+            f"Driver pool closed: {self.stats['created']} started, "
+            f"{self.stats['reused']} reused, {self.stats['replaced']} replaced, "
+            f"{self.stats['leases']} leases"
+        )
+    
+    def _create(self):
+        """Start a new Chrome session for a slot reserved in acquire()"""
+        try:
+            with self._cond:
+                if self._service is None:
+                    self._service = DriverResolver().create_service()
+            driver = webdriver.Chrome(service=self._service, options=self.options)
+            driver.implicitly_wait(TestConfig.IMPLICIT_WAIT)
+            driver.maximize_window()
+            self._install_tracker(driver)
+        except Exception:
+            with self._cond:
+                self._reserved -= 1
+                self._cond.notify()
+            raise
+        
+        with self._cond:
+            self._reserved -= 1
+            self._sessions.add(driver)
+        self._count("created")
+        return driver
+    
+    def _retire(self, driver):
+        """Quit a session and free its slot"""
+        with self._cond:
+            self._sessions.discard(driver)
+            self._cond.notify()
+        self._quit(driver)
+    
+    def _size(self):
+        """Number of live sessions plus sessions being started"""
+        return len(self._sessions) + self._reserved
+    
+    def _count(self, key):
+        """Update pool statistics"""
+        with self._cond:
+            self.stats[key] += 1
+            if key in ("created", "reused"):
+                self.stats["leases"] += 1
+    
+    def _install_tracker(self, driver):
+        """Track DOM/network activity from the start of every document"""
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": QUIESCENCE_TRACKER_JS})
+        except (WebDriverException, AttributeError):
+            pass
+    
+    def _clear_browser_state(self, driver):
+        """Drop cookies and storage for every origin the tests touch"""
+        origin = "{0.scheme}://{0.netloc}".format(urlparse(TestConfig.ADMIN_URL))
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": origin,
+                "storageTypes": "local_storage,indexeddb,cache_storage,service_workers"
+            })
+        except (WebDriverException, AttributeError):
+            driver.delete_all_cookies()
+    
+    @staticmethod
+    def _dismiss_alert(driver):
+        """Dismiss an open alert/confirm dialog if there is one"""
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+    
+    @staticmethod
+    def _quit(driver):
+        """Quit a session, ignoring sessions that are already dead"""
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+    
+    def log(self, message):
+        """Log info message"""
+        logger.info(message)
+    
+    def log_warning(self, message):
+        """Log warning message"""
+        logger.warning(message)
@@ -0,0 +1,250 @@
+"""
+Cached, offline-capable chromedriver resolution and a shared driver service
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
+from config import TestConfig
+from log_backend import get_logger
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+logger = get_logger("DRIVER")
+
+
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+BROWSER_BINARIES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"
+]
+
+
+class SharedService(Service):
+    """chromedriver process started once and shared by many browser sessions"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Start chromedriver unless it is already running"""
+        with self._lock:
+            process = getattr(self, "process", None)
+            if process is None or process.poll() is not None:
+                super().start()
+    
+    def stop(self):
+        """Called by every session on quit(); keeps the shared process alive"""
+    
+    def shutdown(self):
+        """Stop the chromedriver process"""
+        with self._lock:
+            if getattr(self, "process", None) is not None:
+                super().stop()
+                self.process = None
+    
+    def __del__(self):
+        try:
+            self.shutdown()
+        except Exception:
+            pass
+
+
+class DriverResolver:
+    """
+    Locate the chromedriver binary once per process.
+    
+    Resolution order:
+        1. CHROMEDRIVER_PATH (pinned binary)
+        2. Cache file shared by all workers and runs
+        3. chromedriver on PATH
+        4. webdriver-manager download (skipped when DRIVER_OFFLINE=True)
+    
+    A cached or local driver is only used when its version matches
+    CHROMEDRIVER_VERSION (if pinned) and the installed Chrome major version
+    (if Chrome can be found).
+    """
+    
+    _resolved = None
+    _process_lock = threading.Lock()
+    
+    def __init__(self, cache_file=None, offline=None):
+        self.cache_file = cache_file or TestConfig.DRIVER_CACHE_FILE
+        self.offline = TestConfig.DRIVER_OFFLINE if offline is None else offline
+        self.pinned_path = TestConfig.CHROMEDRIVER_PATH
+        self.pinned_version = TestConfig.CHROMEDRIVER_VERSION
+    
+    def resolve(self):
+        """Return the cached entry {path, version, source}, resolving it on first use"""
+        if DriverResolver._resolved:
+            return DriverResolver._resolved
+        
+        with DriverResolver._process_lock:
+            if not DriverResolver._resolved:
+                start = time.perf_counter()
+                with self._file_lock():
+                    entry = self._resolve_locked()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self.log(f"chromedriver {entry['version'] or '?'} from {entry['source']} ({elapsed_ms:.0f}ms): {entry['path']}")
+                DriverResolver._resolved = entry
+        return DriverResolver._resolved
+    
+    def resolve_path(self):
+        """Return the chromedriver binary path"""
+        return self.resolve()["path"]
+    
+    def create_service(self):
+        """Create a chromedriver service that sessions can share"""
+        return SharedService(self.resolve_path())
+    
+    def _resolve_locked(self):
+        """Run the resolution chain while holding the cache file lock"""
+        browser_version = self.browser_version()
+        
+        if self.pinned_path:
+            if not os.path.isfile(self.pinned_path):
+                raise WebDriverException(f"CHROMEDRIVER_PATH does not exist: {self.pinned_path}")
+            return self._entry(self.pinned_path, "pinned", store=True)
+        
+        cached = self._read_cache()
+        if cached and self._is_usable(cached, browser_version):
+            cached["source"] = "cache"
+            return cached
+        
+        local = shutil.which("chromedriver")
+        local_entry = self._entry(local, "local") if local else None
+        if local_entry and self._is_usable(local_entry, browser_version):
+            self._write_cache(local_entry)
+            return local_entry
+        
+        if not self.offline:
+            try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                path = ChromeDriverManager(driver_version=self.pinned_version or None).install()
+                return self._entry(path, "download", store=True)
+            except Exception as e:
+                self.log_warning(f"chromedriver download failed: {e.__class__.__name__}")
+        
+        # Offline: a driver that exists beats no driver at all
+        for fallback in (cached, local_entry):
+            if fallback and os.path.isfile(fallback["path"]):
+                self.log_warning("Using chromedriver that may not match the installed Chrome")
+                fallback["source"] = f"{fallback['source']} (unverified)"
+                return fallback
+        
+        raise WebDriverException(
+            "chromedriver could not be resolved. Set CHROMEDRIVER_PATH to a local "
+            "binary or disable DRIVER_OFFLINE to allow downloading it."
+        )
+    
+    def _is_usable(self, entry, browser_version):
+        """Check that a driver exists and matches the pinned and browser versions"""
+        if not os.path.isfile(entry.get("path", "")):
+            return False
+        version = entry.get("version")
+        if self.pinned_version and version != self.pinned_version:
+            return False
+        if browser_version and version and version.split(".")[0] != browser_version.split(".")[0]:
+            return False
+        return True
+    
+    def _entry(self, path, source, store=False):
+        """Build a cache entry for a driver binary"""
+        entry = {
+            "path": os.path.abspath(path),
+            "version": self.binary_version(path),
+            "source": source,
+            "resolved_at": time.time(),
+        }
+        if store:
+            self._write_cache(entry)
+        return entry
+    
+    def _read_cache(self):
+        """Read the shared cache file"""
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache(self, entry):
+        """Atomically replace the shared cache file"""
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        tmp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_path, self.cache_file)
+    
+    @contextmanager
+    def _file_lock(self):
+        """Serialize resolution across xdist workers and concurrent runs"""
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file + ".lock", "a+") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(0.1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    
+    @staticmethod
+    def binary_version(path):
+        """Read the version printed by an executable's --version flag"""
+        try:
+            output = subprocess.run(
+                [path, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        match = VERSION_PATTERN.search(output)
+        return match.group(0) if match else None
+    
+    @classmethod
+    def browser_version(cls):
+        """Installed Chrome version, found without network access"""
+        for name in BROWSER_BINARIES:
+            binary = shutil.which(name)
+            if binary:
+                version = cls.binary_version(binary)
+                if version:
+                    return version
+        
+        try:
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
+            return winreg.QueryValueEx(key, "version")[0]
+        except (ImportError, OSError):
+            return None
+    
+    def log(self, message):
+        """Log info message"""
+        logger.info(message)
+    
+    def log_warning(self, message):
+        """Log warning message"""
+        logger.warning(message)
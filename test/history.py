@@ -0,0 +1,366 @@
+"""
+SQLite history of test runs: durations, phases, step spans and outcomes across runs
+
+Usage:
+    python run_tests.py history trends  [--runs N] [--marker M]
+    python run_tests.py history flaky   [--runs N] [--limit K]
+    python run_tests.py history slowest [--runs N] [--limit K] [--marker M]
+    python run_tests.py history steps   [--runs N] [--limit K]
+    python run_tests.py history import
+"""
+import argparse
+import json
+import math
+import os
+import sqlite3
+from datetime import datetime
+from config import TestConfig
+from colorama import Fore, Style
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    started REAL NOT NULL,
+    finished REAL,
+    args TEXT,
+    exitstatus INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    setup REAL,
+    call REAL,
+    teardown REAL,
+    worker TEXT,
+    started REAL,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE INDEX IF NOT EXISTS results_nodeid ON results (nodeid, run_id);
+CREATE TABLE IF NOT EXISTS markers (
+    nodeid TEXT NOT NULL,
+    marker TEXT NOT NULL,
+    PRIMARY KEY (nodeid, marker)
+);
+CREATE INDEX IF NOT EXISTS markers_marker ON markers (marker);
+CREATE TABLE IF NOT EXISTS spans (
+    run_id TEXT NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    nodeid TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    page TEXT,
+    target TEXT,
+    depth INTEGER,
+    start_ms REAL,
+    duration_ms REAL
+);
+CREATE INDEX IF NOT EXISTS spans_run_test ON spans (run_id, nodeid);
+CREATE INDEX IF NOT EXISTS spans_name ON spans (name, page);
+"""
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers: the ceil(fraction * n)-th smallest"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class HistoryDB:
+    """
+    Embedded store of every run's results.
+    
+    Runs are imported from the results.jsonl/run.json files the results
+    sink streams, so the JSONL stays the source of truth and importing the
+    same run twice replaces it.
+    """
+    
+    def __init__(self, path=None):
+        self.path = path or TestConfig.HISTORY_DB
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+    
+    def import_run(self, run_dir):
+        """Load one run directory; returns the number of results"""
+        with open(os.path.join(run_dir, "run.json"), encoding="utf-8") as f:
+            run = json.load(f)
+        results = []
+        with open(os.path.join(run_dir, "results.jsonl"), encoding="utf-8") as f:
+            for line in f:
+                try:
+                    results.append(json.loads(line))
+                except ValueError:
+                    continue
+        
+        with self.conn:
+            self.conn.execute("DELETE FROM runs WHERE id = ?", (run["id"],))
+            self.conn.execute(
+                "INSERT INTO runs (id, started, finished, args, exitstatus) VALUES (?, ?, ?, ?, ?)",
+                (run["id"], run["started"], run.get("finished"), " ".join(run.get("args", [])), run.get("exitstatus"))
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run["id"], r["test"], r["outcome"], r["duration"],
+                        r.get("phases", {}).get("setup"), r.get("phases", {}).get("call"),
+                        r.get("phases", {}).get("teardown"), r.get("worker"), r.get("start"),
+                    )
+                    for r in results
+                ]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO markers VALUES (?, ?)",
+                [(r["test"], marker) for r in results for marker in r.get("markers", [])]
+            )
+            self.conn.executemany(
+                "INSERT INTO spans VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run["id"], r["test"], seq, s["category"], s["name"], s.get("page"),
+                        s.get("target"), s.get("depth"), s.get("start_ms"), s.get("duration_ms"),
+                    )
+                    for r in results for seq, s in enumerate(r.get("spans", []))
+                ]
+            )
+        return len(results)
+    
+    def import_all(self, results_dir=None):
+        """Load every run directory that is not in the database yet"""
+        results_dir = results_dir or TestConfig.RESULTS_DIR
+        known = {row[0] for row in self.conn.execute("SELECT id FROM runs")}
+        imported = 0
+        for run_id in sorted(os.listdir(results_dir)) if os.path.isdir(results_dir) else []:
+            if run_id not in known and os.path.exists(os.path.join(results_dir, run_id, "run.json")):
+                self.import_run(os.path.join(results_dir, run_id))
+                imported += 1
+        return imported
+    
+    def recent_runs(self, runs=None):
+        """Ids of the last N runs (HISTORY_RUNS by default), oldest first"""
+        runs = runs or TestConfig.HISTORY_RUNS
+        rows = self.conn.execute("SELECT id FROM runs ORDER BY started DESC LIMIT ?", (runs,)).fetchall()
+        return [row[0] for row in reversed(rows)]
+    
+    def recent_failures(self, runs=None):
+        """Tests that failed in the last N runs: nodeid -> runs since the latest failure (0 = last run)"""
+        run_ids = self.recent_runs(runs)
+        age = {run_id: len(run_ids) - 1 - index for index, run_id in enumerate(run_ids)}
+        failures = {}
+        for run_id, nodeid, outcome, _ in self._results(run_ids):
+            if outcome in ("failed", "error"):
+                failures[nodeid] = min(age[run_id], failures.get(nodeid, age[run_id]))
+        return failures
+    
+    def action_samples(self, run_id=None):
+        """
+        Durations of page object actions (click_add_blog, ...) in one run
+        
+        Args:
+            run_id: Run to read; defaults to the latest run with action spans
+        
+        Returns:
+            (run id, dict "Page.action" -> list of milliseconds)
+        """
+        if run_id is None:
+            row = self.conn.execute(
+                "SELECT runs.id FROM runs WHERE EXISTS "
+                "(SELECT 1 FROM spans WHERE spans.run_id = runs.id AND category = 'action') "
+                "ORDER BY started DESC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None, {}
+            run_id = row[0]
+        samples = {}
+        for page, name, duration in self.conn.execute(
+            "SELECT page, name, duration_ms FROM spans WHERE run_id = ? AND category = 'action'",
+            (run_id,)
+        ):
+            samples.setdefault(f"{page}.{name}", []).append(duration)
+        return run_id, samples
+    
+    def last_started(self):
+        """Start time of the latest recorded run, or None"""
+        return self.conn.execute("SELECT MAX(started) FROM runs").fetchone()[0]
+    
+    def _results(self, run_ids, marker=None, columns="run_id, nodeid, outcome, duration"):
+        """Result rows of some runs, optionally of one marker only"""
+        if not run_ids:
+            return []
+        placeholders = ",".join("?" * len(run_ids))
+        query = f"SELECT {columns} FROM results WHERE run_id IN ({placeholders})"
+        params = list(run_ids)
+        if marker:
+            query += " AND nodeid IN (SELECT nodeid FROM markers WHERE marker = ?)"
+            params.append(marker)
+        return self.conn.execute(query, params).fetchall()
+    
+    def trends(self, runs=None, marker=None):
+        """Per run: test count, failures, p50/p95 and total test duration"""
+        run_ids = self.recent_runs(runs)
+        by_run = {run_id: [] for run_id in run_ids}
+        failures = dict.fromkeys(run_ids, 0)
+        for run_id, _, outcome, duration in self._results(run_ids, marker):
+            by_run[run_id].append(duration)
+            failures[run_id] += outcome in ("failed", "error")
+        return [
+            {
+                "run": run_id,
+                "tests": len(durations),
+                "failures": failures[run_id],
+                "p50": percentile(durations, 0.5),
+                "p95": percentile(durations, 0.95),
+                "total": sum(durations),
+            }
+            for run_id, durations in by_run.items()
+        ]
+    
+    def flaky(self, runs=None, limit=20):
+        """
+        Tests whose outcome changes between runs
+        
+        Flip rate is the share of consecutive runs in which the test went
+        from passed to failed or back; a test that is broken for good has
+        one flip, a flaky one many.
+        """
+        run_ids = self.recent_runs(runs)
+        order = {run_id: index for index, run_id in enumerate(run_ids)}
+        history = {}
+        for run_id, nodeid, outcome, _ in self._results(run_ids):
+            if outcome in ("passed", "failed", "error"):
+                history.setdefault(nodeid, []).append((order[run_id], outcome == "passed"))
+        
+        rows = []
+        for nodeid, outcomes in history.items():
+            outcomes.sort()
+            passed = [ok for _, ok in outcomes]
+            if len(passed) < 2 or all(passed) or not any(passed):
+                continue
+            flips = sum(1 for a, b in zip(passed, passed[1:]) if a != b)
+            rows.append({
+                "test": nodeid,
+                "runs": len(passed),
+                "fail_rate": passed.count(False) / len(passed),
+                "flip_rate": flips / (len(passed) - 1),
+            })
+        rows.sort(key=lambda row: (-row["flip_rate"], -row["fail_rate"]))
+        return rows[:limit]
+    
+    def slowest(self, runs=None, limit=5, marker=None):
+        """Slowest tests by median duration, grouped by marker"""
+        run_ids = self.recent_runs(runs)
+        markers = [marker] if marker else [
+            row[0] for row in self.conn.execute("SELECT DISTINCT marker FROM markers ORDER BY marker")
+        ]
+        grouped = {}
+        for name in markers:
+            durations = {}
+            for _, nodeid, _, duration, setup, teardown in self._results(
+                run_ids, name, "run_id, nodeid, outcome, duration, setup, teardown"
+            ):
+                durations.setdefault(nodeid, []).append((duration, setup or 0.0, teardown or 0.0))
+            rows = [
+                {
+                    "test": nodeid,
+                    "runs": len(values),
+                    "p50": percentile([v[0] for v in values], 0.5),
+                    "p95": percentile([v[0] for v in values], 0.95),
+                    "setup": sum(v[1] for v in values) / len(values),
+                    "teardown": sum(v[2] for v in values) / len(values),
+                }
+                for nodeid, values in durations.items()
+            ]
+            rows.sort(key=lambda row: -row["p50"])
+            if rows:
+                grouped[name] = rows[:limit]
+        return grouped
+    
+    def steps(self, runs=None, limit=20):
+        """Page object primitives that cost the most time in total"""
+        run_ids = self.recent_runs(runs)
+        if not run_ids:
+            return []
+        placeholders = ",".join("?" * len(run_ids))
+        durations = {}
+        for name, page, category, duration in self.conn.execute(
+            f"SELECT name, page, category, duration_ms FROM spans WHERE run_id IN ({placeholders}) "
+            f"AND category NOT IN ('setup', 'teardown', 'test')", run_ids
+        ):
+            durations.setdefault((name, page, category), []).append(duration)
+        rows = [
+            {
+                "step": f"{page}.{name}" if page else name,
+                "category": category,
+                "calls": len(values),
+                "p50_ms": percentile(values, 0.5),
+                "p95_ms": percentile(values, 0.95),
+                "total_s": sum(values) / 1000,
+            }
+            for (name, page, category), values in durations.items()
+        ]
+        rows.sort(key=lambda row: -row["total_s"])
+        return rows[:limit]
+    
+    def close(self):
+        """Close the database"""
+        self.conn.close()
+
+
+def print_table(rows, columns):
+    """Print dict rows as an aligned table"""
+    if not rows:
+        print(f"{Fore.YELLOW}No data{Style.RESET_ALL}")
+        return
+    cells = [[format_cell(row[column]) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[i]) for line in cells)) for i, column in enumerate(columns)]
+    print(f"{Style.BRIGHT}" + "  ".join(c.ljust(w) for c, w in zip(columns, widths)) + f"{Style.RESET_ALL}")
+    for line in cells:
+        print("  ".join(c.ljust(w) for c, w in zip(line, widths)))
+
+
+def format_cell(value):
+    """Short text form of a table value"""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def main(argv=None):
+    """Command line entry point (python run_tests.py history ...)"""
+    parser = argparse.ArgumentParser(prog="run_tests.py history", description="Test run history")
+    parser.add_argument("command", choices=["trends", "flaky", "slowest", "steps", "import"])
+    parser.add_argument("--runs", type=int, default=None, help="Number of recent runs to analyse")
+    parser.add_argument("--limit", type=int, default=None, help="Rows to show")
+    parser.add_argument("--marker", default=None, help="Only tests with this marker")
+    args = parser.parse_args(argv)
+    
+    db = HistoryDB()
+    try:
+        imported = db.import_all()
+        if imported or args.command == "import":
+            print(f"{Fore.CYAN}[HISTORY] Imported {imported} runs into {db.path}{Style.RESET_ALL}")
+        if args.command == "trends":
+            rows = db.trends(args.runs, args.marker)
+            for row in rows:
+                started = db.conn.execute("SELECT started FROM runs WHERE id = ?", (row["run"],)).fetchone()[0]
+                row["date"] = datetime.fromtimestamp(started).strftime("%Y-%m-%d %H:%M")
+            print_table(rows, ["run", "date", "tests", "failures", "p50", "p95", "total"])
+        elif args.command == "flaky":
+            print_table(db.flaky(args.runs, args.limit or 20), ["test", "runs", "fail_rate", "flip_rate"])
+        elif args.command == "slowest":
+            for marker, rows in db.slowest(args.runs, args.limit or 5, args.marker).items():
+                print(f"\n{Fore.CYAN}{Style.BRIGHT}{marker}{Style.RESET_ALL}")
+                print_table(rows, ["test", "runs", "p50", "p95", "setup", "teardown"])
+        elif args.command == "steps":
+            print_table(db.steps(args.runs, args.limit or 20), ["step", "category", "calls", "p50_ms", "p95_ms", "total_s"])
+    finally:
+        db.close()
+    return 0
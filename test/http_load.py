@@ -0,0 +1,396 @@
+"""
+Asyncio HTTP load on the admin backend: the requests behind the admin UI flows, without browsers
+
+Usage:
+    python run_tests.py http-load [--mode closed|open] [--users 50] [--rate 20] [--seconds 60] [--mix ...]
+"""
+import argparse
+import asyncio
+import ipaddress
+import json
+import os
+import random
+import time
+from datetime import datetime
+from urllib.parse import quote, urlparse
+import aiohttp
+import requests
+from config import TestConfig
+from api_client import AdminApiClient
+from data_factory import DataFactory, SEED_TEMPLATES
+from backend_snapshot import SessionSnapshot, ledger
+from history import percentile
+from load_driver import parse_mix
+from log_backend import get_logger
+from colorama import Fore, Style
+
+
+logger = get_logger("HTTP-LOAD")
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class ScenarioClient:
+    """
+    Requests of one scenario run, timed one by one.
+    
+    Any failed request (connection error, timeout or HTTP error status)
+    raises and ends the scenario run.
+    """
+    
+    def __init__(self, generator, scenario):
+        self.generator = generator
+        self.scenario = scenario
+    
+    async def request(self, method, path, data=None, route=None):
+        """Send one request, reported under `route` (default: path); returns the decoded JSON body or None"""
+        generator = self.generator
+        start = time.perf_counter()
+        status = None
+        try:
+            async with generator.session.request(method, f"{generator.base_url}/{path}", json=data) as response:
+                status = response.status
+                body = await response.read()
+                response.raise_for_status()
+        finally:
+            generator.record_request(self.scenario, f"{method} /{route or path}", time.perf_counter() - start, status)
+        try:
+            return json.loads(body) if body else None
+        except ValueError:
+            return None
+    
+    async def list(self, kind):
+        """GET a collection, as the admin tables do on load"""
+        return AdminApiClient.unwrap(await self.request("GET", AdminApiClient.ENDPOINTS[kind]))
+    
+    async def create(self, kind, data):
+        """POST an entity; returns its id and remembers it for cleanup"""
+        payload = await self.request("POST", AdminApiClient.ENDPOINTS[kind], data)
+        entity_id = self.generator.api.created_id(kind, data, payload)
+        self.generator.created.setdefault(kind, []).append(entity_id)
+        return entity_id
+
+
+async def create_blog(client, factory):
+    """BlogsPage.create_blog: table load, save, table refresh"""
+    await client.list("blog")
+    await client.create("blog", factory.blog(SEED_TEMPLATES["blog"]))
+    await client.list("blog")
+
+
+async def create_portfolio_project(client, factory):
+    """PortfolioPage.create_portfolio_project: table load, save, table refresh"""
+    await client.list("project")
+    await client.create("project", factory.project(SEED_TEMPLATES["project"]))
+    await client.list("project")
+
+
+async def create_gallery_item(client, factory):
+    """GalleryPage.create_gallery_item: grid load, save, grid refresh"""
+    await client.list("gallery")
+    await client.create("gallery", factory.gallery_item(SEED_TEMPLATES["gallery"]))
+    await client.list("gallery")
+
+
+async def save_configuration(client, factory):
+    """SiteConfigPage.save_configuration: load the config and save it unchanged"""
+    config = AdminApiClient.unwrap(await client.request("GET", AdminApiClient.CONFIG_ENDPOINT))
+    await client.request("PUT", AdminApiClient.CONFIG_ENDPOINT, config)
+
+
+async def list_backups(client, factory):
+    """BackupsPage: backup list, then the newest backup as the view dialog loads it"""
+    backups = await client.list("backup")
+    if backups:
+        newest = client.generator.api.entity_id("backup", backups[0])
+        endpoint = AdminApiClient.ENDPOINTS["backup"]
+        await client.request("GET", f"{endpoint}/{quote(str(newest), safe='')}", route=f"{endpoint}/<id>")
+
+
+# Request sequences by name, named after the page object method they stand for
+SCENARIOS = {
+    "create_blog": create_blog,
+    "create_portfolio_project": create_portfolio_project,
+    "create_gallery_item": create_gallery_item,
+    "save_configuration": save_configuration,
+    "list_backups": list_backups,
+}
+
+
+def is_local(url):
+    """Whether a URL points at this machine"""
+    host = urlparse(url).hostname or ""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class LatencyHistogram:
+    """Counts of latencies per fixed bucket, for a text rendering of the distribution"""
+    
+    def __init__(self, bounds=HISTOGRAM_BOUNDS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+    
+    def add(self, ms):
+        """Count one latency"""
+        for index, bound in enumerate(self.bounds):
+            if ms <= bound:
+                self.counts[index] += 1
+                return
+        self.counts[-1] += 1
+    
+    def buckets(self):
+        """(label, count) per bucket, the last one open-ended"""
+        labels = [f"<= {bound} ms" for bound in self.bounds] + [f"> {self.bounds[-1]} ms"]
+        return list(zip(labels, self.counts))
+    
+    def format(self, width=40):
+        """Text bar chart, trimmed to the buckets that have counts"""
+        buckets = self.buckets()
+        used = [index for index, (_, count) in enumerate(buckets) if count]
+        if not used:
+            return []
+        peak = max(self.counts)
+        return [
+            f"{label:>12} {count:>8} {'#' * max(1, round(count / peak * width)) if count else ''}"
+            for label, count in buckets[used[0]:used[-1] + 1]
+        ]
+
+
+class HttpLoadGenerator:
+    """
+    Replays the admin UI's backend requests from one asyncio event loop.
+    
+    All requests share one aiohttp session whose connector keeps up to
+    HTTP_LOAD_CONNECTIONS keep-alive connections open. In the closed-loop
+    mode a fixed number of virtual users each start their next scenario
+    when the previous one has finished. In the open-loop mode scenarios
+    start at a fixed rate whether or not earlier ones are done, and their
+    latency counts from the scheduled start, so a backlog shows up as
+    latency instead of a lower request rate. Arrivals beyond
+    HTTP_LOAD_MAX_INFLIGHT are dropped and counted.
+    """
+    
+    def __init__(self, mix=None, connections=None, base_url=None):
+        self.mix = mix or parse_mix(TestConfig.HTTP_LOAD_MIX, SCENARIOS)
+        self.connections = connections or TestConfig.HTTP_LOAD_CONNECTIONS
+        self.base_url = (base_url or TestConfig.API_URL).rstrip("/")
+        self.api = AdminApiClient(self.base_url)
+        self.factory = DataFactory(worker_id="http")
+        self.session = None
+        self.created = {}
+        self.scenario_samples = []
+        self.request_samples = []
+        self.dropped = 0
+        self.elapsed = 0.0
+    
+    def record_request(self, scenario, step, seconds, status):
+        """One request's latency and HTTP status (None if none arrived)"""
+        self.request_samples.append((scenario, step, seconds * 1000, status))
+    
+    async def run_closed(self, users, seconds, think_time=0.0):
+        """Each of `users` virtual users runs scenarios back to back for `seconds`"""
+        async def user(index):
+            rng = random.Random(index)
+            while time.perf_counter() < deadline:
+                await self._scenario(self._pick(rng), time.perf_counter())
+                if think_time:
+                    await asyncio.sleep(think_time)
+        
+        async with self._session():
+            start = time.perf_counter()
+            deadline = start + seconds
+            await asyncio.gather(*(user(index) for index in range(users)))
+            self.elapsed = time.perf_counter() - start
+    
+    async def run_open(self, rate, seconds, max_inflight=None):
+        """Start `rate` scenarios per second for `seconds`, regardless of completions"""
+        max_inflight = max_inflight or TestConfig.HTTP_LOAD_MAX_INFLIGHT
+        rng = random.Random(0)
+        tasks = set()
+        async with self._session():
+            start = time.perf_counter()
+            for arrival in range(int(rate * seconds)):
+                scheduled = start + arrival / rate
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if len(tasks) >= max_inflight:
+                    self.dropped += 1
+                    continue
+                task = asyncio.create_task(self._scenario(self._pick(rng), scheduled))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+            self.elapsed = time.perf_counter() - start
+    
+    def _session(self):
+        """aiohttp session with a pooled keep-alive connector"""
+        connector = aiohttp.TCPConnector(limit=self.connections, keepalive_timeout=30)
+        headers = {"Authorization": f"Bearer {TestConfig.API_TOKEN}"} if TestConfig.API_TOKEN else None
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=TestConfig.EXPLICIT_WAIT),
+        )
+        return self.session
+    
+    def _pick(self, rng):
+        """Scenario name drawn by the mix weights"""
+        return rng.choices(list(self.mix), list(self.mix.values()))[0]
+    
+    async def _scenario(self, name, scheduled):
+        """Run one scenario; its latency counts from `scheduled`"""
+        try:
+            await SCENARIOS[name](ScenarioClient(self, name), self.factory)
+            ok = True
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            ok = False
+        self.scenario_samples.append((name, (time.perf_counter() - scheduled) * 1000, ok))
+    
+    def cleanup(self):
+        """Delete the entities the run created; returns how many existed"""
+        deleted = 0
+        for kind, entity_ids in self.created.items():
+            try:
+                deleted += self.api.delete_many(kind, entity_ids)
+            except requests.RequestException as e:
+                logger.warning(f"Cleanup of {kind} entities failed: {e.__class__.__name__}")
+        self.created = {}
+        return deleted
+    
+    def summary(self):
+        """Rows per scenario and per request: count, errors, throughput and latency percentiles"""
+        def row(name, samples):
+            latencies = [ms for ms, ok in samples if ok]
+            return {
+                "name": name,
+                "count": len(samples),
+                "errors": len(samples) - len(latencies),
+                "error_rate": (len(samples) - len(latencies)) / len(samples),
+                "per_sec": len(latencies) / self.elapsed if self.elapsed else 0.0,
+                "p50": percentile(latencies, 0.5),
+                "p95": percentile(latencies, 0.95),
+                "p99": percentile(latencies, 0.99),
+                "max": max(latencies, default=0.0),
+            }
+        
+        scenarios, requests_ = {}, {}
+        for name, ms, ok in self.scenario_samples:
+            scenarios.setdefault(name, []).append((ms, ok))
+        for scenario, step, ms, status in self.request_samples:
+            ok = status is not None and status < 400
+            requests_.setdefault(f"{scenario}: {step}", []).append((ms, ok))
+        return {
+            "scenarios": [row(name, samples) for name, samples in sorted(scenarios.items())],
+            "requests": [row(name, samples) for name, samples in sorted(requests_.items())],
+        }
+    
+    def histograms(self):
+        """Latency histogram of all successful scenario runs and one per scenario"""
+        histograms = {"all": LatencyHistogram()}
+        for name, ms, ok in self.scenario_samples:
+            if ok:
+                histograms["all"].add(ms)
+                histograms.setdefault(name, LatencyHistogram()).add(ms)
+        return histograms
+    
+    def save(self, summary, settings, directory=None):
+        """Write settings, summary, histograms and raw scenario samples as JSON; returns the path"""
+        directory = directory or TestConfig.PERF_DIR
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"http_load_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        statuses = {}
+        for _, _, _, status in self.request_samples:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "settings": dict(settings, mix=self.mix, connections=self.connections),
+                "elapsed": self.elapsed,
+                "dropped": self.dropped,
+                "statuses": statuses,
+                "summary": summary,
+                "histograms": {name: dict(h.buckets()) for name, h in self.histograms().items()},
+                "samples": [
+                    {"scenario": name, "ms": round(ms, 2), "ok": ok}
+                    for name, ms, ok in self.scenario_samples
+                ],
+            }, f, indent=1)
+        return path
+
+
+def print_rows(title, rows):
+    """Aligned table of summary rows, latencies in milliseconds"""
+    width = max([len(row["name"]) for row in rows] + [len(title)])
+    print(f"\n{Style.BRIGHT}{title:<{width}}  {'count':>7}{'errors':>8}{'err %':>7}{'per s':>8}"
+          f"{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{Style.RESET_ALL}")
+    for row in rows:
+        color = Fore.RED if row["errors"] else ""
+        print(f"{row['name']:<{width}}  {row['count']:>7}{color}{row['errors']:>8}{row['error_rate'] * 100:>6.1f}%"
+              f"{Style.RESET_ALL}{row['per_sec']:>8.1f}{row['p50']:>9.1f}{row['p95']:>9.1f}{row['p99']:>9.1f}"
+              f"{row['max']:>9.1f}")
+
+
+def main(argv=None):
+    """Command line entry point (python run_tests.py http-load ...)"""
+    parser = argparse.ArgumentParser(prog="run_tests.py http-load", description="Asyncio HTTP load on the admin backend")
+    parser.add_argument("--mode", choices=["closed", "open"], default=TestConfig.HTTP_LOAD_MODE)
+    parser.add_argument("--users", type=int, default=TestConfig.HTTP_LOAD_USERS, help="Virtual users (closed loop)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause between a user's scenarios (closed loop)")
+    parser.add_argument("--rate", type=float, default=TestConfig.HTTP_LOAD_RATE, help="Scenarios started per second (open loop)")
+    parser.add_argument("--seconds", type=int, default=TestConfig.HTTP_LOAD_SECONDS)
+    parser.add_argument("--connections", type=int, default=None, help="Keep-alive connection pool size")
+    parser.add_argument("--mix", default=None, help=f"Scenario weights, e.g. create_blog=3,list_backups=4 ({', '.join(SCENARIOS)})")
+    parser.add_argument("--allow-remote", action="store_true", help="Allow a backend that is not on this machine")
+    args = parser.parse_args(argv)
+    
+    mix = parse_mix(args.mix, SCENARIOS) if args.mix else None
+    generator = HttpLoadGenerator(mix, args.connections)
+    if not is_local(generator.base_url) and not args.allow_remote:
+        print(f"{Fore.RED}[HTTP-LOAD] {generator.base_url} is not a local backend; "
+              f"pass --allow-remote to load it anyway{Style.RESET_ALL}")
+        return 2
+    
+    snapshot = SessionSnapshot(generator.api, generator.factory.run_id) if TestConfig.HERMETIC_BACKEND else None
+    if args.mode == "open":
+        logger.info(f"Open loop: {args.rate:g} scenarios/s for {args.seconds}s against {generator.base_url}")
+        settings = {"mode": "open", "rate": args.rate, "seconds": args.seconds}
+    else:
+        logger.info(f"Closed loop: {args.users} users for {args.seconds}s against {generator.base_url}")
+        settings = {"mode": "closed", "users": args.users, "think_time": args.think_time, "seconds": args.seconds}
+    try:
+        if snapshot is not None:
+            snapshot.start()
+        # The scenarios write through aiohttp, so the whole load is one recorded
+        # write: every backup that appears meanwhile counts as the run's, which
+        # is only exact on a backend nobody else writes to
+        with ledger.write(config=True):
+            if args.mode == "open":
+                asyncio.run(generator.run_open(args.rate, args.seconds))
+            else:
+                asyncio.run(generator.run_closed(args.users, args.seconds, args.think_time))
+    finally:
+        # The snapshot restore removes the created entities and the backups they caused
+        if snapshot is not None and snapshot.started:
+            snapshot.finish()
+            print(f"{Fore.CYAN}[SNAPSHOT] {SessionSnapshot.format_stats(snapshot.stats)}{Style.RESET_ALL}")
+        else:
+            generator.cleanup()
+        generator.api.close()
+    
+    summary = generator.summary()
+    print_rows("scenario", summary["scenarios"])
+    print_rows("request", summary["requests"])
+    for line in generator.histograms()["all"].format():
+        print(line)
+    if generator.dropped:
+        print(f"{Fore.YELLOW}[HTTP-LOAD] {generator.dropped} arrivals dropped at "
+              f"{TestConfig.HTTP_LOAD_MAX_INFLIGHT} scenarios in flight{Style.RESET_ALL}")
+    print(f"\n{Fore.CYAN}[HTTP-LOAD] Samples saved to {generator.save(summary, settings)}{Style.RESET_ALL}")
+    return 1 if any(row["errors"] for row in summary["scenarios"]) else 0
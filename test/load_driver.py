@@ -0,0 +1,287 @@
+"""
+Concurrent multi-browser load: weighted page object flows at a growing number of editors
+
+Usage:
+    python run_tests.py load [--stages 1,2,4,8] [--stage-seconds 60] [--mix create_blog=3,view_backup=4]
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+import requests
+from selenium.common.exceptions import WebDriverException
+from config import TestConfig
+from driver_pool import DriverPool, chrome_options
+from auth_cache import AuthStateCache
+from api_client import AdminApiClient
+from data_factory import DataFactory, SEED_TEMPLATES
+from backend_snapshot import SessionSnapshot, ledger
+from history import percentile
+from pages.blogs_page import BlogsPage
+from pages.portfolio_page import PortfolioPage
+from pages.site_config_page import SiteConfigPage
+from pages.backups_page import BackupsPage
+from log_backend import get_logger
+from colorama import Fore, Style
+
+
+logger = get_logger("LOAD")
+
+
+def flow_create_blog(driver, factory):
+    """Open the blogs page and create a blog through the dialog"""
+    page = BlogsPage(driver)
+    page.navigate()
+    return page.create_blog(factory.blog(SEED_TEMPLATES["blog"]))
+
+
+def flow_create_project(driver, factory):
+    """Open the portfolio page and create a project through the dialog"""
+    page = PortfolioPage(driver)
+    page.navigate()
+    return page.create_portfolio_project(factory.project(SEED_TEMPLATES["project"]))
+
+
+def flow_save_config(driver, factory):
+    """Save the site config unchanged, like http_load.save_configuration"""
+    # Flipping a toggle would change the site for everyone sharing the backend
+    page = SiteConfigPage(driver)
+    page.navigate()
+    return page.save_configuration()
+
+
+def flow_view_backup(driver, factory):
+    """Open the latest backup and close it again"""
+    page = BackupsPage(driver)
+    page.navigate()
+    viewed = page.click_view_on_first_backup()
+    if viewed:
+        page.close_dialog()
+    return viewed
+
+
+# Flows an editor session picks from, by name
+FLOWS = {
+    "create_blog": flow_create_blog,
+    "create_project": flow_create_project,
+    "save_config": flow_save_config,
+    "view_backup": flow_view_backup,
+}
+
+
+def parse_mix(text, flows=None):
+    """"create_blog=3,view_backup=4" -> {"create_blog": 3.0, "view_backup": 4.0}"""
+    flows = FLOWS if flows is None else flows
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in flows:
+            raise ValueError(f"Unknown flow '{name}', expected one of: {', '.join(flows)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class LoadDriver:
+    """
+    Runs several browser sessions at once, each repeating a weighted
+    random mix of page object flows.
+    
+    Concurrency ramps in stages. Sessions started for one stage keep
+    running in the next, so each stage adds editors instead of restarting
+    them. Stage clocks only run once every session of the stage is logged
+    in. Flows that start while new sessions are still logging in are not
+    counted. The backup count is read before and after each stage to show
+    whether backup creation keeps up with the writes.
+    """
+    
+    def __init__(self, stages=None, stage_seconds=None, mix=None, headless=True):
+        self.stages = stages or TestConfig.LOAD_STAGES
+        self.stage_seconds = stage_seconds or TestConfig.LOAD_STAGE_SECONDS
+        self.mix = mix or parse_mix(TestConfig.LOAD_MIX)
+        self.pool = DriverPool(chrome_options(headless), max_size=max(self.stages), reuse=False)
+        self.auth = AuthStateCache()
+        self.auth_lock = threading.Lock()
+        self.samples = []
+        self.samples_lock = threading.Lock()
+        self.stage_info = []
+        self.stage = None
+        self.stop = threading.Event()
+        self.run_id = DataFactory.default_run_id()
+    
+    def run(self, api=None):
+        """Run every stage; returns the summary rows"""
+        sessions = []
+        try:
+            for index, count in enumerate(self.stages):
+                self.stage = None
+                new = []
+                while len(sessions) < count:
+                    ready = threading.Event()
+                    thread = threading.Thread(
+                        target=self._session, args=(len(sessions), ready), name=f"load-{len(sessions)}", daemon=True
+                    )
+                    thread.start()
+                    sessions.append(thread)
+                    new.append(ready)
+                for ready in new:
+                    ready.wait()
+                
+                backups_before = self._count_backups(api)
+                logger.info(f"Stage {index + 1}/{len(self.stages)}: {count} sessions for {self.stage_seconds}s")
+                start = time.monotonic()
+                self.stage = index
+                self.stop.wait(self.stage_seconds)
+                self.stage = None
+                elapsed = time.monotonic() - start
+                backups_after = self._count_backups(api)
+                self.stage_info.append({
+                    "sessions": count,
+                    "seconds": elapsed,
+                    "backups": None if backups_before is None or backups_after is None
+                    else backups_after - backups_before,
+                })
+        finally:
+            self.stop.set()
+            for thread in sessions:
+                thread.join()
+            self.pool.close()
+        return self.summary()
+    
+    def _session(self, index, ready):
+        """One editor: log in, then run flows until the load stops"""
+        factory = DataFactory(run_id=self.run_id, worker_id=f"load{index}")
+        try:
+            driver = self.pool.acquire()
+        except WebDriverException as e:
+            logger.error(f"Session {index} could not start: {e.__class__.__name__}")
+            ready.set()
+            return
+        
+        try:
+            with self.auth_lock:
+                self.auth.authenticate(driver)
+            ready.set()
+            rng = random.Random(index)
+            names = list(self.mix)
+            weights = [self.mix[name] for name in names]
+            while not self.stop.is_set():
+                name = rng.choices(names, weights)[0]
+                stage = self.stage
+                start = time.perf_counter()
+                try:
+                    ok = bool(FLOWS[name](driver, factory))
+                except WebDriverException as e:
+                    logger.warning(f"Session {index}: {name} failed: {e.__class__.__name__}")
+                    ok = False
+                if stage is not None:
+                    with self.samples_lock:
+                        self.samples.append((stage, name, time.perf_counter() - start, ok))
+        except WebDriverException as e:
+            logger.error(f"Session {index} stopped: {e.__class__.__name__}")
+        finally:
+            ready.set()
+            try:
+                # Without a recording backend snapshot, the UI-created entities are deleted one by one
+                if not ledger.recording:
+                    factory.cleanup(driver)
+            except WebDriverException as e:
+                logger.warning(f"Session {index} left its entities behind: {e.__class__.__name__}")
+            finally:
+                self.pool.release(driver)
+    
+    @staticmethod
+    def _count_backups(api):
+        """Number of backups on the server, or None without an API"""
+        if api is None:
+            return None
+        try:
+            return len(api.fetch_all("backup"))
+        except requests.RequestException:
+            return None
+    
+    def summary(self):
+        """One row per stage and flow: count, errors, throughput and latency percentiles"""
+        grouped = {}
+        for stage, name, seconds, ok in self.samples:
+            grouped.setdefault((stage, name), []).append((seconds, ok))
+        rows = []
+        for (stage, name), results in sorted(grouped.items()):
+            info = self.stage_info[stage] if stage < len(self.stage_info) else {"sessions": self.stages[stage], "seconds": 0}
+            latencies = [seconds for seconds, ok in results if ok]
+            rows.append({
+                "stage": stage + 1,
+                "sessions": info["sessions"],
+                "flow": name,
+                "done": len(latencies),
+                "errors": len(results) - len(latencies),
+                "per_min": len(latencies) * 60 / info["seconds"] if info["seconds"] else 0.0,
+                "p50": percentile(latencies, 0.5),
+                "p95": percentile(latencies, 0.95),
+                "p99": percentile(latencies, 0.99),
+                "max": max(latencies, default=0.0),
+            })
+        return rows
+    
+    def save(self, rows, directory=None):
+        """Write stages, summary and raw samples as JSON; returns the path"""
+        directory = directory or TestConfig.PERF_DIR
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"load_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "mix": self.mix,
+                "stages": self.stage_info,
+                "summary": rows,
+                "samples": [
+                    {"stage": stage + 1, "flow": name, "seconds": round(seconds, 3), "ok": ok}
+                    for stage, name, seconds, ok in self.samples
+                ],
+            }, f, indent=1)
+        return path
+    
+    def print_summary(self, rows):
+        """Aligned table per stage, latencies in seconds"""
+        print(f"\n{Style.BRIGHT}{'stage':<6}{'sess':>5}  {'flow':<16}{'done':>6}{'err':>5}{'per min':>9}"
+              f"{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{Style.RESET_ALL}")
+        for row in rows:
+            color = Fore.RED if row["errors"] else ""
+            print(f"{row['stage']:<6}{row['sessions']:>5}  {row['flow']:<16}{row['done']:>6}"
+                  f"{color}{row['errors']:>5}{Style.RESET_ALL}{row['per_min']:>9.1f}"
+                  f"{row['p50']:>8.2f}{row['p95']:>8.2f}{row['p99']:>8.2f}{row['max']:>8.2f}")
+        for index, info in enumerate(self.stage_info):
+            if info["backups"] is not None:
+                print(f"{Fore.CYAN}Stage {index + 1}: {info['backups']} backups created in "
+                      f"{info['seconds']:.0f}s{Style.RESET_ALL}")
+
+
+def main(argv=None):
+    """Command line entry point (python run_tests.py load ...)"""
+    parser = argparse.ArgumentParser(prog="run_tests.py load", description="Concurrent editor load")
+    parser.add_argument("--stages", default=None, help="Sessions per stage, e.g. 1,2,4,8 (LOAD_STAGES)")
+    parser.add_argument("--stage-seconds", type=int, default=None, help="Length of each stage (LOAD_STAGE_SECONDS)")
+    parser.add_argument("--mix", default=None, help="Flow weights, e.g. create_blog=3,view_backup=4 (LOAD_MIX)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows")
+    args = parser.parse_args(argv)
+    
+    stages = [int(count) for count in args.stages.split(",")] if args.stages else None
+    mix = parse_mix(args.mix) if args.mix else None
+    load = LoadDriver(stages, args.stage_seconds, mix, headless=not args.headed)
+    
+    api = AdminApiClient()
+    snapshot = SessionSnapshot(api, load.run_id) if TestConfig.HERMETIC_BACKEND else None
+    try:
+        if snapshot is not None:
+            snapshot.start()
+        rows = load.run(api)
+    finally:
+        if snapshot is not None and snapshot.finish() is not None:
+            print(f"{Fore.CYAN}[SNAPSHOT] {SessionSnapshot.format_stats(snapshot.stats)}{Style.RESET_ALL}")
+        api.close()
+    
+    load.print_summary(rows)
+    print(f"\n{Fore.CYAN}[LOAD] Samples saved to {load.save(rows)}{Style.RESET_ALL}")
+    return 1 if any(row["errors"] for row in rows) else 0
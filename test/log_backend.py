@@ -0,0 +1,207 @@
+"""
+Leveled logging for page objects and fixtures: per-test ring buffers, a background JSONL sink
+"""
+import collections
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from config import TestConfig
+from colorama import Fore, Style
+
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40}
+
+LEVEL_COLORS = {
+    "DEBUG": Style.DIM,
+    "INFO": Fore.CYAN,
+    "SUCCESS": Fore.GREEN,
+    "WARNING": Fore.YELLOW,
+    "ERROR": Fore.RED,
+}
+
+
+class LogRecord:
+    """One log call"""
+    
+    __slots__ = ("ts", "level", "source", "message", "test")
+    
+    def __init__(self, ts, level, source, message, test):
+        self.ts = ts
+        self.level = level
+        self.source = source
+        self.message = message
+        self.test = test
+    
+    def as_dict(self):
+        """JSON-serialisable form"""
+        return {
+            "ts": self.ts,
+            "level": self.level,
+            "source": self.source,
+            "test": self.test,
+            "message": self.message,
+        }
+
+
+class PlainFormatter:
+    """"[TAG] message" lines; the tag is the source, or the level for untagged loggers"""
+    
+    def format(self, record):
+        tag = record.source or record.level
+        return f"[{tag}] {record.message}"
+
+
+class ColorFormatter(PlainFormatter):
+    """Plain lines colored by level"""
+    
+    def format(self, record):
+        return f"{LEVEL_COLORS[record.level]}{super().format(record)}{Style.RESET_ALL}"
+
+
+class JsonlSink:
+    """
+    Appends records to a JSONL file from a background thread.
+    
+    emit() only puts the record on a queue; encoding and file I/O never run
+    on the test's thread.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, path):
+        self.path = path
+        self.queue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._run, name="jsonl-log-sink", daemon=True)
+        self.thread.start()
+    
+    def emit(self, record):
+        """Queue a record for writing"""
+        self.queue.put(record)
+    
+    def close(self):
+        """Write everything queued so far and stop the thread"""
+        self.queue.put(self._STOP)
+        self.thread.join()
+    
+    def _run(self):
+        """Drain the queue in batches, flushing once per batch"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                record = self.queue.get()
+                while record is not self._STOP:
+                    f.write(json.dumps(record.as_dict()) + "\n")
+                    try:
+                        record = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                f.flush()
+                if record is self._STOP:
+                    return
+
+
+class LogBackend:
+    """
+    Routes log records of this process.
+    
+    While a test runs its records go to a ring buffer of the last
+    LOG_BUFFER_SIZE records, which conftest attaches to the report only
+    when the test fails. Records outside a test go straight to the console.
+    Every record also goes to the JSONL sink, if enabled. Only console
+    lines are colored; report sections and HTML output get plain text.
+    """
+    
+    def __init__(self, console_level=None, buffer_size=None, color=None, jsonl_path=None):
+        self.console_level = LEVELS[(console_level or TestConfig.LOG_LEVEL).upper()]
+        self.buffer_size = TestConfig.LOG_BUFFER_SIZE if buffer_size is None else buffer_size
+        use_color = TestConfig.LOG_COLOR if color is None else color
+        self.formatter = ColorFormatter() if use_color else PlainFormatter()
+        self.plain_formatter = PlainFormatter()
+        self.jsonl_path = jsonl_path
+        self.sink = None
+        self.test = None
+        self.buffer = collections.deque(maxlen=self.buffer_size or None)
+    
+    def emit(self, level, source, message):
+        """Record one message"""
+        record = LogRecord(time.time(), level, source, str(message), self.test)
+        if self.sink is not None:
+            self.sink.emit(record)
+        if self.test is not None and self.buffer_size:
+            self.buffer.append(record)
+        elif LEVELS[level] >= self.console_level:
+            print(self.formatter.format(record))
+    
+    def begin_test(self, nodeid):
+        """Buffer records from now on under this test"""
+        self.test = nodeid
+        self.buffer.clear()
+    
+    def end_test(self):
+        """Drop the test's buffer"""
+        self.test = None
+        self.buffer.clear()
+    
+    def buffered_text(self, min_level="DEBUG"):
+        """The current test's buffered records as plain text, for a failure report"""
+        threshold = LEVELS[min_level]
+        return "\n".join(
+            self.plain_formatter.format(record) for record in self.buffer if LEVELS[record.level] >= threshold
+        )
+    
+    def open_sink(self, path=None):
+        """Start writing every record to a JSONL file"""
+        if self.sink is None:
+            self.sink = JsonlSink(path or self.jsonl_path or self.default_jsonl_path())
+        return self.sink.path
+    
+    def close_sink(self):
+        """Flush and close the JSONL file"""
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+    
+    @staticmethod
+    def default_jsonl_path():
+        """One file per run and xdist worker"""
+        run_id = os.getenv("PYTEST_XDIST_TESTRUNUID", "")[:8] or datetime.now().strftime("%Y%m%d_%H%M%S")
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        return os.path.join(TestConfig.LOG_DIR, f"run_{run_id}_{worker}.jsonl")
+
+
+class Logger:
+    """Named entry point into the backend, e.g. Logger("POOL")"""
+    
+    def __init__(self, source=None):
+        self.source = source
+    
+    def debug(self, message):
+        """Log debug message"""
+        backend.emit("DEBUG", self.source, message)
+    
+    def info(self, message):
+        """Log info message"""
+        backend.emit("INFO", self.source, message)
+    
+    def success(self, message):
+        """Log success message"""
+        backend.emit("SUCCESS", self.source, message)
+    
+    def warning(self, message):
+        """Log warning message"""
+        backend.emit("WARNING", self.source, message)
+    
+    def error(self, message):
+        """Log error message"""
+        backend.emit("ERROR", self.source, message)
+
+
+backend = LogBackend()
+
+
+def get_logger(source=None):
+    """Logger whose console lines are tagged [source] (or [LEVEL] without one)"""
+    return Logger(source)
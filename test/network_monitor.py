@@ -0,0 +1,174 @@
+"""
+Per-session fetch/XHR tracking built on Chrome DevTools Protocol Network events
+"""
+import json
+import re
+import time
+import weakref
+from selenium.common.exceptions import WebDriverException
+from traffic import recorder as traffic_recorder
+
+
+TRACKED_TYPES = ("Fetch", "XHR")
+
+
+class NetworkRequest:
+    """One fetch/XHR call as seen by the browser"""
+    
+    def __init__(self, seq, request_id, url, method, started_at):
+        self.seq = seq
+        self.request_id = request_id
+        self.url = url
+        self.method = method
+        self.started_at = started_at
+        self.finished_at = None
+        self.status = None
+        self.server_ms = None
+        self.error = None
+        self.consumed = False
+        self.wall_time = None
+        self.post_data = None
+        self.has_post_data = False
+    
+    @property
+    def finished(self):
+        """Whether the response body has arrived or the request failed"""
+        return self.finished_at is not None
+    
+    @property
+    def failed(self):
+        """Whether the request failed at the network level"""
+        return self.error is not None
+    
+    @property
+    def duration_ms(self):
+        """Time from request start to last byte, as measured by the browser"""
+        if not self.finished:
+            return None
+        return (self.finished_at - self.started_at) * 1000
+    
+    def matches(self, url_pattern, method=None):
+        """Check URL regex and method (a name or a tuple of names)"""
+        if method:
+            methods = (method,) if isinstance(method, str) else tuple(method)
+            if self.method.upper() not in (m.upper() for m in methods):
+                return False
+        return re.search(url_pattern, self.url) is not None
+    
+    def describe(self):
+        """Short one-line summary for logs"""
+        if self.failed:
+            return f"{self.method} {self.url} failed: {self.error}"
+        server = f", server {self.server_ms:.0f}ms" if self.server_ms is not None else ""
+        return f"{self.method} {self.url} -> {self.status} in {self.duration_ms:.0f}ms{server}"
+
+
+class NetworkMonitor:
+    """
+    Tracks in-flight fetch/XHR requests of one WebDriver session.
+    
+    Events are read from Chrome's performance log, which has to be enabled
+    with the goog:loggingPrefs capability (see driver_pool.chrome_options).
+    Each poll drains the log and updates the request table.
+    """
+    
+    _monitors = weakref.WeakKeyDictionary()
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.requests = {}
+        self.seq = 0
+        self.last_activity = time.monotonic()
+        self.available = True
+    
+    @classmethod
+    def for_driver(cls, driver):
+        """Return the monitor attached to a session, creating it on first use"""
+        monitor = cls._monitors.get(driver)
+        if monitor is None:
+            monitor = cls._monitors[driver] = cls(driver)
+        return monitor
+    
+    def poll(self):
+        """Drain pending CDP events; returns False if the log is unavailable"""
+        if not self.available:
+            return False
+        try:
+            entries = self.driver.get_log("performance")
+        except (WebDriverException, AttributeError, ValueError):
+            self.available = False
+            return False
+        
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            self._handle(message["method"], message.get("params", {}))
+        return True
+    
+    def reset(self):
+        """Forget all requests, e.g. when a pooled session is handed to a new test"""
+        self.poll()
+        self.requests.clear()
+        self.last_activity = time.monotonic()
+    
+    def mark(self):
+        """Sequence number of the latest request; pass as `since` to ignore older ones"""
+        self.poll()
+        return self.seq
+    
+    def in_flight(self):
+        """Tracked requests that have not finished yet"""
+        return [r for r in self.requests.values() if not r.finished]
+    
+    def find(self, url_pattern, method=None, since=0):
+        """Oldest unconsumed request newer than `since` matching the pattern"""
+        candidates = [
+            r for r in self.requests.values()
+            if r.seq > since and not r.consumed and r.matches(url_pattern, method)
+        ]
+        return min(candidates, key=lambda r: r.seq) if candidates else None
+    
+    def _handle(self, method, params):
+        """Update the request table from a single CDP event"""
+        if method == "Network.requestWillBeSent":
+            if params.get("type") not in TRACKED_TYPES:
+                return
+            request = self.requests.get(params["requestId"])
+            if request is None:
+                self.seq += 1
+                request = NetworkRequest(
+                    self.seq,
+                    params["requestId"],
+                    params["request"]["url"],
+                    params["request"]["method"],
+                    params["timestamp"]
+                )
+                request.wall_time = params.get("wallTime")
+                request.post_data = params["request"].get("postData")
+                request.has_post_data = params["request"].get("hasPostData", False)
+                self.requests[params["requestId"]] = request
+            else:
+                # Redirect: same request id, new URL
+                request.url = params["request"]["url"]
+            self.last_activity = time.monotonic()
+            return
+        
+        request = self.requests.get(params.get("requestId"))
+        if request is None:
+            return
+        
+        if method == "Network.responseReceived":
+            response = params["response"]
+            request.status = response.get("status")
+            timing = response.get("timing")
+            if timing and timing.get("sendEnd", -1) >= 0:
+                request.server_ms = timing["receiveHeadersEnd"] - timing["sendEnd"]
+        elif method == "Network.loadingFinished":
+            request.finished_at = params["timestamp"]
+            if traffic_recorder.enabled:
+                traffic_recorder.record_browser(self.driver, request)
+        elif method == "Network.loadingFailed":
+            request.finished_at = params["timestamp"]
+            request.error = params.get("errorText") or "failed"
+        else:
+            return
+        self.last_activity = time.monotonic()
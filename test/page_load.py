@@ -0,0 +1,437 @@
+"""
+Page-load benchmark: Navigation Timing, paint metrics and data readiness per admin route
+"""
+import json
+import math
+import os
+import re
+import statistics
+import time
+from datetime import datetime
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from config import TestConfig
+from history import percentile
+from log_backend import get_logger
+
+
+logger = get_logger("PERF")
+
+# Route names of scaling benchmarks: page object and data set size, e.g. BackupsPage[1000]
+SCALED_ROUTE_RE = re.compile(r"^(?P<route>\w+)\[(?P<size>\d+)\]$")
+
+# Metrics of one page load, in milliseconds since navigation start;
+# "populated" is only measured when the probe counts rows
+METRICS = ("ttfb", "dom_content_loaded", "load", "fcp", "lcp", "data_ready", "populated")
+
+# Metrics of interactions on a loaded page, in milliseconds since the user event;
+# search_<class> are keystroke-to-results latencies of a query class
+INTERACTION_METRICS = ("next_page", "search", "search_prefix", "search_exact", "search_no_match", "search_unicode")
+
+# Installed before the document loads: records paint entries, the moment
+# the page's ready element first appears and, when counting, the moment
+# the number of ready elements last grew
+PAGE_LOAD_OBSERVER_JS = """
+(function (by, value, countRows) {
+    var state = window.__pageLoad = {fcp: null, lcp: null, ready: null, populated: null, rows: 0};
+    function find() {
+        if (by === 'xpath') {
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        if (by === 'id') { return document.getElementById(value); }
+        if (by === 'class name') { return document.getElementsByClassName(value)[0]; }
+        return document.querySelector(value);
+    }
+    function count() {
+        if (by === 'xpath') {
+            return document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+        }
+        if (by === 'class name') { return document.getElementsByClassName(value).length; }
+        return document.querySelectorAll(by === 'id' ? '#' + CSS.escape(value) : value).length;
+    }
+    function check() {
+        if (state.ready === null && find()) {
+            state.ready = performance.now();
+            if (!countRows) { observer.disconnect(); }
+        }
+        if (countRows && state.ready !== null) {
+            var rows = count();
+            if (rows > state.rows) {
+                state.rows = rows;
+                state.populated = performance.now();
+            }
+        }
+    }
+    var observer = new MutationObserver(check);
+    observer.observe(document, {childList: true, subtree: true});
+    new PerformanceObserver(function (list) {
+        list.getEntries().forEach(function (entry) {
+            if (entry.name === 'first-contentful-paint') { state.fcp = entry.startTime; }
+        });
+    }).observe({type: 'paint', buffered: true});
+    new PerformanceObserver(function (list) {
+        var entries = list.getEntries();
+        state.lcp = entries[entries.length - 1].startTime;
+    }).observe({type: 'largest-contentful-paint', buffered: true});
+})
+"""
+
+PAGE_LOAD_METRICS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var state = window.__pageLoad;
+if (!nav || !state || nav.loadEventEnd === 0 || state.ready === null) { return null; }
+return {
+    ttfb: nav.responseStart,
+    dom_content_loaded: nav.domContentLoadedEventEnd,
+    load: nav.loadEventEnd,
+    fcp: state.fcp,
+    lcp: state.lcp,
+    data_ready: state.ready,
+    populated: state.populated,
+    rows: state.rows,
+    transfer_kb: nav.transferSize / 1024
+};
+"""
+
+# Row count once it has not grown for arguments[0] milliseconds
+PAGE_LOAD_SETTLED_JS = """
+var state = window.__pageLoad;
+if (!state || state.populated === null || performance.now() - state.populated < arguments[0]) { return null; }
+return {populated: state.populated, rows: state.rows};
+"""
+
+# Armed before an interaction: records the time stamp of the next event of
+# the given type and the moment the first ready element's text changes,
+# or, with an expected text, first contains it
+INTERACTION_OBSERVER_JS = """
+var eventType = arguments[0], by = arguments[1], value = arguments[2], expected = arguments[3];
+function first() {
+    var row;
+    if (by === 'xpath') {
+        row = document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } else if (by === 'id') {
+        row = document.getElementById(value);
+    } else if (by === 'class name') {
+        row = document.getElementsByClassName(value)[0];
+    } else {
+        row = document.querySelector(value);
+    }
+    return row ? row.textContent : null;
+}
+var state = window.__interaction = {start: null, changed: null, before: first()};
+function check() {
+    if (state.start === null || state.changed !== null) { return; }
+    var text = first();
+    if (expected ? text !== null && text.indexOf(expected) !== -1 : text !== state.before) {
+        state.changed = performance.now();
+        observer.disconnect();
+    }
+}
+var observer = new MutationObserver(check);
+observer.observe(document, {childList: true, subtree: true, characterData: true});
+document.addEventListener(eventType, function (event) {
+    state.start = event.timeStamp;
+    check();
+}, {capture: true, once: true});
+"""
+
+INTERACTION_RESULT_JS = """
+var state = window.__interaction;
+if (!state || state.start === null || state.changed === null) { return null; }
+return {elapsed: state.changed - state.start};
+"""
+
+# Armed before typing: records the time stamp of the latest input event
+# and the moment the document last changed after the first one
+SEARCH_OBSERVER_JS = """
+var state = window.__search = {input: null, inputs: 0, changed: null};
+function onInput(event) {
+    state.input = event.timeStamp;
+    state.inputs += 1;
+}
+var observer = new MutationObserver(function () {
+    if (state.input !== null) { state.changed = performance.now(); }
+});
+observer.observe(document, {childList: true, subtree: true, characterData: true});
+document.addEventListener('input', onInput, true);
+state.stop = function () {
+    observer.disconnect();
+    document.removeEventListener('input', onInput, true);
+};
+"""
+
+# Search results once neither input nor document changed for arguments[0] milliseconds
+SEARCH_SETTLED_JS = """
+var state = window.__search;
+if (!state || state.input === null) { return null; }
+if (performance.now() - Math.max(state.input, state.changed || 0) < arguments[0]) { return null; }
+state.stop();
+var changed = state.changed !== null && state.changed > state.input;
+return {latency: changed ? state.changed - state.input : 0, changed: changed, keys: state.inputs};
+"""
+
+PAGE_LOAD_PARTIAL_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var state = window.__pageLoad || {};
+return nav ? {
+    ttfb: nav.responseStart,
+    dom_content_loaded: nav.domContentLoadedEventEnd || null,
+    load: nav.loadEventEnd || null,
+    fcp: state.fcp || null,
+    lcp: state.lcp || null,
+    data_ready: null,
+    populated: null,
+    transfer_kb: nav.transferSize / 1024
+} : null;
+"""
+
+
+class PageLoadProbe:
+    """
+    Loads a page object's URL and reads its load metrics from the browser.
+    
+    "cold" clears the HTTP cache before every load; "warm" primes the cache
+    with one unmeasured load first. Cookies and storage are kept, so an
+    authenticated session stays logged in.
+    
+    With count_rows, each load also waits until the number of ready
+    elements has stopped growing for PERF_SETTLE_MS and reports when it
+    last grew ("populated") and how many there were ("rows").
+    
+    interaction() times a click or input on the loaded page in the browser:
+    from the event's time stamp to the mutation that changed the first
+    ready element, so WebDriver round trips are not part of the result.
+    search() likewise times from the final keystroke of a query until the
+    page has stopped changing.
+    """
+    
+    def __init__(self, driver, timeout=None):
+        self.driver = driver
+        self.timeout = timeout or TestConfig.PERF_READY_TIMEOUT
+    
+    def measure(self, page, mode="cold", iterations=None, count_rows=False):
+        """
+        Load a page repeatedly
+        
+        Args:
+            page: Page object with url and READY locator
+            mode: "cold" or "warm"
+            iterations: Measured loads (defaults to PERF_ITERATIONS)
+            count_rows: Also measure until the READY elements stop growing
+        
+        Returns:
+            List of metric dicts, one per load
+        """
+        iterations = iterations or TestConfig.PERF_ITERATIONS
+        script_id = self._install_observer(page.READY, count_rows)
+        try:
+            if mode == "warm":
+                self.load(page, count_rows)
+            samples = []
+            for _ in range(iterations):
+                if mode == "cold":
+                    self._cdp("Network.clearBrowserCache")
+                samples.append(self.load(page, count_rows))
+            return samples
+        finally:
+            if script_id:
+                self._cdp("Page.removeScriptToEvaluateOnNewDocument", identifier=script_id)
+    
+    def load(self, page, count_rows=False):
+        """Navigate once and wait for the ready element and the load event"""
+        self.driver.get(page.url)
+        wait = WebDriverWait(self.driver, self.timeout, poll_frequency=0.05)
+        try:
+            sample = wait.until(lambda driver: driver.execute_script(PAGE_LOAD_METRICS_JS))
+        except (TimeoutException, JavascriptException):
+            logger.warning(f"{type(page).__name__} not ready after {self.timeout}s: {page.READY}")
+            return self.driver.execute_script(PAGE_LOAD_PARTIAL_JS) or {}
+        if count_rows:
+            try:
+                sample.update(wait.until(
+                    lambda driver: driver.execute_script(PAGE_LOAD_SETTLED_JS, TestConfig.PERF_SETTLE_MS)
+                ))
+            except (TimeoutException, JavascriptException):
+                logger.warning(f"{type(page).__name__} rows still growing after {self.timeout}s")
+        return sample
+    
+    def interaction(self, page, event, action, expected=None):
+        """
+        Time one interaction on the loaded page
+        
+        Args:
+            page: Page object with a READY locator
+            event: DOM event the action starts with, e.g. "click" or "input"
+            action: Callable performing the interaction
+            expected: Text the first READY element must contain; by default
+                any change of its text ends the interaction
+        
+        Returns:
+            Milliseconds from the event until the first READY element
+            changed, or None if it did not change within the timeout
+        """
+        by, value = page.READY
+        self.driver.execute_script(INTERACTION_OBSERVER_JS, event, by, value, expected)
+        action()
+        try:
+            result = WebDriverWait(self.driver, self.timeout, poll_frequency=0.05).until(
+                lambda driver: driver.execute_script(INTERACTION_RESULT_JS)
+            )
+        except (TimeoutException, JavascriptException):
+            logger.warning(f"{type(page).__name__} did not respond to {event} within {self.timeout}s")
+            return None
+        return result["elapsed"]
+    
+    def search(self, page, query):
+        """
+        Type a query into the page's search input and time the results
+        
+        The input is emptied first and the page left to settle. The query
+        is then typed with real keystrokes; queries with characters outside
+        the BMP, which ChromeDriver cannot type, are set by script in one
+        input event.
+        
+        Args:
+            page: Page object with a SEARCH_INPUT locator
+            query: Text to search for
+        
+        Returns:
+            Dict with "latency" (ms from the final keystroke until the page
+            last changed, 0 if it no longer changed after it), "changed"
+            and "keys", or None if the page did not settle within the timeout
+        """
+        if self._settled_search(page, lambda: page.fill_form({page.SEARCH_INPUT: ""})) is None:
+            return None
+        if any(ord(char) > 0xFFFF for char in query):
+            return self._settled_search(page, lambda: page.fill_form({page.SEARCH_INPUT: query}))
+        return self._settled_search(page, lambda: page.type_text(page.SEARCH_INPUT, query, clear_first=False))
+    
+    def _settled_search(self, page, action):
+        """Run an input action and wait until the page stops changing"""
+        self.driver.execute_script(SEARCH_OBSERVER_JS)
+        action()
+        try:
+            return WebDriverWait(self.driver, self.timeout, poll_frequency=0.05).until(
+                lambda driver: driver.execute_script(SEARCH_SETTLED_JS, TestConfig.PERF_SETTLE_MS)
+            )
+        except (TimeoutException, JavascriptException):
+            logger.warning(f"{type(page).__name__} search results still changing after {self.timeout}s")
+            return None
+    
+    def _install_observer(self, ready, count_rows=False):
+        """Run the observer in every new document; returns the script id"""
+        by, value = ready
+        result = self._cdp(
+            "Page.addScriptToEvaluateOnNewDocument",
+            source=f"{PAGE_LOAD_OBSERVER_JS}({json.dumps(by)}, {json.dumps(value)}, {json.dumps(count_rows)});"
+        )
+        return result.get("identifier") if result else None
+    
+    def _cdp(self, command, **params):
+        """Run a CDP command, returning None if the browser does not support it"""
+        try:
+            return self.driver.execute_cdp_cmd(command, params)
+        except (WebDriverException, AttributeError):
+            return None
+
+
+class PageLoadRecorder:
+    """
+    Page-load samples of a run, with per route/mode/metric statistics.
+    
+    Workers ship their samples to the controller, which prints the
+    summary and saves samples and summary to reports/perf/.
+    """
+    
+    def __init__(self):
+        self.samples = []
+    
+    def add(self, route, mode, samples):
+        """Record the loads of one route in one cache mode"""
+        for sample in samples:
+            self.samples.append({"route": route, "mode": mode, **sample})
+    
+    def summary(self):
+        """One row per route, mode and metric: n, mean, median, p95, variance"""
+        grouped = {}
+        for sample in self.samples:
+            for metric in METRICS + INTERACTION_METRICS:
+                if sample.get(metric) is not None:
+                    grouped.setdefault((sample["route"], sample["mode"], metric), []).append(sample[metric])
+        return [
+            {
+                "route": route,
+                "mode": mode,
+                "metric": metric,
+                "n": len(values),
+                "mean": statistics.fmean(values),
+                "median": statistics.median(values),
+                "p95": percentile(values, 0.95),
+                "variance": statistics.variance(values) if len(values) > 1 else 0.0,
+            }
+            for (route, mode, metric), values in grouped.items()
+        ]
+    
+    def save(self, directory=None):
+        """Write samples and summary as JSON; returns the path"""
+        directory = directory or TestConfig.PERF_DIR
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"page_load_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"time": time.time(), "samples": self.samples, "summary": self.summary()}, f, indent=2)
+        return path
+    
+    def scaling(self, metrics=("load", "data_ready", "populated") + INTERACTION_METRICS):
+        """
+        Latency growth of routes measured at several data set sizes
+        
+        The exponent between two sizes is log(t2 / t1) / log(n2 / n1) of the
+        median times: about 0 for constant cost, 1 for linear growth.
+        
+        Returns:
+            Rows with route, mode, metric, size, median and the exponent
+            from the previous size (None for the smallest)
+        """
+        medians = {}
+        for row in self.summary():
+            match = SCALED_ROUTE_RE.match(row["route"])
+            if match and row["metric"] in metrics:
+                key = (match["route"], row["mode"], row["metric"])
+                medians.setdefault(key, []).append((int(match["size"]), row["median"]))
+        rows = []
+        for (route, mode, metric), points in sorted(medians.items()):
+            previous = None
+            for size, median in sorted(points):
+                exponent = None
+                if previous and previous[1] > 0 and median > 0:
+                    exponent = math.log(median / previous[1]) / math.log(size / previous[0])
+                rows.append({"route": route, "mode": mode, "metric": metric, "size": size,
+                             "median": median, "exponent": exponent})
+                previous = (size, median)
+        return rows
+    
+    @staticmethod
+    def format_scaling(rows):
+        """Aligned text table of scaling rows"""
+        lines = [f"{'route':<20}{'mode':<6}{'metric':<16}{'size':>8}{'median':>10}{'growth':>10}"]
+        for row in rows:
+            growth = f"n^{row['exponent']:.2f}" if row["exponent"] is not None else ""
+            lines.append(
+                f"{row['route']:<20}{row['mode']:<6}{row['metric']:<16}{row['size']:>8}"
+                f"{row['median']:>10.1f}{growth:>10}"
+            )
+        return lines
+    
+    @staticmethod
+    def format_summary(rows):
+        """Aligned text table of summary rows, in milliseconds"""
+        lines = [f"{'route':<20}{'mode':<6}{'metric':<20}{'n':>4}{'mean':>10}{'median':>10}{'p95':>10}{'variance':>12}"]
+        for row in sorted(rows, key=lambda row: (row["route"], row["mode"], (METRICS + INTERACTION_METRICS).index(row["metric"]))):
+            lines.append(
+                f"{row['route']:<20}{row['mode']:<6}{row['metric']:<20}{row['n']:>4}"
+                f"{row['mean']:>10.1f}{row['median']:>10.1f}{row['p95']:>10.1f}{row['variance']:>12.1f}"
+            )
+        return lines
+
+
+recorder = PageLoadRecorder()
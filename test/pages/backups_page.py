@@ -1,10 +1,70 @@
 """
 Page Object Model for Backups Page
 """
+from datetime import datetime, timezone
 from selenium.webdriver.common.by import By
 from base_page import BasePage
 from config import TestConfig
-import time
+from timing import timed
+
+
+# Formats the backup date column may be rendered in, tried after ISO 8601
+BACKUP_DATE_FORMATS = (
+    "%m/%d/%Y, %I:%M:%S %p",
+    "%m/%d/%Y, %H:%M:%S",
+    "%m/%d/%Y %I:%M:%S %p",
+    "%m/%d/%Y %H:%M:%S",
+    "%b %d, %Y, %I:%M:%S %p",
+    "%b %d, %Y, %I:%M %p",
+    "%B %d, %Y at %I:%M:%S %p",
+    "%d/%m/%Y, %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%m/%d/%Y",
+)
+
+
+def parse_backup_date(text, formats=BACKUP_DATE_FORMATS):
+    """Datetime shown in a backup date cell, or None if it is not a valid date"""
+    # toLocaleString() separates AM/PM with a narrow no-break space
+    text = " ".join((text or "").split())
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        parsed = None
+    for date_format in formats:
+        if parsed is not None:
+            break
+        try:
+            parsed = datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+    if parsed is not None and parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def parse_backup_dates(texts):
+    """
+    Datetimes of a whole date column, None for cells that are not valid dates
+    
+    A column is rendered in one locale, but a cell like 03/04/2025 parses
+    as both month/day and day/month. The column is read with the first
+    format that parses every non-ISO cell, so en-GB dates are not read as
+    en-US ones wherever the day happens to be 12 or less. Only if no single
+    format fits are the cells parsed one by one.
+    """
+    texts = list(texts)
+    formats = BACKUP_DATE_FORMATS
+    # Cells only parsed as ISO 8601 need no locale format
+    localized = [text for text in texts if parse_backup_date(text) and not parse_backup_date(text, ())]
+    for date_format in BACKUP_DATE_FORMATS:
+        if localized and all(parse_backup_date(text, (date_format,)) for text in localized):
+            formats = (date_format,)
+            break
+    return [parse_backup_date(text, formats) for text in texts]
 
 
 class BackupsPage(BasePage):
@@ -26,6 +86,9 @@ class BackupsPage(BasePage):
     DIALOG = (By.CSS_SELECTOR, "[role='dialog']")
     DIALOG_CLOSE = (By.CSS_SELECTOR, "[role='dialog'] button[aria-label='Close']")
     
+    # Ready once the first backup row has rendered
+    READY = TABLE_ROWS
+    
     def __init__(self, driver):
         super().__init__(driver)
         self.url = TestConfig.ADMIN_URL + "/backups"
@@ -37,18 +100,14 @@ class BackupsPage(BasePage):
     
     def get_backup_count(self):
         """Get number of backups in table"""
-        rows = self.find_elements(self.TABLE_ROWS)
-        count = len(rows)
+        count = len(self.table_snapshot(self.TABLE, with_actions=False))
         self.log(f"Found {count} backups")
         return count
     
+    @timed("action")
     def click_view_on_first_backup(self):
         """Click view button on first backup"""
-        rows = self.find_elements(self.TABLE_ROWS)
-        if rows:
-            first_row = rows[0]
-            view_btn = first_row.find_element(By.XPATH, ".//button[contains(., 'View')]")
-            view_btn.click()
+        if self.click_row_action(0, "View", self.TABLE):
             self.wait_for_visible(self.DIALOG, timeout=5)
             self.log("Clicked View on first backup")
             return True
@@ -56,6 +115,14 @@ class BackupsPage(BasePage):
             self.log_warning("No backups found to view")
             return False
     
+    def get_latest_backup_filename(self):
+        """Filename shown in the first backup row"""
+        snapshot = self.table_snapshot(self.TABLE, with_actions=False)
+        if not snapshot.rows:
+            return None
+        column = "filename" if snapshot.has_column("filename") else 0
+        return snapshot.row(0).get(column)
+    
     def is_dialog_open(self):
         """Check if dialog is open"""
         return self.is_element_visible(self.DIALOG, timeout=2)
@@ -70,8 +137,7 @@ class BackupsPage(BasePage):
     def verify_backup_table_headers(self):
         """Verify backup table has required headers"""
         self.log("Verifying backup table headers...")
-        headers = self.find_elements(self.TABLE_HEADER)
-        header_texts = [h.text.lower() for h in headers]
+        header_texts = [h.lower() for h in self.table_snapshot(self.TABLE, with_actions=False).headers]
         
         expected = ["filename", "date", "size"]
         results = {}
@@ -86,29 +152,48 @@ class BackupsPage(BasePage):
         
         return results
     
+    def check_backup_order(self):
+        """
+        Parse the date of every backup row, read in one table snapshot
+        
+        Returns:
+            Dict with the row count, "invalid" (index, text) pairs of dates
+            that do not parse and "out_of_order" (index, previous text, text)
+            triples where a row is newer than the valid row above it
+        """
+        snapshot = self.table_snapshot(self.TABLE, with_actions=False)
+        # Second column if there is no Date header
+        date_column = "date" if snapshot.has_column("date") else 1
+        invalid, out_of_order = [], []
+        previous_date, previous_text = None, None
+        texts = snapshot.column(date_column)
+        for index, (text, parsed) in enumerate(zip(texts, parse_backup_dates(texts))):
+            if parsed is None:
+                invalid.append((index, text))
+                continue
+            if previous_date is not None and parsed > previous_date:
+                out_of_order.append((index, previous_text, text))
+            previous_date, previous_text = parsed, text
+        return {"rows": len(snapshot), "invalid": invalid, "out_of_order": out_of_order}
+    
     def verify_backups_sorted_latest_first(self):
-        """Verify backups are sorted with latest first"""
+        """Verify every backup date is valid and the list is sorted latest first"""
         self.log("Verifying backups are sorted (latest first)...")
-        rows = self.find_elements(self.TABLE_ROWS)
+        result = self.check_backup_order()
         
-        if len(rows) < 2:
+        if result["rows"] < 2:
             self.log_warning("Not enough backups to verify sorting")
-            return True
-        
-        # Get dates from first two rows
-        first_date_cell = rows[0].find_elements(By.TAG_NAME, "td")[1]  # Assuming date is second column
-        second_date_cell = rows[1].find_elements(By.TAG_NAME, "td")[1]
-        
-        first_date_text = first_date_cell.text
-        second_date_text = second_date_cell.text
-        
-        self.log(f"First backup date: {first_date_text}")
-        self.log(f"Second backup date: {second_date_text}")
         
-        # Check if dates are valid (not "Invalid Date")
-        if "invalid" in first_date_text.lower() or "invalid" in second_date_text.lower():
-            self.log_error("✗ Invalid date found in backups")
+        for index, text in result["invalid"][:5]:
+            self.log_error(f"✗ Row {index}: invalid date '{text}'")
+        for index, previous, text in result["out_of_order"][:5]:
+            self.log_error(f"✗ Row {index}: '{text}' is newer than the row above ('{previous}')")
+        if result["invalid"] or result["out_of_order"]:
+            self.log_error(
+                f"✗ {len(result['invalid'])} invalid dates, {len(result['out_of_order'])} rows out of order "
+                f"in {result['rows']} backups"
+            )
             return False
         
-        self.log_success("✓ Dates are valid")
+        self.log_success(f"✓ {result['rows']} backup dates valid and sorted latest first")
         return True
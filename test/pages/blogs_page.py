@@ -3,8 +3,9 @@ Page Object Model for Blogs Page
 """
 from selenium.webdriver.common.by import By
 from base_page import BasePage
+from backend_snapshot import ledger
 from config import TestConfig
-import time
+from timing import timed
 
 
 class BlogsPage(BasePage):
@@ -39,6 +40,20 @@ class BlogsPage(BasePage):
     IMAGE_INPUT = (By.ID, "image")
     CONTENT_TEXTAREA = (By.ID, "content")
     
+    # Form field locators keyed by blog data field, in fill order
+    FORM_FIELDS = {
+        "title": TITLE_INPUT,
+        "slug": SLUG_INPUT,
+        "excerpt": EXCERPT_TEXTAREA,
+        "date": DATE_INPUT,
+        "category": CATEGORY_INPUT,
+        "author": AUTHOR_INPUT,
+        "readTime": READ_TIME_INPUT,
+        "tags": TAGS_INPUT,
+        "image": IMAGE_INPUT,
+        "content": CONTENT_TEXTAREA,
+    }
+    
     # Action Buttons
     SAVE_BUTTON = (By.XPATH, "//button[contains(text(), 'Save') or contains(text(), 'Create') or contains(text(), 'Update')]")
     CANCEL_BUTTON = (By.XPATH, "//button[contains(text(), 'Cancel')]")
@@ -54,6 +69,9 @@ class BlogsPage(BasePage):
     NEXT_PAGE = (By.XPATH, "//button[contains(@aria-label, 'Next') or contains(., 'Next')]")
     PREV_PAGE = (By.XPATH, "//button[contains(@aria-label, 'Previous') or contains(., 'Previous')]")
     
+    # Ready once the first blog row has rendered
+    READY = TABLE_ROWS
+    
     def __init__(self, driver):
         super().__init__(driver)
         self.url = TestConfig.ADMIN_URL + "/blogs"
@@ -63,6 +81,7 @@ class BlogsPage(BasePage):
         super().navigate(self.url)
         self.log("Navigated to Blogs Page")
     
+    @timed("action")
     def click_add_blog(self):
         """Click Add Blog button"""
         self.click(self.ADD_BLOG_BUTTON)
@@ -84,60 +103,31 @@ class BlogsPage(BasePage):
         """Fill blog form with data"""
         self.log("Filling blog form...")
         
-        if "title" in blog_data:
-            self.type_text(self.TITLE_INPUT, blog_data["title"])
-            self.log(f"Entered title: {blog_data['title']}")
-        
-        if "slug" in blog_data:
-            self.type_text(self.SLUG_INPUT, blog_data["slug"])
-            self.log(f"Entered slug: {blog_data['slug']}")
-        
-        if "excerpt" in blog_data:
-            self.type_text(self.EXCERPT_TEXTAREA, blog_data["excerpt"])
-            self.log(f"Entered excerpt")
-        
-        if "date" in blog_data:
-            self.type_text(self.DATE_INPUT, blog_data["date"])
-            self.log(f"Entered date: {blog_data['date']}")
-        
-        if "category" in blog_data:
-            self.type_text(self.CATEGORY_INPUT, blog_data["category"])
-            self.log(f"Entered category: {blog_data['category']}")
-        
-        if "author" in blog_data:
-            self.type_text(self.AUTHOR_INPUT, blog_data["author"])
-            self.log(f"Entered author: {blog_data['author']}")
-        
-        if "readTime" in blog_data:
-            self.type_text(self.READ_TIME_INPUT, str(blog_data["readTime"]))
-            self.log(f"Entered read time: {blog_data['readTime']}")
-        
-        if "tags" in blog_data:
-            tags_str = ",".join(blog_data["tags"]) if isinstance(blog_data["tags"], list) else blog_data["tags"]
-            self.type_text(self.TAGS_INPUT, tags_str)
-            self.log(f"Entered tags: {tags_str}")
+        data = dict(blog_data)
+        if isinstance(data.get("tags"), list):
+            data["tags"] = ",".join(data["tags"])
         
-        if "image" in blog_data:
-            self.type_text(self.IMAGE_INPUT, blog_data["image"])
-            self.log(f"Entered image: {blog_data['image']}")
-        
-        if "content" in blog_data:
-            self.type_text(self.CONTENT_TEXTAREA, blog_data["content"])
-            self.log(f"Entered content")
+        self.fill_form({
+            locator: data[key] for key, locator in self.FORM_FIELDS.items() if key in data
+        })
         
         self.log_success("Blog form filled successfully")
     
+    @timed("action")
     def click_save(self):
-        """Click save button"""
-        self.click(self.SAVE_BUTTON)
-        self.log("Clicked Save button")
-        time.sleep(1)  # Wait for save operation
+        """Click save button and wait for the save request to finish"""
+        with ledger.write():
+            since = self.network.mark()
+            self.click(self.SAVE_BUTTON)
+            self.log("Clicked Save button")
+            return self.wait_for_save_request(since, replaces=1)
     
     def click_cancel(self):
         """Click cancel button"""
         self.click(self.CANCEL_BUTTON)
         self.log("Clicked Cancel button")
     
+    @timed("action")
     def create_blog(self, blog_data):
         """Complete flow to create a blog"""
         self.click_add_blog()
@@ -153,25 +143,29 @@ class BlogsPage(BasePage):
     
     def get_table_row_count(self):
         """Get number of rows in table"""
-        rows = self.find_elements(self.TABLE_ROWS)
-        count = len(rows)
+        count = len(self.table_snapshot(self.TABLE, with_actions=False))
         self.log(f"Table has {count} rows")
         return count
     
+    @timed("action")
     def search_blog(self, search_text):
         """Search for blog"""
         if self.is_element_present(self.SEARCH_INPUT, timeout=2):
             self.type_text(self.SEARCH_INPUT, search_text)
             self.log(f"Searched for: {search_text}")
-            time.sleep(1)  # Wait for filter
+            self.wait_for_dom_quiet(replaces=1)
+    
+    def has_next_page(self):
+        """Check if the Next page button exists and is enabled"""
+        if not self.is_element_present(self.NEXT_PAGE, timeout=2):
+            return False
+        element = self.find_element(self.NEXT_PAGE)
+        return element.is_enabled() and element.get_attribute("aria-disabled") != "true"
     
+    @timed("action")
     def click_edit_on_first_row(self):
         """Click edit button on first row"""
-        rows = self.find_elements(self.TABLE_ROWS)
-        if rows:
-            first_row = rows[0]
-            edit_btn = first_row.find_element(By.XPATH, ".//button[contains(@aria-label, 'Edit') or contains(., 'Edit')]")
-            edit_btn.click()
+        if self.click_row_action(0, "Edit", self.TABLE):
             self.wait_for_visible(self.DIALOG, timeout=5)
             self.log("Clicked Edit on first row")
             return True
@@ -179,15 +173,23 @@ class BlogsPage(BasePage):
             self.log_warning("No rows found to edit")
             return False
     
+    def click_edit_on_row(self, value):
+        """Click edit button on the row containing value"""
+        row = self.find_table_row(value, table_locator=self.TABLE)
+        if row and self.click_row_action(row.index, "Edit", self.TABLE):
+            self.wait_for_visible(self.DIALOG, timeout=5)
+            self.log(f"Clicked Edit on row: {value}")
+            return True
+        else:
+            self.log_warning(f"No row found to edit: {value}")
+            return False
+    
+    @timed("action")
     def click_delete_on_first_row(self):
         """Click delete button on first row"""
-        rows = self.find_elements(self.TABLE_ROWS)
-        if rows:
-            first_row = rows[0]
-            delete_btn = first_row.find_element(By.XPATH, ".//button[contains(@aria-label, 'Delete') or contains(., 'Delete')]")
-            delete_btn.click()
+        if self.click_row_action(0, "Delete", self.TABLE):
             self.log("Clicked Delete on first row")
-            time.sleep(1)
+            self.wait_for_dom_quiet(replaces=1)
             return True
         else:
             self.log_warning("No rows found to delete")
@@ -195,8 +197,7 @@ class BlogsPage(BasePage):
     
     def verify_blog_in_table(self, title):
         """Verify blog exists in table"""
-        locator = (By.XPATH, f"//td[contains(text(), '{title}')]")
-        exists = self.is_element_present(locator, timeout=5)
+        exists = self.find_table_row(title, timeout=5, table_locator=self.TABLE) is not None
         if exists:
             self.log_success(f"✓ Blog '{title}' found in table")
         else:
@@ -4,6 +4,7 @@ Page Object Model for Dashboard/Common Navigation
 from selenium.webdriver.common.by import By
 from base_page import BasePage
 from config import TestConfig
+from timing import timed
 
 
 class DashboardPage(BasePage):
@@ -30,6 +31,9 @@ class DashboardPage(BasePage):
     # Toast Notifications
     TOAST = (By.CSS_SELECTOR, "[class*='toast'], [role='status']")
     
+    # Ready once the sidebar has rendered
+    READY = SIDEBAR
+    
     def __init__(self, driver):
         super().__init__(driver)
         self.url = TestConfig.ADMIN_URL
@@ -103,6 +107,7 @@ class DashboardPage(BasePage):
         self.wait_for_page_load()
         self.log("Navigated to Backups")
     
+    @timed("action")
     def toggle_theme(self):
         """Toggle dark/light theme"""
         self.click(self.THEME_TOGGLE)
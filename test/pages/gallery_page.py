@@ -3,8 +3,9 @@ Page Object Model for Gallery Page
 """
 from selenium.webdriver.common.by import By
 from base_page import BasePage
+from backend_snapshot import ledger
 from config import TestConfig
-import time
+from timing import timed
 
 
 class GalleryPage(BasePage):
@@ -29,10 +30,22 @@ class GalleryPage(BasePage):
     TITLE_INPUT = (By.ID, "title")
     CATEGORY_INPUT = (By.ID, "category")
     
+    # Form field locators keyed by gallery data field, in fill order
+    FORM_FIELDS = {
+        "id": ID_INPUT,
+        "src": SRC_INPUT,
+        "alt": ALT_INPUT,
+        "title": TITLE_INPUT,
+        "category": CATEGORY_INPUT,
+    }
+    
     # Action Buttons
     SAVE_BUTTON = (By.XPATH, "//button[contains(text(), 'Save') or contains(text(), 'Create') or contains(text(), 'Update')]")
     CANCEL_BUTTON = (By.XPATH, "//button[contains(text(), 'Cancel')]")
     
+    # Ready once the first image row has rendered
+    READY = TABLE_ROWS
+    
     def __init__(self, driver):
         super().__init__(driver)
         self.url = TestConfig.ADMIN_URL + "/gallery"
@@ -42,6 +55,7 @@ class GalleryPage(BasePage):
         super().navigate(self.url)
         self.log("Navigated to Gallery Page")
     
+    @timed("action")
     def click_add_image(self):
         """Click Add Image button"""
         self.click(self.ADD_IMAGE_BUTTON)
@@ -63,34 +77,22 @@ class GalleryPage(BasePage):
         """Fill gallery form with data"""
         self.log("Filling gallery form...")
         
-        if "id" in gallery_data:
-            self.type_text(self.ID_INPUT, gallery_data["id"])
-            self.log(f"Entered ID: {gallery_data['id']}")
-        
-        if "src" in gallery_data:
-            self.type_text(self.SRC_INPUT, gallery_data["src"])
-            self.log(f"Entered src: {gallery_data['src']}")
-        
-        if "alt" in gallery_data:
-            self.type_text(self.ALT_INPUT, gallery_data["alt"])
-            self.log(f"Entered alt: {gallery_data['alt']}")
-        
-        if "title" in gallery_data:
-            self.type_text(self.TITLE_INPUT, gallery_data["title"])
-            self.log(f"Entered title: {gallery_data['title']}")
-        
-        if "category" in gallery_data:
-            self.type_text(self.CATEGORY_INPUT, gallery_data["category"])
-            self.log(f"Entered category: {gallery_data['category']}")
+        self.fill_form({
+            locator: gallery_data[key] for key, locator in self.FORM_FIELDS.items() if key in gallery_data
+        })
         
         self.log_success("Gallery form filled successfully")
     
+    @timed("action")
     def click_save(self):
-        """Click save button"""
-        self.click(self.SAVE_BUTTON)
-        self.log("Clicked Save button")
-        time.sleep(1)
+        """Click save button and wait for the save request to finish"""
+        with ledger.write():
+            since = self.network.mark()
+            self.click(self.SAVE_BUTTON)
+            self.log("Clicked Save button")
+            return self.wait_for_save_request(since, replaces=1)
     
+    @timed("action")
     def create_gallery_item(self, gallery_data):
         """Complete flow to create a gallery item"""
         self.click_add_image()
@@ -105,15 +107,13 @@ class GalleryPage(BasePage):
     
     def get_table_row_count(self):
         """Get number of rows in table"""
-        rows = self.find_elements(self.TABLE_ROWS)
-        count = len(rows)
+        count = len(self.table_snapshot(self.TABLE, with_actions=False))
         self.log(f"Table has {count} rows")
         return count
     
     def verify_item_in_table(self, title):
         """Verify gallery item exists in table"""
-        locator = (By.XPATH, f"//td[contains(text(), '{title}')]")
-        exists = self.is_element_present(locator, timeout=5)
+        exists = self.find_table_row(title, timeout=5, table_locator=self.TABLE) is not None
         if exists:
             self.log_success(f"✓ Gallery item '{title}' found in table")
         else:
@@ -4,6 +4,7 @@ Page Object Model for Login Page
 from selenium.webdriver.common.by import By
 from base_page import BasePage
 from config import TestConfig
+from timing import timed
 
 
 class LoginPage(BasePage):
@@ -15,6 +16,9 @@ class LoginPage(BasePage):
     ERROR_MESSAGE = (By.CSS_SELECTOR, "[role='alert']")
     DEMO_PASSWORD_TEXT = (By.XPATH, "//code[text()='admin']")
     
+    # Ready once the password field has rendered
+    READY = PASSWORD_INPUT
+    
     def __init__(self, driver):
         super().__init__(driver)
         self.url = TestConfig.ADMIN_URL + "/login"
@@ -34,6 +38,7 @@ class LoginPage(BasePage):
         self.click(self.SIGN_IN_BUTTON)
         self.log("Clicked Sign In button")
     
+    @timed("action")
     def login(self, password):
         """Complete login flow"""
         self.enter_password(password)
@@ -3,8 +3,9 @@ Page Object Model for Portfolio Page
 """
 from selenium.webdriver.common.by import By
 from base_page import BasePage
+from backend_snapshot import ledger
 from config import TestConfig
-import time
+from timing import timed
 
 
 class PortfolioPage(BasePage):
@@ -32,10 +33,24 @@ class PortfolioPage(BasePage):
     CATEGORY_INPUT = (By.ID, "category")
     FEATURED_CHECKBOX = (By.CSS_SELECTOR, "input[type='checkbox']#featured, button[role='switch']")
     
+    # Text field locators keyed by project data field, in fill order
+    FORM_FIELDS = {
+        "title": TITLE_INPUT,
+        "description": DESCRIPTION_TEXTAREA,
+        "image": IMAGE_INPUT,
+        "link": LINK_INPUT,
+        "github": GITHUB_INPUT,
+        "techStack": TECH_STACK_INPUT,
+        "category": CATEGORY_INPUT,
+    }
+    
     # Action Buttons
     SAVE_BUTTON = (By.XPATH, "//button[contains(text(), 'Save') or contains(text(), 'Create') or contains(text(), 'Update')]")
     CANCEL_BUTTON = (By.XPATH, "//button[contains(text(), 'Cancel')]")
     
+    # Ready once the first project row has rendered
+    READY = TABLE_ROWS
+    
     def __init__(self, driver):
         super().__init__(driver)
         self.url = TestConfig.ADMIN_URL + "/portfolio"
@@ -45,6 +60,7 @@ class PortfolioPage(BasePage):
         super().navigate(self.url)
         self.log("Navigated to Portfolio Page")
     
+    @timed("action")
     def click_add_project(self):
         """Click Add Project button"""
         self.click(self.ADD_PROJECT_BUTTON)
@@ -66,34 +82,13 @@ class PortfolioPage(BasePage):
         """Fill portfolio form with data"""
         self.log("Filling portfolio form...")
         
-        if "title" in project_data:
-            self.type_text(self.TITLE_INPUT, project_data["title"])
-            self.log(f"Entered title: {project_data['title']}")
-        
-        if "description" in project_data:
-            self.type_text(self.DESCRIPTION_TEXTAREA, project_data["description"])
-            self.log(f"Entered description")
-        
-        if "image" in project_data:
-            self.type_text(self.IMAGE_INPUT, project_data["image"])
-            self.log(f"Entered image: {project_data['image']}")
-        
-        if "link" in project_data:
-            self.type_text(self.LINK_INPUT, project_data["link"])
-            self.log(f"Entered link: {project_data['link']}")
-        
-        if "github" in project_data:
-            self.type_text(self.GITHUB_INPUT, project_data["github"])
-            self.log(f"Entered github: {project_data['github']}")
-        
-        if "techStack" in project_data:
-            tech_str = ",".join(project_data["techStack"]) if isinstance(project_data["techStack"], list) else project_data["techStack"]
-            self.type_text(self.TECH_STACK_INPUT, tech_str)
-            self.log(f"Entered tech stack: {tech_str}")
+        data = dict(project_data)
+        if isinstance(data.get("techStack"), list):
+            data["techStack"] = ",".join(data["techStack"])
         
-        if "category" in project_data:
-            self.type_text(self.CATEGORY_INPUT, project_data["category"])
-            self.log(f"Entered category: {project_data['category']}")
+        self.fill_form({
+            locator: data[key] for key, locator in self.FORM_FIELDS.items() if key in data
+        })
         
         if "featured" in project_data and project_data["featured"]:
             if self.is_element_present(self.FEATURED_CHECKBOX, timeout=2):
@@ -102,12 +97,16 @@ class PortfolioPage(BasePage):
         
         self.log_success("Portfolio form filled successfully")
     
+    @timed("action")
     def click_save(self):
-        """Click save button"""
-        self.click(self.SAVE_BUTTON)
-        self.log("Clicked Save button")
-        time.sleep(1)
-    
+        """Click save button and wait for the save request to finish"""
+        with ledger.write():
+            since = self.network.mark()
+            self.click(self.SAVE_BUTTON)
+            self.log("Clicked Save button")
+            return self.wait_for_save_request(since, replaces=1)
+    
+    @timed("action")
     def create_portfolio_project(self, project_data):
         """Complete flow to create a portfolio project"""
         self.click_add_project()
@@ -122,18 +121,14 @@ class PortfolioPage(BasePage):
     
     def get_table_row_count(self):
         """Get number of rows in table"""
-        rows = self.find_elements(self.TABLE_ROWS)
-        count = len(rows)
+        count = len(self.table_snapshot(self.TABLE, with_actions=False))
         self.log(f"Table has {count} rows")
         return count
     
+    @timed("action")
     def click_edit_on_first_row(self):
         """Click edit button on first row"""
-        rows = self.find_elements(self.TABLE_ROWS)
-        if rows:
-            first_row = rows[0]
-            edit_btn = first_row.find_element(By.XPATH, ".//button[contains(@aria-label, 'Edit') or contains(., 'Edit')]")
-            edit_btn.click()
+        if self.click_row_action(0, "Edit", self.TABLE):
             self.wait_for_visible(self.DIALOG, timeout=5)
             self.log("Clicked Edit on first row")
             return True
@@ -141,10 +136,20 @@ class PortfolioPage(BasePage):
             self.log_warning("No rows found to edit")
             return False
     
+    def click_edit_on_row(self, value):
+        """Click edit button on the row containing value"""
+        row = self.find_table_row(value, table_locator=self.TABLE)
+        if row and self.click_row_action(row.index, "Edit", self.TABLE):
+            self.wait_for_visible(self.DIALOG, timeout=5)
+            self.log(f"Clicked Edit on row: {value}")
+            return True
+        else:
+            self.log_warning(f"No row found to edit: {value}")
+            return False
+    
     def verify_project_in_table(self, title):
         """Verify project exists in table"""
-        locator = (By.XPATH, f"//td[contains(text(), '{title}')]")
-        exists = self.is_element_present(locator, timeout=5)
+        exists = self.find_table_row(title, timeout=5, table_locator=self.TABLE) is not None
         if exists:
             self.log_success(f"✓ Project '{title}' found in table")
         else:
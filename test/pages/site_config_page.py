@@ -3,8 +3,9 @@ Page Object Model for Site Config Page
 """
 from selenium.webdriver.common.by import By
 from base_page import BasePage
+from backend_snapshot import ledger
 from config import TestConfig
-import time
+from timing import timed
 
 
 class SiteConfigPage(BasePage):
@@ -17,6 +18,9 @@ class SiteConfigPage(BasePage):
     # Config Toggles (dynamic based on config data)
     TOGGLE_SWITCH = (By.CSS_SELECTOR, "button[role='switch']")
     
+    # Ready once the config toggles are populated
+    READY = TOGGLE_SWITCH
+    
     def __init__(self, driver):
         super().__init__(driver)
         self.url = TestConfig.ADMIN_URL + "/site-config"
@@ -32,13 +36,14 @@ class SiteConfigPage(BasePage):
         self.log(f"Found {len(switches)} toggle switches")
         return switches
     
+    @timed("action")
     def toggle_switch_by_index(self, index):
         """Toggle switch by index"""
         switches = self.get_all_toggle_switches()
         if index < len(switches):
             switches[index].click()
             self.log(f"Toggled switch at index {index}")
-            time.sleep(0.5)
+            self.wait_for_dom_quiet(replaces=0.5)
             return True
         else:
             self.log_error(f"Switch index {index} out of range")
@@ -56,11 +61,14 @@ class SiteConfigPage(BasePage):
             return False
     
     def click_save(self):
-        """Click save button"""
-        self.click(self.SAVE_BUTTON)
-        self.log("Clicked Save button")
-        time.sleep(1)
+        """Click save button and wait for the save request to finish"""
+        with ledger.write(config=True):
+            since = self.network.mark()
+            self.click(self.SAVE_BUTTON)
+            self.log("Clicked Save button")
+            return self.wait_for_save_request(since, replaces=1)
     
+    @timed("action")
     def save_configuration(self):
         """Save configuration and verify"""
         self.click_save()
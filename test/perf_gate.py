@@ -0,0 +1,315 @@
+"""
+Performance regression gate: compares the latest timings against a stored baseline
+
+Usage:
+    python run_tests.py gate compare [--page-load FILE] [--run RUN_ID]
+    python run_tests.py gate promote [--page-load FILE] [--run RUN_ID]
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import statistics
+import time
+from config import TestConfig
+from history import HistoryDB
+from colorama import Fore, Style
+
+
+def mann_whitney_greater(current, baseline):
+    """
+    One-sided Mann-Whitney U test: are current values larger than baseline?
+    
+    Exact for small samples without ties, normal approximation with tie
+    correction otherwise.
+    
+    Returns:
+        (U statistic of current, p-value)
+    """
+    m, n = len(current), len(baseline)
+    ranked = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(ranked)
+    ties = []
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        if j > i:
+            ties.append(j - i + 1)
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - m * (m + 1) / 2
+    
+    if not ties and m <= 20 and n <= 20:
+        return u, _exact_upper_tail(u, m, n)
+    
+    mean = m * n / 2
+    tie_term = sum(t ** 3 - t for t in ties) / ((m + n) * (m + n - 1))
+    variance = m * n / 12 * ((m + n + 1) - tie_term)
+    if variance <= 0:
+        return u, 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _exact_upper_tail(u, m, n):
+    """P(U >= u) under the null hypothesis, by counting rank arrangements"""
+    # counts[i][j][k]: arrangements of i current and j baseline values with U = k
+    counts = [[None] * (n + 1) for _ in range(m + 1)]
+    for i in range(m + 1):
+        for j in range(n + 1):
+            if i == 0 or j == 0:
+                counts[i][j] = [1]
+                continue
+            # The largest value is either a current one (beating all j
+            # baseline values) or a baseline one
+            with_current = [0] * j + counts[i - 1][j]
+            with_baseline = counts[i][j - 1]
+            size = max(len(with_current), len(with_baseline))
+            counts[i][j] = [
+                (with_current[k] if k < len(with_current) else 0)
+                + (with_baseline[k] if k < len(with_baseline) else 0)
+                for k in range(size)
+            ]
+    distribution = counts[m][n]
+    total = sum(distribution)
+    return sum(distribution[math.ceil(u):]) / total
+
+
+def holm(p_values):
+    """
+    Holm-Bonferroni adjusted p-values, in the order given
+    
+    The i-th smallest of k p-values is multiplied by k - i (counting from
+    zero) and kept from falling below the one before it, so comparing the
+    adjusted values against alpha keeps the chance of any false positive
+    across all k tests below alpha.
+    """
+    k = len(p_values)
+    adjusted = [1.0] * k
+    running = 0.0
+    for rank, index in enumerate(sorted(range(k), key=lambda i: p_values[i])):
+        running = max(running, min(1.0, (k - rank) * p_values[index]))
+        adjusted[index] = running
+    return adjusted
+
+
+def decide(change, p_slower, p_faster, alpha, threshold):
+    """Verdict of a metric from its median change and one-sided p-values"""
+    if p_slower < alpha and change > threshold:
+        return "regression"
+    if p_faster < alpha and change < -threshold:
+        return "improvement"
+    return "ok"
+
+
+def compare(current, baseline, alpha=None, threshold=None, min_samples=None):
+    """
+    Verdict for one metric
+    
+    A slowdown is a regression only if it is significant (p < alpha) and
+    the median grew by more than the relative threshold; a faster median
+    under the same conditions is an improvement. The p-values are those
+    of this metric alone; PerfGate.compare adjusts them for the number of
+    metrics compared.
+    
+    Returns:
+        Dict with medians, relative change, p-values, Cliff's delta and verdict
+    """
+    alpha = TestConfig.PERF_GATE_ALPHA if alpha is None else alpha
+    threshold = TestConfig.PERF_GATE_THRESHOLD if threshold is None else threshold
+    min_samples = min_samples or TestConfig.PERF_GATE_MIN_SAMPLES
+    result = {
+        "n": len(current),
+        "baseline_n": len(baseline),
+        "median": statistics.median(current) if current else None,
+        "baseline_median": statistics.median(baseline) if baseline else None,
+    }
+    if len(current) < min_samples or len(baseline) < min_samples:
+        return dict(result, verdict="insufficient")
+    
+    base = result["baseline_median"]
+    change = (result["median"] - base) / base if base else 0.0
+    u_slower, p_slower = mann_whitney_greater(current, baseline)
+    u_faster, p_faster = mann_whitney_greater(baseline, current)
+    # Cliff's delta: P(current > baseline) - P(current < baseline)
+    delta = (u_slower - u_faster) / (len(current) * len(baseline))
+    
+    return dict(result, change=change, p_slower=p_slower, p_faster=p_faster, p_value=min(p_slower, p_faster),
+                cliffs_delta=delta, effect=effect_label(delta),
+                verdict=decide(change, p_slower, p_faster, alpha, threshold))
+
+
+def effect_label(delta):
+    """Conventional size label of a Cliff's delta"""
+    size = abs(delta)
+    if size < 0.147:
+        return "negligible"
+    if size < 0.33:
+        return "small"
+    if size < 0.474:
+        return "medium"
+    return "large"
+
+
+class PerfGate:
+    """
+    Baseline of page-load and interaction timings, and the comparison
+    against it.
+    
+    Metrics are keyed "page_load:<route>:<mode>:<metric>" (samples from
+    python run_tests.py perf) and "action:<Page>.<method>" (page object
+    actions recorded with TIMING_SPANS in the run history). The baseline
+    keeps raw samples so every comparison can run the rank test.
+    """
+    
+    def __init__(self, baseline_path=None):
+        self.baseline_path = baseline_path or TestConfig.PERF_BASELINE_FILE
+        self.baseline = self._load()
+    
+    def _load(self):
+        """Read the baseline file, starting empty if it is missing"""
+        try:
+            with open(self.baseline_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"metrics": {}, "sources": {}}
+    
+    @staticmethod
+    def current_samples(page_load_file=None, run_id=None):
+        """
+        Samples of the latest benchmark file and the latest run with action spans
+        
+        Returns:
+            (samples dict metric -> list of ms, sources dict)
+        """
+        samples, sources = {}, {}
+        if page_load_file is None:
+            files = sorted(glob.glob(os.path.join(TestConfig.PERF_DIR, "page_load_*.json")))
+            page_load_file = files[-1] if files else None
+        if page_load_file:
+            with open(page_load_file, encoding="utf-8") as f:
+                data = json.load(f)
+            for sample in data["samples"]:
+                for metric, value in sample.items():
+                    if metric in ("route", "mode", "transfer_kb", "rows") or value is None:
+                        continue
+                    samples.setdefault(f"page_load:{sample['route']}:{sample['mode']}:{metric}", []).append(value)
+            sources["page_load"] = os.path.basename(page_load_file)
+        
+        history = HistoryDB()
+        try:
+            history.import_all()
+            run_id, actions = history.action_samples(run_id)
+        finally:
+            history.close()
+        for name, values in actions.items():
+            samples[f"action:{name}"] = values
+        if run_id:
+            sources["run"] = run_id
+        return samples, sources
+    
+    def compare(self, samples, alpha=None, threshold=None, min_samples=None):
+        """
+        Verdict for every metric present in both the samples and the baseline
+        
+        Each metric is tested at alpha, and with dozens of metrics some would
+        come out significant by chance alone. The p-values of each direction
+        are therefore Holm-Bonferroni adjusted across the compared metrics
+        before the verdicts are decided.
+        """
+        alpha = TestConfig.PERF_GATE_ALPHA if alpha is None else alpha
+        threshold = TestConfig.PERF_GATE_THRESHOLD if threshold is None else threshold
+        results = {
+            metric: compare(values, self.baseline["metrics"][metric], alpha, threshold, min_samples)
+            for metric, values in sorted(samples.items())
+            if metric in self.baseline["metrics"]
+        }
+        tested = [r for r in results.values() if r["verdict"] != "insufficient"]
+        for key in ("p_slower", "p_faster"):
+            for result, adjusted in zip(tested, holm([r[key] for r in tested])):
+                result[key] = adjusted
+        for r in tested:
+            r["p_value"] = min(r["p_slower"], r["p_faster"])
+            r["verdict"] = decide(r["change"], r["p_slower"], r["p_faster"], alpha, threshold)
+        return results
+    
+    def promote(self, samples, sources):
+        """Make these samples the baseline of their metrics; other metrics keep theirs"""
+        self.baseline["metrics"].update(samples)
+        self.baseline["sources"].update(sources)
+        self.baseline["promoted"] = time.time()
+        tmp_path = f"{self.baseline_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.baseline, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.baseline_path)
+    
+    @staticmethod
+    def write_report(results, sources, path=None):
+        """Save the verdicts as JSON for CI; returns the path"""
+        path = path or os.path.join(TestConfig.PERF_DIR, "gate.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        passed = not any(r["verdict"] == "regression" for r in results.values())
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"passed": passed, "sources": sources, "metrics": results}, f, indent=2)
+        return path
+
+
+def print_results(results):
+    """Aligned table of verdicts, regressions first"""
+    colors = {"regression": Fore.RED, "improvement": Fore.GREEN, "insufficient": Fore.YELLOW, "ok": ""}
+    order = {"regression": 0, "improvement": 1, "insufficient": 2, "ok": 3}
+    width = max([len(metric) for metric in results] + [6])
+    print(f"{Style.BRIGHT}{'metric':<{width}}  {'base':>8}  {'now':>8}  {'change':>7}  {'p':>6}  "
+          f"{'delta':>6}  {'effect':<10}  verdict{Style.RESET_ALL}")
+    for metric, r in sorted(results.items(), key=lambda item: (order[item[1]["verdict"]], item[0])):
+        if r["verdict"] == "insufficient":
+            print(f"{metric:<{width}}  {'':>8}  {'':>8}  {'':>7}  {'':>6}  {'':>6}  {'':<10}  "
+                  f"{colors['insufficient']}insufficient ({r['n']} vs {r['baseline_n']} samples){Style.RESET_ALL}")
+            continue
+        print(
+            f"{metric:<{width}}  {r['baseline_median']:>8.1f}  {r['median']:>8.1f}  {r['change'] * 100:>+6.1f}%  "
+            f"{r['p_value']:>6.3f}  {r['cliffs_delta']:>+6.2f}  {r['effect']:<10}  "
+            f"{colors[r['verdict']]}{r['verdict']}{Style.RESET_ALL}"
+        )
+
+
+def main(argv=None):
+    """Command line entry point (python run_tests.py gate ...); exit code 1 on regression"""
+    parser = argparse.ArgumentParser(prog="run_tests.py gate", description="Performance regression gate")
+    parser.add_argument("command", choices=["compare", "promote"])
+    parser.add_argument("--page-load", default=None, help="Page-load samples file (default: newest in reports/perf)")
+    parser.add_argument("--run", default=None, help="Run id for action timings (default: latest with TIMING_SPANS)")
+    args = parser.parse_args(argv)
+    
+    gate = PerfGate()
+    samples, sources = gate.current_samples(args.page_load, args.run)
+    if not samples:
+        print(f"{Fore.YELLOW}[GATE] No timings found: run 'python run_tests.py perf' "
+              f"or a suite run with TIMING_SPANS=True first{Style.RESET_ALL}")
+        return 1
+    
+    if args.command == "promote":
+        gate.promote(samples, sources)
+        print(f"{Fore.GREEN}[GATE] Promoted {len(samples)} metrics from "
+              f"{', '.join(sources.values())} to {gate.baseline_path}{Style.RESET_ALL}")
+        return 0
+    
+    results = gate.compare(samples)
+    if not results:
+        print(f"{Fore.YELLOW}[GATE] No baseline for these metrics; promote one with "
+              f"'python run_tests.py gate promote'{Style.RESET_ALL}")
+        return 0
+    print_results(results)
+    report = gate.write_report(results, sources)
+    regressions = [metric for metric, r in results.items() if r["verdict"] == "regression"]
+    if regressions:
+        print(f"\n{Fore.RED}{Style.BRIGHT}[GATE] FAILED: {len(regressions)} regressions "
+              f"(p < {TestConfig.PERF_GATE_ALPHA}, > {TestConfig.PERF_GATE_THRESHOLD:.0%} slower) - {report}{Style.RESET_ALL}")
+        return 1
+    print(f"\n{Fore.GREEN}{Style.BRIGHT}[GATE] PASSED: {len(results)} metrics compared - {report}{Style.RESET_ALL}")
+    return 0
@@ -0,0 +1,202 @@
+"""
+Static, paginated HTML over the JSONL results of past runs
+
+Usage:
+    python report_renderer.py [--page-size N] [--force]
+"""
+import argparse
+import html
+import json
+import os
+import time
+from datetime import datetime
+from config import TestConfig
+
+
+OUTCOME_ORDER = {"error": 0, "failed": 1, "skipped": 2, "passed": 3}
+
+STYLE = """
+body { font-family: system-ui, sans-serif; margin: 2em; color: #222; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border-bottom: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }
+.passed { color: #2a7d2a; } .failed, .error { color: #c62828; } .skipped { color: #b26a00; }
+nav a { margin-right: 0.5em; }
+pre { white-space: pre-wrap; font-size: 12px; max-height: 30em; overflow: auto; }
+img { max-width: 800px; border: 1px solid #ccc; }
+"""
+
+
+class ReportRenderer:
+    """
+    Renders reports/index.html and one set of pages per run.
+    
+    Pages only reference artifacts by relative URL, and screenshots sit
+    inside closed <details> with loading="lazy", so neither rendering nor
+    opening a page reads a screenshot. Runs whose pages are newer than
+    their results are skipped, so re-rendering costs only the new runs.
+    """
+    
+    def __init__(self, results_dir=None, page_size=None):
+        self.results_dir = results_dir or TestConfig.RESULTS_DIR
+        self.page_size = page_size or TestConfig.REPORT_PAGE_SIZE
+        self.reports_dir = os.path.dirname(self.results_dir)
+    
+    def load_runs(self):
+        """Metadata of every run, newest first"""
+        runs = []
+        if not os.path.isdir(self.results_dir):
+            return runs
+        for run_id in os.listdir(self.results_dir):
+            try:
+                with open(os.path.join(self.results_dir, run_id, "run.json"), encoding="utf-8") as f:
+                    runs.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return sorted(runs, key=lambda run: run["started"], reverse=True)
+    
+    def render(self, force=False):
+        """Render every changed run and the index; returns (index path, rendered run count)"""
+        runs = self.load_runs()
+        rendered = 0
+        for run in runs:
+            if force or self._is_stale(run["id"]):
+                self.render_run(run)
+                rendered += 1
+        return self.render_index(runs), rendered
+    
+    def render_run(self, run):
+        """Write page-1.html, page-2.html, ... for one run; failures first"""
+        run_dir = os.path.join(self.results_dir, run["id"])
+        results = list(self._read_results(run_dir))
+        results.sort(key=lambda r: (OUTCOME_ORDER.get(r["outcome"], 9), r["test"]))
+        
+        pages = max(1, -(-len(results) // self.page_size))
+        for page in range(1, pages + 1):
+            chunk = results[(page - 1) * self.page_size:page * self.page_size]
+            rows = "\n".join(self._result_row(result, run_dir) for result in chunk)
+            body = (
+                f"<p><a href=\"../../index.html\">All runs</a></p>"
+                f"<h1>Run {html.escape(run['id'])}</h1>"
+                f"<p>{self._summary(run)}</p>"
+                f"{self._pager(page, pages, self._run_page_name)}"
+                f"<table><tr><th>Outcome</th><th>Test</th><th>Duration</th><th>Worker</th><th>Details</th></tr>"
+                f"{rows}</table>"
+                f"{self._pager(page, pages, self._run_page_name)}"
+            )
+            self._write(os.path.join(run_dir, self._run_page_name(page)), f"Run {run['id']}", body)
+    
+    def render_index(self, runs):
+        """Write index.html, index-2.html, ... listing the runs"""
+        pages = max(1, -(-len(runs) // self.page_size))
+        for page in range(1, pages + 1):
+            chunk = runs[(page - 1) * self.page_size:page * self.page_size]
+            rows = "\n".join(
+                f"<tr><td><a href=\"runs/{html.escape(run['id'])}/{self._run_page_name(1)}\">{html.escape(run['id'])}</a></td>"
+                f"<td>{html.escape(run['status'])}</td><td>{self._summary(run)}</td>"
+                f"<td>{html.escape(' '.join(run.get('args', [])))}</td></tr>"
+                for run in chunk
+            )
+            body = (
+                f"<h1>Test runs</h1>{self._pager(page, pages, self._index_page_name)}"
+                f"<table><tr><th>Run</th><th>Status</th><th>Results</th><th>Arguments</th></tr>{rows}</table>"
+            )
+            self._write(os.path.join(self.reports_dir, self._index_page_name(page)), "Test runs", body)
+        return os.path.join(self.reports_dir, self._index_page_name(1))
+    
+    def _result_row(self, result, run_dir):
+        """One table row; failure details and artifacts collapsed"""
+        details = ""
+        if result.get("message"):
+            details += f"<div>{html.escape(result['message'])}</div>"
+        if result.get("longrepr"):
+            details += f"<details><summary>Traceback</summary><pre>{html.escape(result['longrepr'])}</pre></details>"
+        artifacts = result.get("artifacts") or {}
+        for kind, path in artifacts.items():
+            url = html.escape(os.path.relpath(os.path.join(self.reports_dir, path), run_dir))
+            if kind == "screenshot":
+                details += f"<details><summary>Screenshot</summary><img loading=\"lazy\" src=\"{url}\"></details>"
+            else:
+                details += f"<a href=\"{url}\">{html.escape(kind)}</a> "
+        outcome = html.escape(result["outcome"])
+        return (
+            f"<tr><td class=\"{outcome}\">{outcome}</td><td>{html.escape(result['test'])}</td>"
+            f"<td>{result['duration']:.1f}s</td><td>{html.escape(result.get('worker', ''))}</td>"
+            f"<td>{details}</td></tr>"
+        )
+    
+    @staticmethod
+    def _summary(run):
+        """Counts and wall time of a run"""
+        counts = ", ".join(f"{n} {outcome}" for outcome, n in run.get("counts", {}).items() if n)
+        started = datetime.fromtimestamp(run["started"]).strftime("%Y-%m-%d %H:%M")
+        elapsed = f", {run['finished'] - run['started']:.0f}s" if run.get("finished") else ""
+        return html.escape(f"{started}{elapsed}: {counts or 'no results'}")
+    
+    @staticmethod
+    def _pager(page, pages, page_name):
+        """Links to the other pages, if there are any"""
+        if pages == 1:
+            return ""
+        links = [
+            f"<b>{number}</b>" if number == page else f"<a href=\"{page_name(number)}\">{number}</a>"
+            for number in range(1, pages + 1)
+        ]
+        return f"<nav>{''.join(links)}</nav>"
+    
+    @staticmethod
+    def _run_page_name(page):
+        """File name of a page of one run"""
+        return f"page-{page}.html"
+    
+    @staticmethod
+    def _index_page_name(page):
+        """File name of a page of the run list"""
+        return "index.html" if page == 1 else f"index-{page}.html"
+    
+    def _is_stale(self, run_id):
+        """Whether a run's results changed since its pages were written"""
+        run_dir = os.path.join(self.results_dir, run_id)
+        page = os.path.join(run_dir, self._run_page_name(1))
+        if not os.path.exists(page):
+            return True
+        sources = [os.path.join(run_dir, name) for name in ("results.jsonl", "run.json")]
+        newest = max((os.path.getmtime(p) for p in sources if os.path.exists(p)), default=0)
+        return newest > os.path.getmtime(page)
+    
+    @staticmethod
+    def _read_results(run_dir):
+        """Result records of a run, skipping a truncated last line"""
+        try:
+            with open(os.path.join(run_dir, "results.jsonl"), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except OSError:
+            return
+    
+    @staticmethod
+    def _write(path, title, body):
+        """Write one HTML page"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title>"
+                f"<style>{STYLE}</style></head><body>{body}</body></html>"
+            )
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Render HTML reports from streamed test results")
+    parser.add_argument("--page-size", type=int, default=None, help="Rows per page")
+    parser.add_argument("--force", action="store_true", help="Re-render runs that did not change")
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    index, rendered = ReportRenderer(page_size=args.page_size).render(force=args.force)
+    print(f"Rendered {rendered} runs in {time.perf_counter() - start:.2f}s: {index}")
+
+
+if __name__ == "__main__":
+    main()
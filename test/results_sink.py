@@ -0,0 +1,131 @@
+"""
+Streams one JSON line per finished test into reports/runs/<run id>/results.jsonl
+"""
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime
+from config import TestConfig
+from scheduler import base_nodeid
+
+
+# Markers pytest and its plugins apply themselves; not a test category
+BUILTIN_MARKERS = {
+    "parametrize", "skip", "skipif", "xfail", "usefixtures", "filterwarnings",
+    "tryfirst", "trylast", "xdist_group",
+}
+
+
+class ResultsSink:
+    """
+    pytest plugin on the controller (or the only process in serial runs).
+    
+    A test's line is written and flushed as soon as its teardown has been
+    reported, so an interrupted run still leaves every finished result on
+    disk. run.json holds the run's metadata and, once the session ends,
+    its totals. Artifacts are referenced by path, never inlined. When a
+    history database is given, the finished run is imported into it.
+    """
+    
+    def __init__(self, results_dir=None, run_id=None, history=None, suffix=None):
+        # The suffix, normally TestConfig.TEST_RUN_ID, keeps runs started in the
+        # same second apart and names the results after the run's data namespace
+        suffix = suffix or uuid.uuid4().hex[:6]
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{suffix}"
+        self.run_dir = os.path.join(results_dir or TestConfig.RESULTS_DIR, self.run_id)
+        self.pending = {}
+        self.counts = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+        self.started = time.time()
+        self.file = None
+        self.history = history
+        self.markers = set()
+    
+    def pytest_sessionstart(self, session):
+        """Create the run directory and open the results file"""
+        self.markers = {
+            line.split(":")[0].split("(")[0].strip() for line in session.config.getini("markers")
+        } - BUILTIN_MARKERS
+        os.makedirs(self.run_dir, exist_ok=True)
+        self.file = open(os.path.join(self.run_dir, "results.jsonl"), "a", encoding="utf-8")
+        self.write_meta("running")
+    
+    def pytest_runtest_logreport(self, report):
+        """Fold setup/call/teardown into one record, written after teardown"""
+        nodeid = base_nodeid(report.nodeid)
+        record = self.pending.setdefault(nodeid, {
+            "test": nodeid,
+            "outcome": "passed",
+            "duration": 0.0,
+            "worker": getattr(report, "worker_id", "main"),
+            "start": report.start,
+            "phases": {},
+            "markers": sorted(name for name in report.keywords if name in self.markers),
+        })
+        record["duration"] += report.duration
+        record["phases"][report.when] = report.duration
+        record["stop"] = report.stop
+        
+        if record["outcome"] == "passed":
+            if report.failed:
+                record["outcome"] = "failed" if report.when == "call" else "error"
+                record["phase"] = report.when
+                record["message"] = self._message(report)
+                record["longrepr"] = str(report.longrepr)[:TestConfig.RESULTS_LONGREPR_CHARS]
+            elif report.skipped:
+                record["outcome"] = "skipped"
+                record["message"] = self._message(report)
+        for name, value in report.user_properties:
+            if name in ("artifacts", "spans"):
+                record[name] = value
+        
+        if report.when == "teardown":
+            self.write(self.pending.pop(nodeid))
+    
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Flush tests that never reached teardown and record the totals"""
+        for record in self.pending.values():
+            self.write(record)
+        self.pending.clear()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.write_meta("finished", exitstatus=int(exitstatus))
+        if self.history is not None:
+            self.history.import_run(self.run_dir)
+            self.history.close()
+    
+    def write(self, record):
+        """Append one result line"""
+        self.counts[record["outcome"]] += 1
+        if self.file is not None:
+            self.file.write(json.dumps(record) + "\n")
+            self.file.flush()
+    
+    def write_meta(self, status, **extra):
+        """Atomically replace run.json"""
+        meta = {
+            "id": self.run_id,
+            "status": status,
+            "started": self.started,
+            "finished": time.time() if status == "finished" else None,
+            "args": sys.argv[1:],
+            "counts": self.counts,
+            **extra,
+        }
+        path = os.path.join(self.run_dir, "run.json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def _message(report):
+        """One-line reason of a failure or skip"""
+        if report.skipped and isinstance(report.longrepr, tuple):
+            return report.longrepr[2]
+        crash = getattr(report.longrepr, "reprcrash", None)
+        if crash is not None:
+            return crash.message.splitlines()[0] if crash.message else ""
+        return str(report.longrepr).strip().splitlines()[-1] if report.longrepr else ""
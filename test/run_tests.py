@@ -7,6 +7,10 @@ import sys
 import os
 from datetime import datetime
 from colorama import init, Fore, Style
+from config import TestConfig
+from report_renderer import ReportRenderer
+from history import main as history_main
+from perf_gate import main as gate_main
 
 init(autoreset=True)
 
@@ -20,7 +24,30 @@ def print_banner():
     print("="*80 + "\n")
 
 
-def run_tests(test_type="all", verbose=True):
+def parallel_args(workers=None):
+    """
+    pytest-xdist arguments for running on several workers
+    
+    With --dist loadgroup, conftest's xdist scheduler assigns tests to
+    workers longest-first using the durations recorded by previous runs.
+    
+    Args:
+        workers: Number of workers or "auto" (defaults to PARALLEL_WORKERS);
+            0 or 1 runs serially
+    """
+    workers = str(TestConfig.PARALLEL_WORKERS if workers is None else workers)
+    if workers in ("", "0", "1"):
+        return []
+    return ["-n", workers, "--dist", "loadgroup"]
+
+
+def render_report():
+    """Render the HTML index over the streamed results; returns its path"""
+    index, _ = ReportRenderer().render()
+    return os.path.relpath(index)
+
+
+def run_tests(test_type="all", verbose=True, workers=None, fail_fast=False, record_traffic=False):
     """
     Run tests based on test type
     
@@ -35,7 +62,13 @@ def run_tests(test_type="all", verbose=True):
             - "gallery": Run only gallery tests
             - "site_config": Run only site config tests
             - "backups": Run only backup tests
+            - "perf": Page-load benchmark of every admin route
+            - "replay": API-only replay of the recorded traffic
+            - "unit": Tests of the suite's own helpers, no browser or backend
         verbose: Print verbose output
+        workers: Parallel workers (defaults to PARALLEL_WORKERS)
+        fail_fast: Stop after the first smoke/critical failure; workers skip the rest
+        record_traffic: Record the admin API traffic for the replay suite
     """
     
     print_banner()
@@ -45,11 +78,23 @@ def run_tests(test_type="all", verbose=True):
     
     # Add test markers/paths based on test type
     if test_type == "all":
-        cmd.append("tests/")
+        cmd.extend(["-m", "not perf and not replay", "tests/"])
     elif test_type == "smoke":
         cmd.extend(["-m", "smoke", "tests/"])
     elif test_type == "critical":
         cmd.extend(["-m", "critical", "tests/"])
+    elif test_type == "perf":
+        # Benchmarks run serially so workers do not compete for CPU
+        cmd.extend(["-m", "perf", "tests/"])
+        workers = 0
+    elif test_type == "replay":
+        # Plain HTTP; starting workers would take longer than the replay
+        cmd.extend(["-m", "replay", "tests/"])
+        workers = 0
+    elif test_type == "unit":
+        # Milliseconds each; starting workers would take longer
+        cmd.extend(["-m", "unit", "tests/"])
+        workers = 0
     else:
         cmd.extend(["-m", test_type, "tests/"])
     
@@ -59,16 +104,19 @@ def run_tests(test_type="all", verbose=True):
     else:
         cmd.append("-q")
     
-    # Add color output
-    cmd.append("--color=yes")
+    # Run in parallel, longest tests first
+    cmd.extend(parallel_args(workers))
     
-    # Add detailed output
-    cmd.append("-s")
+    # Stop everything on the first smoke/critical failure
+    if fail_fast:
+        cmd.append("--fail-fast")
     
-    # Add HTML report
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_file = f"reports/test_report_{timestamp}.html"
-    cmd.extend(["--html", report_file, "--self-contained-html"])
+    # Keep the API traffic of passing tests for the replay suite
+    if record_traffic:
+        cmd.append("--record-traffic")
+    
+    # Add color output
+    cmd.append("--color=yes")
     
     # Add summary
     cmd.append("-ra")
@@ -87,7 +135,7 @@ def run_tests(test_type="all", verbose=True):
             print(f"{Fore.RED}{Style.BRIGHT}✗ SOME TESTS FAILED!{Style.RESET_ALL}")
         
         print(f"{Fore.YELLOW}Test Execution Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}HTML Report: {report_file}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}HTML Report: {render_report()}{Style.RESET_ALL}")
         print("="*80 + "\n")
         
         return result.returncode
@@ -101,7 +149,7 @@ def run_tests(test_type="all", verbose=True):
         return 1
 
 
-def run_specific_test_file(test_file):
+def run_specific_test_file(test_file, workers=None):
     """Run a specific test file"""
     print_banner()
     
@@ -109,14 +157,10 @@ def run_specific_test_file(test_file):
         "pytest",
         f"tests/{test_file}",
         "-v",
-        "-s",
         "--color=yes",
         "-ra"
     ]
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_file = f"reports/test_report_{timestamp}.html"
-    cmd.extend(["--html", report_file, "--self-contained-html"])
+    cmd.extend(parallel_args(workers))
     
     print(f"{Fore.CYAN}Executing: {' '.join(cmd)}{Style.RESET_ALL}\n")
     
@@ -129,7 +173,7 @@ def run_specific_test_file(test_file):
         else:
             print(f"{Fore.RED}{Style.BRIGHT}✗ SOME TESTS FAILED!{Style.RESET_ALL}")
         
-        print(f"{Fore.CYAN}HTML Report: {report_file}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}HTML Report: {render_report()}{Style.RESET_ALL}")
         print("="*80 + "\n")
         
         return result.returncode
@@ -145,7 +189,7 @@ def print_help():
 {Fore.CYAN}{Style.BRIGHT}Admin Panel Selenium Test Runner{Style.RESET_ALL}
 
 {Fore.YELLOW}Usage:{Style.RESET_ALL}
-    python run_tests.py [test_type]
+    python run_tests.py [test_type] [--fail-fast] [--record-traffic] [--replay-first]
 
 {Fore.YELLOW}Test Types:{Style.RESET_ALL}
     all          - Run all tests (default)
@@ -157,12 +201,18 @@ def print_help():
     gallery      - Run gallery CRUD tests only
     site_config  - Run site configuration tests only
     backups      - Run backup system tests only
+    perf         - Page-load benchmark (not part of "all")
+    replay       - Recorded API traffic replayed without a browser (not part of "all")
+    unit         - Suite helpers (statistics, scheduling), no browser or backend
 
 {Fore.YELLOW}Examples:{Style.RESET_ALL}
     python run_tests.py              # Run all tests
     python run_tests.py smoke        # Run smoke tests
     python run_tests.py critical     # Run critical tests
     python run_tests.py blogs        # Run blog tests only
+    python run_tests.py critical --fail-fast  # Stop at the first critical failure
+    python run_tests.py all --record-traffic  # Record API traffic for the replay suite
+    python run_tests.py all --replay-first    # Replay first, browsers only if it passes
 
 {Fore.YELLOW}Test Files:{Style.RESET_ALL}
     test_login.py           - Login functionality tests
@@ -172,6 +222,17 @@ def print_help():
     test_gallery_crud.py    - Gallery CRUD operations tests
     test_site_config.py     - Site configuration tests
     test_backups.py         - Backup system tests
+    test_page_load.py       - Page-load benchmark
+    test_backups_scale.py   - Backups page at 100/1k/10k backups
+    test_blogs_scale.py     - Blogs table, search and paging at 1k/10k/50k blogs
+    test_api_replay.py      - Replay of the recorded API traffic
+    test_backend_snapshot.py - Run-level backend restore (unit)
+    test_backup_dates.py    - Backup date column parsing (unit)
+    test_data_factory.py    - Test data cleanup through the API (unit)
+    test_history.py         - Percentile statistics (unit)
+    test_perf_gate.py       - Regression gate statistics (unit)
+    test_scheduler.py       - Duration history and LPT scheduling (unit)
+    test_traffic.py         - Traffic normalization, diff and replay mapping (unit)
 
 {Fore.YELLOW}Requirements:{Style.RESET_ALL}
     1. Install dependencies: pip install -r requirements.txt
@@ -179,9 +240,70 @@ def print_help():
     3. Start admin panel server: npm run dev (in admin folder)
     4. Start backend server: node admin/server/index.js
 
+{Fore.YELLOW}Parallel Execution:{Style.RESET_ALL}
+    Tests run on PARALLEL_WORKERS workers (default 4, "auto" = one per CPU).
+    Durations of every run are kept in .cache/durations.json and used to
+    hand the longest tests out first. PARALLEL_WORKERS=0 runs serially.
+
+{Fore.YELLOW}Test Order:{Style.RESET_ALL}
+    Tests that failed in the last FAILURE_FIRST_RUNS runs (default 5) and
+    tests in files edited since the previous run are run first, on every
+    worker. FAILURE_FIRST=False keeps the collection order.
+    --fail-fast skips everything left, on all workers, once a test marked
+    smoke or critical (FAIL_FAST_MARKERS) has failed.
+
+{Fore.YELLOW}Page-Load Benchmark:{Style.RESET_ALL}
+    Loads every route PERF_ITERATIONS times (default 5) with a cleared
+    and with a primed browser cache. Reports mean, median, p95 and
+    variance of TTFB, DOMContentLoaded, load, FCP, LCP and the time until
+    the route's table or toggles are populated. Samples: reports/perf/
+    The backups page is also loaded with BACKUP_SCALE_SIZES backups
+    (100,1000,10000): time until all rows are rendered, the order and
+    dates of every row, and how latency grows with the backup count.
+    The blogs page is loaded with BLOG_SCALE_SIZES blog posts
+    (1000,10000,50000), timing table render, Next page and search.
+    Search latency runs from the final keystroke until the results stop
+    changing, reported per query class: prefix, exact, no match, unicode.
+
+{Fore.YELLOW}Performance Gate:{Style.RESET_ALL}
+    python run_tests.py gate compare   # exit code 1 on a significant slowdown
+    python run_tests.py gate promote   # make the latest timings the baseline
+    Compares the newest reports/perf samples and the page object actions
+    of the latest TIMING_SPANS run against perf_baseline.json. A metric
+    regresses when a one-sided Mann-Whitney U test gives p < PERF_GATE_ALPHA
+    (0.05) and its median is more than PERF_GATE_THRESHOLD (10%) slower.
+
+{Fore.YELLOW}Load Mode:{Style.RESET_ALL}
+    python run_tests.py load --stages 1,2,4,8 --stage-seconds 60
+    Headless editor sessions repeat a weighted mix of page object flows
+    (LOAD_MIX: create_blog, create_project, save_config, view_backup).
+    Each stage adds sessions; reports flows per minute, p50/p95/p99
+    latency per flow and the backups created per stage. Samples:
+    reports/perf/load_<timestamp>.json
+
+{Fore.YELLOW}HTTP Load:{Style.RESET_ALL}
+    python run_tests.py http-load --mode closed --users 50 --seconds 60
+    python run_tests.py http-load --mode open --rate 20 --seconds 60
+    Replays the backend requests of create_blog, create_portfolio_project,
+    create_gallery_item, save_configuration and the backups list from one
+    asyncio loop over pooled keep-alive connections (HTTP_LOAD_MIX).
+    Reports throughput, error rate and latency percentiles per scenario
+    and request, plus a latency histogram. Local backends only unless
+    --allow-remote is given.
+
 {Fore.YELLOW}Reports:{Style.RESET_ALL}
-    - HTML reports are generated in: reports/
-    - Screenshots on failure: screenshots/
+    - Results are streamed to reports/runs/<run>/results.jsonl
+    - HTML index over all runs: reports/index.html
+      (re-render with: python report_renderer.py)
+    - Failure artifacts: reports/artifacts/
+
+{Fore.YELLOW}History:{Style.RESET_ALL}
+    Every run is imported into reports/history.sqlite.
+    python run_tests.py history trends   # p50/p95 duration per run
+    python run_tests.py history flaky    # tests that flip between pass and fail
+    python run_tests.py history slowest  # slowest tests per marker
+    python run_tests.py history steps    # costliest page object steps (TIMING_SPANS)
+    Options: --runs N (default HISTORY_RUNS), --limit K, --marker M
 """
     print(help_text)
 
@@ -202,18 +324,43 @@ if __name__ == "__main__":
         print(f"{Fore.YELLOW}Copy .env.example to .env and configure as needed.{Style.RESET_ALL}\n")
     
     # Parse command line arguments
+    fail_fast = "--fail-fast" in sys.argv
+    if fail_fast:
+        sys.argv.remove("--fail-fast")
+    record_traffic = "--record-traffic" in sys.argv
+    if record_traffic:
+        sys.argv.remove("--record-traffic")
+    replay_first = "--replay-first" in sys.argv
+    if replay_first:
+        sys.argv.remove("--replay-first")
+    
     if len(sys.argv) > 1:
         if sys.argv[1] in ["-h", "--help", "help"]:
             print_help()
             sys.exit(0)
         
+        if sys.argv[1] == "history":
+            sys.exit(history_main(sys.argv[2:]))
+        
+        if sys.argv[1] == "gate":
+            sys.exit(gate_main(sys.argv[2:]))
+        
+        # The load tools pull in Selenium and aiohttp; only their own commands import them
+        if sys.argv[1] == "load":
+            from load_driver import main as load_main
+            sys.exit(load_main(sys.argv[2:]))
+        
+        if sys.argv[1] == "http-load":
+            from http_load import main as http_load_main
+            sys.exit(http_load_main(sys.argv[2:]))
+        
         test_type = sys.argv[1]
     else:
         test_type = "all"
     
     # Valid test types
     valid_types = ["all", "smoke", "critical", "login", "blogs", "portfolio", 
-                   "gallery", "site_config", "backups", "dashboard"]
+                   "gallery", "site_config", "backups", "dashboard", "perf", "replay", "unit"]
     
     if test_type not in valid_types:
         print(f"{Fore.RED}Error: Invalid test type '{test_type}'{Style.RESET_ALL}")
@@ -222,5 +369,13 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # Run tests
-    exit_code = run_tests(test_type, verbose=True)
+    # The replay suite takes seconds and catches backend breakage before
+    # any browser starts
+    if replay_first and test_type != "replay":
+        exit_code = run_tests("replay", verbose=False)
+        if exit_code not in (0, 5):
+            print(f"{Fore.RED}Replay failed; browser suite not started{Style.RESET_ALL}")
+            sys.exit(exit_code)
+    
+    exit_code = run_tests(test_type, verbose=True, fail_fast=fail_fast, record_traffic=record_traffic)
     sys.exit(exit_code)
@@ -0,0 +1,280 @@
+"""
+Duration history, failure-first ordering, longest-processing-time-first
+assignment of tests to xdist workers, and fail-fast across workers
+"""
+import heapq
+import json
+import os
+import statistics
+import pytest
+from xdist.scheduler import LoadGroupScheduling
+from config import TestConfig
+
+
+class DurationStore:
+    """
+    Per-test durations from previous runs, keyed by pytest node id.
+    
+    Each run is blended into the stored value with an exponential moving
+    average so one slow outlier does not reshuffle the whole schedule.
+    """
+    
+    SMOOTHING = 0.5
+    
+    def __init__(self, path=None):
+        self.path = path or TestConfig.DURATIONS_FILE
+        self.durations = self._load()
+    
+    def _load(self):
+        """Read the durations file, starting empty if it is missing or corrupt"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return {k: float(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+    
+    def estimate(self, nodeid, default=None):
+        """Expected duration of a test in seconds"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return default if default is not None else self.default_duration()
+    
+    def default_duration(self):
+        """Estimate for tests without history: median of known tests"""
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return TestConfig.DEFAULT_TEST_DURATION
+    
+    def update(self, measured):
+        """Blend the durations measured in this run into the history"""
+        for nodeid, seconds in measured.items():
+            previous = self.durations.get(nodeid)
+            if previous is None:
+                self.durations[nodeid] = seconds
+            else:
+                self.durations[nodeid] = previous + self.SMOOTHING * (seconds - previous)
+    
+    def save(self):
+        """Atomically replace the durations file"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def priority_order(nodeids, failures, edited):
+    """
+    Failure-first order of tests
+    
+    Args:
+        nodeids: Test node ids in collection order
+        failures: Dict nodeid -> runs since it last failed (0 = previous run)
+        edited: Test files (node id prefixes) changed since the previous run
+    
+    Returns:
+        The node ids with recent failures first, latest failure first, then
+        the tests of edited files, then the rest; collection order is kept
+        within each group.
+    """
+    def rank(nodeid):
+        if nodeid in failures:
+            return (0, failures[nodeid])
+        if nodeid.split("::")[0] in edited:
+            return (1, 0)
+        return (2, 0)
+    
+    return sorted(nodeids, key=rank)
+
+
+def plan_lpt(nodeids, workers, store, first=()):
+    """
+    Assign tests to workers longest-first, each to the least loaded worker
+    
+    Args:
+        nodeids: Test node ids in collection order
+        workers: Number of workers
+        store: DurationStore with the expected durations
+        first: Node ids to hand out before all others, so they are spread
+            over the workers instead of piling up on one
+    
+    Returns:
+        (assignment, loads): dict nodeid -> worker index, and the expected
+        busy seconds of every worker. max(loads) is the expected makespan.
+    """
+    default = store.default_duration()
+    estimates = {nodeid: store.estimate(nodeid, default) for nodeid in nodeids}
+    # Stable sort keeps collection order among tests of equal length
+    ordered = sorted(nodeids, key=lambda nodeid: (nodeid not in first, -estimates[nodeid]))
+    
+    heap = [(0.0, index) for index in range(workers)]
+    loads = [0.0] * workers
+    assignment = {}
+    for nodeid in ordered:
+        load, index = heapq.heappop(heap)
+        assignment[nodeid] = index
+        loads[index] = load + estimates[nodeid]
+        heapq.heappush(heap, (loads[index], index))
+    return assignment, loads
+
+
+def base_nodeid(nodeid):
+    """Strip the @group suffix xdist's loadgroup mode appends to node ids"""
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.rsplit("@", 1)[0]
+    return nodeid
+
+
+class LptScheduling(LoadGroupScheduling):
+    """
+    xdist scheduler on the controller that sends every worker one
+    longest-first bin (--dist loadgroup).
+    
+    Once all workers have collected, plan_lpt assigns the tests without an
+    xdist_group marker to workers and each bin becomes one work unit, so
+    every worker receives exactly one bin and runs it in collection order.
+    Tests with an xdist_group marker keep xdist's loadgroup behaviour.
+    Node ids are not changed.
+    """
+    
+    def __init__(self, config, log=None, store=None, first=None):
+        super().__init__(config, log)
+        self.store = store or DurationStore()
+        self.first = first or (lambda nodeids: set())
+        self.assignment = {}
+        self.loads = []
+    
+    def schedule(self):
+        """Plan the bins from the final collection, then hand them out"""
+        if self.collection is None and not self.assignment:
+            nodeids = next(iter(self.registered_collections.values()), [])
+            # Grouped tests carry xdist's @group suffix
+            planned = [nodeid for nodeid in nodeids if base_nodeid(nodeid) == nodeid]
+            # Each worker runs its bin in collection order, so moved-up tests
+            # are handed out first and start on every worker at once
+            self.assignment, self.loads = plan_lpt(planned, len(self.nodes), self.store, first=self.first(planned))
+        super().schedule()
+    
+    def _split_scope(self, nodeid):
+        """Work unit of a test: its planned bin, or its xdist_group"""
+        if nodeid in self.assignment:
+            return f"lpt{self.assignment[nodeid]}"
+        return super()._split_scope(nodeid)
+
+
+class DurationRecorder:
+    """
+    pytest plugin on the controller (or the only process in serial runs)
+    that measures every test and every worker.
+    
+    A test's duration is setup + call + teardown. A worker's busy time is
+    the sum of its tests; its idle time is the rest of the run's makespan.
+    """
+    
+    def __init__(self, store=None):
+        self.store = store or DurationStore()
+        self.durations = {}
+        self.busy = {}
+        self.first_start = None
+        self.last_stop = None
+    
+    def pytest_runtest_logreport(self, report):
+        """Add a setup/call/teardown phase to its test and its worker"""
+        nodeid = base_nodeid(report.nodeid)
+        worker = getattr(report, "worker_id", "main")
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+        self.busy[worker] = self.busy.get(worker, 0.0) + report.duration
+        self.first_start = min(report.start, self.first_start or report.start)
+        self.last_stop = max(report.stop, self.last_stop or report.stop)
+    
+    def pytest_sessionfinish(self, session):
+        """Blend this run's durations into the history file"""
+        if self.durations:
+            self.store.update(self.durations)
+            self.store.save()
+    
+    def makespan(self):
+        """Seconds from the first test starting to the last test finishing"""
+        if self.first_start is None:
+            return 0.0
+        return self.last_stop - self.first_start
+    
+    def idle(self):
+        """Idle seconds of every worker within the makespan"""
+        makespan = self.makespan()
+        return {worker: max(0.0, makespan - busy) for worker, busy in sorted(self.busy.items())}
+
+
+class FailFast:
+    """
+    pytest plugin that ends the run after the first failure of a test
+    carrying one of the given markers.
+    
+    Serial runs stop like -x. Under xdist the controller stops its
+    DSession loop and shuts the workers down. Workers never check
+    session.shouldstop, though, and each already holds its whole bin, so
+    they do not stop: the failing process writes a flag file that every
+    process checks before each test, and the remaining tests are skipped
+    without setting up their fixtures.
+    """
+    
+    def __init__(self, path, markers):
+        self.path = path
+        self.markers = set(markers)
+        self.session = None
+    
+    def pytest_sessionstart(self, session):
+        """Remember the session so a failure can stop it"""
+        self.session = session
+    
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        """Skip the test once another process has stopped the run"""
+        reason = self.reason()
+        if reason:
+            self.stop(reason)
+            pytest.skip(f"Fail-fast: {reason} failed")
+    
+    def pytest_runtest_logreport(self, report):
+        """Stop the run when a test with a fail-fast marker fails"""
+        if not report.failed or report.when == "teardown":
+            return
+        if not self.markers.intersection(report.keywords):
+            return
+        # On the controller the worker has usually written the flag already
+        if not self.reason():
+            self.trigger(base_nodeid(report.nodeid))
+        self.stop(self.reason() or base_nodeid(report.nodeid))
+    
+    def stop(self, nodeid):
+        """Stop the session's loop: the serial runtest loop or the xdist controller's"""
+        if self.session is None or self.session.shouldstop:
+            return
+        reason = f"fail-fast: {nodeid} failed"
+        self.session.shouldstop = reason
+        dsession = self.session.config.pluginmanager.getplugin("dsession")
+        if dsession is not None and not dsession.shouldstop:
+            dsession.shouldstop = reason
+    
+    def trigger(self, nodeid):
+        """Atomically write the flag file"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(nodeid)
+        os.replace(tmp_path, self.path)
+    
+    def reason(self):
+        """Node id of the test that stopped the run, or None"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def clear(self):
+        """Remove the flag file"""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,57 @@
+"""
+API-only replay of the traffic recorded by browser tests (python run_tests.py replay)
+"""
+import hashlib
+import uuid
+import pytest
+import requests
+from backend_snapshot import ledger, sweep
+from data_factory import DataFactory
+from log_backend import get_logger
+from traffic import TrafficArchive, TrafficReplayer
+
+
+RECORDINGS = TrafficArchive().load().tests
+
+
+@pytest.fixture(scope="module")
+def replayer():
+    """One pooled HTTP session for every replayed test"""
+    replayer = TrafficReplayer()
+    
+    yield replayer
+    
+    replayer.close()
+
+
+@pytest.fixture(scope="function")
+def replay_namespace(request, api_client):
+    """Namespace of one replayed test; whatever the replay left in it is deleted afterwards"""
+    nodeid = request.node.callspec.params["nodeid"]
+    # A fresh run id per replay, so neither reruns nor parallel runs share data
+    namespace = DataFactory(
+        run_id=uuid.uuid4().hex[:6], worker_id=f"replay{hashlib.sha1(nodeid.encode()).hexdigest()[:8]}"
+    ).namespace
+    
+    yield namespace
+    
+    try:
+        sweep(api_client, namespace)
+    except requests.RequestException as e:
+        get_logger("REPLAY").warning(f"Replay data of {nodeid} left behind: {e.__class__.__name__}")
+
+
+@pytest.mark.replay
+class TestApiReplay:
+    """Recorded admin API exchanges, re-sent and diffed without a browser"""
+    
+    @pytest.mark.parametrize("nodeid", sorted(RECORDINGS))
+    def test_replay(self, replayer, replay_namespace, nodeid):
+        """Backend answers the recorded test's requests as it did during recording"""
+        # The replay writes outside the API client, so record its backups here
+        with ledger.write():
+            differences = replayer.replay(RECORDINGS[nodeid], replay_namespace)
+        
+        assert not differences, (
+            f"{len(differences)} responses differ from the recording of {nodeid}:\n" + "\n".join(differences[:20])
+        )
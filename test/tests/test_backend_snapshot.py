@@ -0,0 +1,104 @@
+"""
+Unit tests for the run-level backend restore (python run_tests.py unit)
+"""
+import json
+import pytest
+from backend_snapshot import SessionSnapshot, WriteLedger
+
+
+class FakeApi:
+    """AdminApiClient stand-in: content, backups and the site config in memory"""
+    
+    def __init__(self, entities=None, backups=(), config=None):
+        self.entities = entities or {}
+        self.entities["backup"] = [{"id": b} for b in backups]
+        self.config = config
+        self.deleted = []
+    
+    def fetch_all(self, kind):
+        return list(self.entities.get(kind, []))
+    
+    def entity_id(self, kind, entity):
+        return entity["id"]
+    
+    def add_backup(self, backup_id):
+        self.entities["backup"].append({"id": backup_id})
+    
+    def delete_many(self, kind, entity_ids):
+        self.deleted.extend((kind, entity_id) for entity_id in entity_ids)
+        self.entities[kind] = [e for e in self.entities.get(kind, []) if e["id"] not in entity_ids]
+        return len(entity_ids)
+    
+    def fetch_config(self):
+        return self.config
+    
+    def save_config(self, config):
+        self.config = config
+        self.add_backup("restore")
+
+
+@pytest.mark.unit
+class TestWriteLedger:
+    """Backups recorded around the run's own writes"""
+    
+    def test_records_only_backups_of_its_writes(self, tmp_path):
+        """Backups that appear between writes belong to someone else"""
+        api = FakeApi(backups=["old"])
+        ledger = WriteLedger()
+        ledger.record(api, str(tmp_path / "run.ledger.jsonl"))
+        with ledger.write():
+            api.add_backup("mine")
+        api.add_backup("theirs")
+        with ledger.write(config=True):
+            api.add_backup("config")
+        assert ledger.backups == ["mine", "config"]
+        assert WriteLedger.read(ledger.path) == (["mine", "config"], True)
+    
+    def test_not_recording_is_a_no_op(self):
+        """Without record() the writes run unlisted"""
+        ledger = WriteLedger()
+        with ledger.write():
+            pass
+        assert ledger.backups == [] and not ledger.config_saved
+    
+    def test_read_skips_a_cut_off_line(self, tmp_path):
+        """A line cut short by a killed worker does not lose the others"""
+        path = tmp_path / "run.ledger.jsonl"
+        path.write_text(
+            json.dumps({"pid": 1, "backups": ["a"], "config": False}) + "\n"
+            + '{"pid": 2, "backu\n'
+            + json.dumps({"pid": 3, "backups": ["a", "b"], "config": False}) + "\n",
+            encoding="utf-8"
+        )
+        assert WriteLedger.read(str(path)) == (["a", "b"], False)
+
+
+@pytest.mark.unit
+class TestSessionRestore:
+    """Only what the run changed is put back"""
+    
+    def restore(self, tmp_path, api, backups, config_saved):
+        snapshot = SessionSnapshot(api, "abc123", directory=str(tmp_path))
+        with open(snapshot.ledger_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"pid": 1, "backups": backups, "config": config_saved}) + "\n")
+        return snapshot._restore("abc123", {"title": "Original"})
+    
+    def test_sweeps_namespace_and_own_backups(self, tmp_path):
+        """Other people's entities and backups stay; the config was never saved"""
+        api = FakeApi(
+            entities={"blog": [{"id": 1, "title": "abc123-gw0-0001"}, {"id": 2, "title": "Someone else's"}]},
+            backups=["mine", "theirs"],
+            config={"title": "Changed by someone else"},
+        )
+        stats = self.restore(tmp_path, api, ["mine"], config_saved=False)
+        assert api.deleted == [("blog", 1), ("backup", "mine")]
+        assert api.config == {"title": "Changed by someone else"}
+        assert (stats["deleted"], stats["backups_deleted"], stats["config_restored"]) == (1, 1, False)
+    
+    def test_saved_config_is_put_back(self, tmp_path):
+        """The restore also removes the backup its own config save caused"""
+        api = FakeApi(backups=["config"], config={"title": "Saved by the run"})
+        stats = self.restore(tmp_path, api, ["config"], config_saved=True)
+        assert api.config == {"title": "Original"}
+        assert stats["config_restored"]
+        assert api.deleted == [("backup", "config"), ("backup", "restore")]
@@ -0,0 +1,42 @@
+"""
+Unit tests for parsing the backup date column (python run_tests.py unit)
+"""
+from datetime import datetime
+import pytest
+from pages.backups_page import parse_backup_date, parse_backup_dates
+
+
+@pytest.mark.unit
+class TestParseBackupDates:
+    """One date format per column"""
+    
+    def test_single_cells(self):
+        """ISO 8601 with offsets, locale strings with narrow no-break spaces, invalid text"""
+        assert parse_backup_date("2025-04-03T10:00:00+02:00") == datetime(2025, 4, 3, 8, 0)
+        assert parse_backup_date("4/3/2025, 10:00:00\u202fAM") == datetime(2025, 4, 3, 10, 0)
+        assert parse_backup_date("Invalid Date") is None
+        assert parse_backup_date("") is None
+    
+    def test_en_gb_column_is_read_day_first(self):
+        """Ambiguous cells follow the format the unambiguous ones require"""
+        texts = ["13/04/2025, 10:00:00", "03/04/2025, 10:00:00", "02/04/2025, 10:00:00"]
+        assert parse_backup_dates(texts) == [
+            datetime(2025, 4, 13, 10, 0), datetime(2025, 4, 3, 10, 0), datetime(2025, 4, 2, 10, 0),
+        ]
+    
+    def test_en_us_column_keeps_month_first(self):
+        """Month-first is tried first and kept when every cell fits it"""
+        texts = ["04/13/2025, 10:00:00", "04/03/2025, 10:00:00"]
+        assert parse_backup_dates(texts) == [datetime(2025, 4, 13, 10, 0), datetime(2025, 4, 3, 10, 0)]
+    
+    def test_invalid_and_iso_cells_do_not_pick_the_format(self):
+        """Invalid cells stay None and ISO cells parse whatever the locale format"""
+        texts = ["2025-04-20T10:00:00Z", "13/04/2025, 10:00:00", "Invalid Date", "03/04/2025, 10:00:00"]
+        assert parse_backup_dates(texts) == [
+            datetime(2025, 4, 20, 10, 0), datetime(2025, 4, 13, 10, 0), None, datetime(2025, 4, 3, 10, 0),
+        ]
+    
+    def test_mixed_formats_fall_back_to_each_cell(self):
+        """Without one format for every cell each cell is parsed on its own"""
+        texts = ["Apr 13, 2025, 10:00:00 AM", "04/03/2025, 10:00:00"]
+        assert parse_backup_dates(texts) == [datetime(2025, 4, 13, 10, 0), datetime(2025, 4, 3, 10, 0)]
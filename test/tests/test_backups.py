@@ -4,7 +4,6 @@ Test suite for Backup System
 import pytest
 from pages.backups_page import BackupsPage
 from pages.blogs_page import BlogsPage
-import time
 
 
 @pytest.mark.backups
@@ -41,7 +40,7 @@ class TestBackupsPage:
 class TestBackupsDisplay:
     """Backup display tests"""
     
-    def test_view_backups_list(self, authenticated_driver):
+    def test_view_backups_list(self, authenticated_driver, seeded_backups):
         """Test viewing list of backups"""
         backups_page = BackupsPage(authenticated_driver)
         backups_page.navigate()
@@ -49,41 +48,39 @@ class TestBackupsDisplay:
         count = backups_page.get_backup_count()
         backups_page.log(f"Total backups: {count}")
         
-        if count > 0:
-            backups_page.log_success("✓ Backups are displayed")
-        else:
-            backups_page.log_warning("⚠ No backups found (may be expected)")
+        assert count > 0, "No backups displayed after seeding content"
+        backups_page.log_success("✓ Backups are displayed")
     
-    def test_backup_dates_valid(self, authenticated_driver):
+    def test_backup_dates_valid(self, authenticated_driver, seeded_backups):
         """Test that backup dates are valid (not 'Invalid Date')"""
         backups_page = BackupsPage(authenticated_driver)
         backups_page.navigate()
         
-        if backups_page.get_backup_count() > 0:
-            assert backups_page.verify_backups_sorted_latest_first(), "Date validation failed"
-            backups_page.log_success("✓ Backup dates are valid")
+        assert backups_page.get_backup_count() > 0, "No backups displayed after seeding content"
+        assert backups_page.verify_backups_sorted_latest_first(), "Date validation failed"
+        backups_page.log_success("✓ Backup dates are valid")
     
-    def test_view_backup_details(self, authenticated_driver):
+    def test_view_backup_details(self, authenticated_driver, seeded_backups):
         """Test viewing backup details dialog"""
         backups_page = BackupsPage(authenticated_driver)
         backups_page.navigate()
         
-        if backups_page.get_backup_count() > 0:
-            backups_page.click_view_on_first_backup()
-            
-            assert backups_page.is_dialog_open(), "Backup details dialog did not open"
-            backups_page.log_success("✓ Backup details dialog opened")
-            
-            backups_page.close_dialog()
-            assert not backups_page.is_dialog_open(), "Dialog did not close"
-            backups_page.log_success("✓ Backup details dialog closed")
+        assert backups_page.get_backup_count() > 0, "No backups displayed after seeding content"
+        backups_page.click_view_on_first_backup()
+        
+        assert backups_page.is_dialog_open(), "Backup details dialog did not open"
+        backups_page.log_success("✓ Backup details dialog opened")
+        
+        backups_page.close_dialog()
+        assert not backups_page.is_dialog_open(), "Dialog did not close"
+        backups_page.log_success("✓ Backup details dialog closed")
 
 
 @pytest.mark.backups
 class TestAutomaticBackups:
     """Test automatic backup creation"""
     
-    def test_backup_created_on_blog_save(self, authenticated_driver):
+    def test_backup_created_on_blog_save(self, authenticated_driver, test_data):
         """Test that backup is created when saving blog"""
         # First, check current backup count
         backups_page = BackupsPage(authenticated_driver)
@@ -95,14 +92,14 @@ class TestAutomaticBackups:
         blogs_page = BlogsPage(authenticated_driver)
         blogs_page.navigate()
         
-        test_blog = {
-            "title": "Backup Test Blog " + str(time.time()),
-            "slug": "backup-test-" + str(int(time.time())),
+        test_blog = test_data.blog({
+            "title": "Backup Test Blog",
+            "slug": "backup-test",
             "content": "Testing automatic backup creation"
-        }
+        })
         
         blogs_page.create_blog(test_blog)
-        time.sleep(3)  # Wait for backup to be created
+        blogs_page.wait_for_dom_quiet(replaces=3)  # Wait for backup to be created
         
         # Check if backup count increased
         backups_page.navigate()
@@ -114,16 +111,13 @@ class TestAutomaticBackups:
         else:
             backups_page.log_warning("⚠ Backup count did not increase (may be expected)")
     
-    def test_backup_naming_convention(self, authenticated_driver):
+    def test_backup_naming_convention(self, authenticated_driver, seeded_backups):
         """Test that backups follow naming convention"""
         backups_page = BackupsPage(authenticated_driver)
         backups_page.navigate()
         
         if backups_page.get_backup_count() > 0:
-            from selenium.webdriver.common.by import By
-            first_row = backups_page.find_elements(backups_page.TABLE_ROWS)[0]
-            filename_cell = first_row.find_elements(By.TAG_NAME, "td")[0]
-            filename = filename_cell.text
+            filename = backups_page.get_latest_backup_filename() or ""
             
             backups_page.log(f"Backup filename: {filename}")
             
@@ -138,7 +132,7 @@ class TestAutomaticBackups:
 class TestBackupsEdgeCases:
     """Edge case tests for backups"""
     
-    def test_view_multiple_backups_sequentially(self, authenticated_driver):
+    def test_view_multiple_backups_sequentially(self, authenticated_driver, seeded_backups):
         """Test viewing multiple backups in sequence"""
         backups_page = BackupsPage(authenticated_driver)
         backups_page.navigate()
@@ -148,9 +142,9 @@ class TestBackupsEdgeCases:
         if count >= 3:
             for i in range(min(3, count)):
                 backups_page.click_view_on_first_backup()
-                time.sleep(1)
+                backups_page.wait_for_dom_quiet(replaces=1)
                 backups_page.close_dialog()
-                time.sleep(0.5)
+                backups_page.wait_for_dom_quiet(replaces=0.5)
             
             backups_page.log_success("✓ Viewed multiple backups sequentially")
     
@@ -162,7 +156,7 @@ class TestBackupsEdgeCases:
         initial_count = backups_page.get_backup_count()
         
         backups_page.refresh_page()
-        time.sleep(2)
+        backups_page.wait_for_dom_quiet(replaces=2)
         
         new_count = backups_page.get_backup_count()
         
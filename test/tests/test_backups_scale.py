@@ -0,0 +1,57 @@
+"""
+Backups page at growing numbers of backups (python run_tests.py perf)
+"""
+import time
+import pytest
+from config import TestConfig
+from pages.backups_page import BackupsPage
+from page_load import PageLoadProbe, recorder
+
+
+@pytest.fixture(scope="class")
+def backup_set(api_client, data_factory, backend_checkpoint):
+    """
+    Grows the server's backup list to a given size
+    
+    Every update of one seeded blog leaves a backup behind; the checkpoint
+    removes the blog and all backups written for the benchmark afterwards.
+    """
+    blog = data_factory.seed("blog", register=False)[0]
+    
+    def grow_to(size):
+        missing = size - len(api_client.fetch_all("backup"))
+        if missing > 0:
+            api_client.update_many("blog", [
+                (blog.id, dict(blog.data, excerpt=f"{blog.data['excerpt']} #{n}")) for n in range(missing)
+            ])
+        return len(api_client.fetch_all("backup"))
+    
+    return grow_to
+
+
+@pytest.mark.perf
+class TestBackupsScale:
+    """Load, time to a fully populated table and row ordering per backup count"""
+    
+    @pytest.mark.parametrize("size", sorted(TestConfig.BACKUP_SCALE_SIZES))
+    def test_backups_at_size(self, authenticated_driver, backup_set, size):
+        """Backups page with at least `size` backups"""
+        available = backup_set(size)
+        page = BackupsPage(authenticated_driver)
+        if available < size:
+            page.log_warning(f"Server keeps {available} backups, fewer than the {size} requested")
+        
+        samples = PageLoadProbe(authenticated_driver).measure(page, "cold", count_rows=True)
+        recorder.add(f"BackupsPage[{size}]", "cold", samples)
+        rows = max((s.get("rows") or 0 for s in samples), default=0)
+        page.log(f"BackupsPage[{size}]: {available} backups on the server, {rows} rows rendered")
+        
+        start = time.perf_counter()
+        order = page.check_backup_order()
+        page.log(f"Checked {order['rows']} rows in {(time.perf_counter() - start) * 1000:.0f}ms")
+        
+        assert order["rows"] > 0, "No backup rows rendered"
+        assert not order["invalid"], f"{len(order['invalid'])} invalid dates, first: {order['invalid'][:3]}"
+        assert not order["out_of_order"], (
+            f"{len(order['out_of_order'])} rows out of order, first: {order['out_of_order'][:3]}"
+        )
@@ -0,0 +1,126 @@
+"""
+Blogs table, search and pagination at growing numbers of blog posts (python run_tests.py perf)
+"""
+import pytest
+from config import TestConfig
+from data_factory import SEED_TEMPLATES
+from history import percentile
+from pages.blogs_page import BlogsPage
+from page_load import PageLoadProbe, recorder
+from tests.test_blogs_crud import EDGE_CASE_BLOGS
+
+
+# Edge case blogs whose titles need more than ASCII, seeded so unicode queries have hits
+UNICODE_BLOGS = [blog for blog in EDGE_CASE_BLOGS if not blog["title"].isascii()]
+
+
+def search_corpus(target):
+    """Queries per class, keyed by the metric they are recorded as"""
+    title = SEED_TEMPLATES["blog"]["title"]
+    return {
+        # Growing prefixes of the seeded title match nearly every row; the tag prefix up to 100
+        "search_prefix": [title[:1], title[:4], title, target.lookup[:-2]],
+        "search_exact": [target.lookup],
+        "search_no_match": ["zqxjv", f"{target.lookup}-missing", f"{title}s [none]"],
+        "search_unicode": sorted({
+            word for blog in UNICODE_BLOGS for word in blog["title"].split() if not word.isascii()
+        }),
+    }
+
+
+@pytest.fixture(scope="class")
+def blog_set(api_client, data_factory, backend_checkpoint):
+    """
+    Grows the server's blog list to a given size
+    
+    The first seeded blog is the search target; being the oldest it sits
+    on the last page. The checkpoint removes every seeded blog afterwards,
+    so none are registered with the session-wide factory: later tests would
+    otherwise try to delete tens of thousands of them again.
+    """
+    target = data_factory.seed("blog", register=False)[0]
+    for blog in UNICODE_BLOGS:
+        data_factory.seed("blog", template=dict(SEED_TEMPLATES["blog"], **blog), register=False)
+    
+    def grow_to(size):
+        missing = size - len(api_client.fetch_all("blog"))
+        if missing > 0:
+            data_factory.seed("blog", count=missing, register=False)
+        return target, len(api_client.fetch_all("blog"))
+    
+    return grow_to
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("size", sorted(TestConfig.BLOG_SCALE_SIZES), scope="class")
+class TestBlogsScale:
+    """Time to interactive, table render, pagination and search per blog count"""
+    
+    def test_blogs_at_size(self, authenticated_driver, blog_set, size):
+        """Blogs page with at least `size` blog posts"""
+        target, available = blog_set(size)
+        route = f"BlogsPage[{size}]"
+        page = BlogsPage(authenticated_driver)
+        probe = PageLoadProbe(authenticated_driver)
+        
+        samples = probe.measure(page, "cold", count_rows=True)
+        recorder.add(route, "cold", samples)
+        rows = max((s.get("rows") or 0 for s in samples), default=0)
+        page.log(f"{route}: {available} blogs on the server, {rows} rows rendered")
+        assert rows > 0, "No blog rows rendered"
+        
+        steps = []
+        for _ in range(TestConfig.PERF_ITERATIONS):
+            if not page.has_next_page():
+                break
+            elapsed = probe.interaction(page, "click", lambda: page.click(page.NEXT_PAGE))
+            if elapsed is None:
+                break
+            steps.append({"next_page": elapsed})
+        recorder.add(route, "cold", steps)
+        if not steps:
+            page.log_warning(f"{route}: no pagination to step through")
+        
+        searches = []
+        for _ in range(TestConfig.PERF_ITERATIONS):
+            page.navigate()
+            page.wait_for_visible(page.READY, timeout=probe.timeout)
+            if not page.is_element_present(page.SEARCH_INPUT, timeout=2):
+                page.log_warning(f"{route}: search input not found")
+                break
+            elapsed = probe.interaction(
+                page, "input", lambda: page.fill_form({page.SEARCH_INPUT: target.lookup}), expected=target.lookup
+            )
+            assert elapsed is not None, f"Search for {target.lookup} did not bring its blog to the top"
+            searches.append({"search": elapsed})
+        recorder.add(route, "cold", searches)
+    
+    def test_search_latency_at_size(self, authenticated_driver, blog_set, size):
+        """Keystroke-to-results latency of each query class with at least `size` blog posts"""
+        target, _ = blog_set(size)
+        route = f"BlogsPage[{size}]"
+        page = BlogsPage(authenticated_driver)
+        probe = PageLoadProbe(authenticated_driver)
+        
+        page.navigate()
+        page.wait_for_visible(page.READY, timeout=probe.timeout)
+        if not page.is_element_present(page.SEARCH_INPUT, timeout=2):
+            pytest.skip("Search input not found")
+        
+        unsettled = []
+        for metric, queries in search_corpus(target).items():
+            latencies = []
+            for _ in range(TestConfig.PERF_ITERATIONS):
+                for query in queries:
+                    result = probe.search(page, query)
+                    if result is None:
+                        unsettled.append(query)
+                    else:
+                        latencies.append(result["latency"])
+            recorder.add(route, "cold", [{metric: latency} for latency in latencies])
+            page.log(
+                f"{route} {metric}: p50 {percentile(latencies, 0.5):.0f}ms, "
+                f"p95 {percentile(latencies, 0.95):.0f}ms over {len(latencies)} queries"
+            )
+        
+        assert not unsettled, f"Results still changing after {probe.timeout}s for: {sorted(set(unsettled))}"
@@ -122,6 +122,6 @@ class TestNavigation:
             navigate_func()
             assert page_name in dashboard.get_current_url(), f"Failed to navigate to {page_name}"
             dashboard.log_success(f"✓ Navigated to {page_name}")
-            dashboard.wait(0.5)
+            dashboard.wait_for_dom_quiet(replaces=0.5)
         
         dashboard.log_success("✓ Successfully navigated through all pages")
@@ -0,0 +1,64 @@
+"""
+Unit tests for namespaced test data cleanup (python run_tests.py unit)
+"""
+import pytest
+import requests
+from data_factory import DataFactory
+
+
+class FakeApi:
+    """AdminApiClient stand-in holding entities in memory"""
+    
+    def __init__(self, entities, fail_fetch=False):
+        self.entities = entities
+        self.fail_fetch = fail_fetch
+        self.deleted = []
+    
+    def fetch_all(self, kind):
+        if self.fail_fetch:
+            raise requests.ConnectionError()
+        return list(self.entities.get(kind, []))
+    
+    def entity_id(self, kind, entity):
+        return entity["id"]
+    
+    def create_many(self, kind, items):
+        ids = [len(self.entities.setdefault(kind, [])) + 100 + n for n in range(len(items))]
+        self.entities[kind].extend(dict(item, id=entity_id) for item, entity_id in zip(items, ids))
+        return ids
+    
+    def delete_many(self, kind, entity_ids):
+        self.deleted.extend((kind, entity_id) for entity_id in entity_ids)
+        return len(entity_ids)
+
+
+@pytest.mark.unit
+class TestCleanup:
+    """Seeded and UI-created entities deleted through the API"""
+    
+    def test_ui_created_entities_are_found_by_tag(self):
+        """Tagged entities are looked up through the API; other rows stay"""
+        factory = DataFactory(run_id="abc123", worker_id="gw0")
+        blog = factory.blog({"title": "Blog", "slug": "blog"})
+        factory.api = FakeApi({"blog": [
+            {"id": 1, "title": "Someone else's"},
+            {"id": 2, "title": blog["title"], "slug": blog["slug"]},
+        ]})
+        assert factory.cleanup() == 1
+        assert factory.api.deleted == [("blog", 2)]
+        assert factory.created == []
+    
+    def test_seeded_and_missing_entities(self):
+        """Seeded entities go by id; UI entities that were never created are skipped"""
+        factory = DataFactory(run_id="abc123", worker_id="gw0", api=FakeApi({}))
+        seeded = factory.seed("blog", template={"title": "Seeded"})[0]
+        factory.project({"title": "Never saved"})
+        factory.cleanup()
+        assert factory.api.deleted == [("blog", seeded.id)]
+    
+    def test_failed_lookup_is_only_logged(self):
+        """Without a driver to fall back on the entities are left and the teardown passes"""
+        factory = DataFactory(run_id="abc123", worker_id="gw0", api=FakeApi({}, fail_fetch=True))
+        factory.blog({"title": "Blog"})
+        assert factory.cleanup() == 0
+        assert factory.api.deleted == []
@@ -0,0 +1,31 @@
+"""
+Unit tests for the run history statistics (python run_tests.py unit)
+"""
+import pytest
+from history import percentile
+
+
+@pytest.mark.unit
+class TestPercentile:
+    """Nearest-rank percentiles, as every p50/p95/p99 of the suite uses them"""
+    
+    @pytest.mark.parametrize("n, fraction, expected", [
+        (10, 0.5, 5),
+        (20, 0.95, 19),
+        (2, 0.5, 1),
+        (6, 0.5, 3),
+        (14, 0.5, 7),
+        (18, 0.5, 9),
+        (100, 0.99, 99),
+        (5, 0.95, 5),
+    ])
+    def test_nearest_rank(self, n, fraction, expected):
+        """The ceil(fraction * n)-th smallest of 1..n"""
+        assert percentile(list(range(n, 0, -1)), fraction) == expected
+    
+    def test_bounds(self):
+        """Fraction 0 gives the minimum, 1 the maximum, no values 0.0"""
+        values = [3.0, 1.0, 2.0]
+        assert percentile(values, 0.0) == 1.0
+        assert percentile(values, 1.0) == 3.0
+        assert percentile([], 0.5) == 0.0
@@ -42,7 +42,7 @@ class TestLogin:
         assert login_page.is_on_login_page(), "Not on login page after failed login"
         
         # Check for error message
-        login_page.wait(2)
+        login_page.wait_for_dom_quiet(replaces=2)
         toast_text = login_page.wait_for_toast()
         if toast_text:
             assert "invalid" in toast_text.lower() or "error" in toast_text.lower(), "Expected error message not shown"
@@ -88,7 +88,7 @@ class TestLoginEdgeCases:
         for password in special_passwords:
             login_page.enter_password(password)
             login_page.click_sign_in()
-            login_page.wait(1)
+            login_page.wait_for_dom_quiet(replaces=1)
             
             # Should still be on login page
             assert login_page.is_on_login_page(), f"Unexpected behavior with password: {password}"
@@ -117,7 +117,7 @@ class TestLoginEdgeCases:
         for password in case_variations:
             login_page.enter_password(password)
             login_page.click_sign_in()
-            login_page.wait(1)
+            login_page.wait_for_dom_quiet(replaces=1)
             
             # All should fail (except 'admin')
             assert login_page.is_on_login_page(), f"Case sensitivity issue with: {password}"
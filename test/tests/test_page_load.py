@@ -0,0 +1,41 @@
+"""
+Page-load benchmark for every admin route (python run_tests.py perf)
+"""
+import pytest
+from pages.login_page import LoginPage
+from pages.dashboard_page import DashboardPage
+from pages.blogs_page import BlogsPage
+from pages.portfolio_page import PortfolioPage
+from pages.gallery_page import GalleryPage
+from pages.site_config_page import SiteConfigPage
+from pages.backups_page import BackupsPage
+from page_load import PageLoadProbe, recorder
+
+
+ADMIN_PAGES = [DashboardPage, BlogsPage, PortfolioPage, GalleryPage, SiteConfigPage, BackupsPage]
+
+
+def benchmark(driver, page_class, mode):
+    """Measure one route in one cache mode and record the samples"""
+    page = page_class(driver)
+    samples = PageLoadProbe(driver).measure(page, mode)
+    recorder.add(page_class.__name__, mode, samples)
+    
+    ready = [s for s in samples if s.get("data_ready") is not None]
+    page.log(f"{page_class.__name__} ({mode}): {len(ready)}/{len(samples)} loads reached {page.READY[1]}")
+    assert samples and all(s.get("ttfb") is not None for s in samples), "No Navigation Timing entry recorded"
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("mode", ["cold", "warm"])
+class TestPageLoad:
+    """Navigation Timing, FCP, LCP and data readiness of each route"""
+    
+    def test_login_page(self, driver, mode):
+        """Login page, logged out"""
+        benchmark(driver, LoginPage, mode)
+    
+    @pytest.mark.parametrize("page_class", ADMIN_PAGES, ids=lambda page_class: page_class.__name__)
+    def test_admin_page(self, authenticated_driver, page_class, mode):
+        """Admin route behind the login"""
+        benchmark(authenticated_driver, page_class, mode)
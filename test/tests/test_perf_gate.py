@@ -0,0 +1,143 @@
+"""
+Unit tests for the performance regression gate statistics (python run_tests.py unit)
+"""
+import itertools
+import math
+import pytest
+from perf_gate import PerfGate, compare, effect_label, holm, mann_whitney_greater, _exact_upper_tail
+
+
+def brute_force_upper_tail(u, m, n):
+    """P(U >= u) by enumerating which of the m + n ranks belong to the current sample"""
+    hits = total = 0
+    for ranks in itertools.combinations(range(1, m + n + 1), m):
+        total += 1
+        hits += sum(ranks) - m * (m + 1) / 2 >= u
+    return hits / total
+
+
+@pytest.mark.unit
+class TestMannWhitney:
+    """One-sided U test: exact without ties, normal approximation with tie correction"""
+    
+    @pytest.mark.parametrize("current, baseline, u, p", [
+        ([4, 5, 6], [1, 2, 3], 9, 1 / 20),
+        ([3, 5, 6], [1, 2, 4], 8, 2 / 20),
+        ([1, 2, 3], [4, 5, 6], 0, 1.0),
+        ([2], [1], 1, 0.5),
+    ])
+    def test_exact_values(self, current, baseline, u, p):
+        """Known U and p of small samples without ties"""
+        assert mann_whitney_greater(current, baseline) == (u, pytest.approx(p))
+    
+    @pytest.mark.parametrize("m, n", [(1, 1), (2, 3), (4, 4), (5, 3), (3, 6)])
+    def test_exact_tail_matches_enumeration(self, m, n):
+        """The recursive count agrees with enumerating every rank arrangement"""
+        for u in range(m * n + 1):
+            assert _exact_upper_tail(u, m, n) == pytest.approx(brute_force_upper_tail(u, m, n))
+    
+    def test_ties_use_midranks_and_corrected_variance(self):
+        """Ties get the average rank and switch to the tie-corrected normal approximation"""
+        u, p = mann_whitney_greater([2, 3], [1, 2])
+        assert u == 3.5
+        # mean 2, variance 4 / 12 * (5 - (2 ** 3 - 2) / (4 * 3)) = 1.5, continuity correction 0.5
+        assert p == pytest.approx(0.5 * math.erfc((3.5 - 2 - 0.5) / math.sqrt(1.5) / math.sqrt(2)))
+    
+    def test_all_values_tied(self):
+        """No variance left: nothing is significant"""
+        assert mann_whitney_greater([5] * 5, [5] * 5) == (12.5, 1.0)
+    
+    def test_large_samples_use_normal_approximation(self):
+        """Beyond 20 values per side a fully separated sample is highly significant"""
+        u, p = mann_whitney_greater(list(range(21, 42)), list(range(21)))
+        assert u == 21 * 21
+        assert p < 1e-6
+
+
+@pytest.mark.unit
+class TestCompare:
+    """Verdicts need both significance and a median change beyond the threshold"""
+    
+    BASELINE = [100, 102, 98, 101, 99, 103, 97, 100, 101, 99]
+    
+    def verdict(self, current, baseline=None):
+        """compare() with fixed settings"""
+        return compare(current, baseline or self.BASELINE, alpha=0.05, threshold=0.10, min_samples=5)
+    
+    def test_regression(self):
+        """Consistently 20% slower"""
+        result = self.verdict([v * 1.2 for v in self.BASELINE])
+        assert result["verdict"] == "regression"
+        assert result["change"] == pytest.approx(0.2)
+        assert result["cliffs_delta"] == 1.0
+        assert result["effect"] == "large"
+    
+    def test_improvement(self):
+        """Consistently 20% faster"""
+        result = self.verdict([v * 0.8 for v in self.BASELINE])
+        assert result["verdict"] == "improvement"
+        assert result["cliffs_delta"] == -1.0
+    
+    def test_significant_but_below_threshold(self):
+        """5% slower in every sample is significant, but not a regression"""
+        result = self.verdict([v + 5 for v in self.BASELINE])
+        assert result["p_value"] < 0.05
+        assert result["verdict"] == "ok"
+    
+    def test_large_but_noisy_change(self):
+        """A higher median from a few outliers is not significant"""
+        result = self.verdict([60, 140, 70, 150, 80, 160, 90, 170, 95, 165])
+        assert result["change"] > 0.10
+        assert result["p_value"] >= 0.05
+        assert result["verdict"] == "ok"
+    
+    def test_insufficient_samples(self):
+        """Fewer than min_samples on either side gives no verdict"""
+        assert self.verdict([200, 210, 220])["verdict"] == "insufficient"
+        assert self.verdict(self.BASELINE, [100, 101])["verdict"] == "insufficient"
+    
+    @pytest.mark.parametrize("delta, label", [
+        (0.1, "negligible"), (-0.2, "small"), (0.4, "medium"), (-0.9, "large"),
+    ])
+    def test_effect_labels(self, delta, label):
+        """Cliff's delta size thresholds, either direction"""
+        assert effect_label(delta) == label
+
+
+@pytest.mark.unit
+class TestMultipleComparisons:
+    """Holm-Bonferroni adjustment of the p-values across metrics"""
+    
+    BASELINE = TestCompare.BASELINE
+    
+    def test_holm_values(self):
+        """Sorted p-values times k, k - 1, ...; monotone and capped at 1"""
+        assert holm([0.04, 0.01, 0.03, 0.5]) == pytest.approx([0.09, 0.04, 0.09, 0.5])
+        assert holm([0.6, 0.4]) == pytest.approx([0.8, 0.8])
+        assert holm([]) == []
+    
+    def test_marginal_regression_needs_correction(self, tmp_path):
+        """Significant on its own, but not among many unchanged metrics"""
+        slower = [v * 1.2 for v in self.BASELINE[:5]]
+        single = compare(slower, self.BASELINE[:5], alpha=0.05, threshold=0.10, min_samples=5)
+        assert single["p_value"] < 0.05 and single["verdict"] == "regression"
+        
+        gate = PerfGate(str(tmp_path / "baseline.json"))
+        gate.baseline["metrics"] = {f"m{n}": self.BASELINE[:5] for n in range(20)}
+        samples = {f"m{n}": self.BASELINE[:5] for n in range(1, 20)}
+        samples["m0"] = slower
+        results = gate.compare(samples, alpha=0.05, threshold=0.10, min_samples=5)
+        # 1 / 252 on its own, the smallest of 20
+        assert results["m0"]["p_value"] == pytest.approx(20 * single["p_value"])
+        assert results["m0"]["verdict"] == "ok"
+    
+    def test_strong_regression_survives(self, tmp_path):
+        """A clear slowdown stays a regression; insufficient metrics are not counted"""
+        gate = PerfGate(str(tmp_path / "baseline.json"))
+        gate.baseline["metrics"] = {"slow": self.BASELINE, "same": self.BASELINE, "few": [1, 2]}
+        results = gate.compare(
+            {"slow": [v * 1.2 for v in self.BASELINE], "same": self.BASELINE, "few": [1, 2]},
+            alpha=0.05, threshold=0.10, min_samples=5
+        )
+        assert results["slow"]["verdict"] == "regression"
+        assert results["few"]["verdict"] == "insufficient"
@@ -3,7 +3,6 @@ Comprehensive test suite for Portfolio CRUD operations
 """
 import pytest
 from pages.portfolio_page import PortfolioPage
-import time
 
 
 # Test Data
@@ -72,7 +71,7 @@ class TestPortfolioPage:
 class TestPortfolioCreate:
     """Portfolio creation tests"""
     
-    def test_create_valid_project(self, authenticated_driver):
+    def test_create_valid_project(self, authenticated_driver, test_data):
         """Test creating a project with valid data"""
         portfolio_page = PortfolioPage(authenticated_driver)
         portfolio_page.navigate()
@@ -80,43 +79,44 @@ class TestPortfolioCreate:
         initial_count = portfolio_page.get_table_row_count()
         portfolio_page.log(f"Initial project count: {initial_count}")
         
-        success = portfolio_page.create_portfolio_project(VALID_PROJECT)
+        project = test_data.project(VALID_PROJECT)
+        success = portfolio_page.create_portfolio_project(project)
         assert success, "Project creation failed"
         
-        time.sleep(2)
+        portfolio_page.wait_for_dom_quiet(replaces=2)
         portfolio_page.refresh_page()
         
         new_count = portfolio_page.get_table_row_count()
         portfolio_page.log(f"New project count: {new_count}")
         
-        assert portfolio_page.verify_project_in_table(VALID_PROJECT["title"]), "Project not found in table"
+        assert portfolio_page.verify_project_in_table(project["title"]), "Project not found in table"
         portfolio_page.log_success("✓ Project created and verified in table")
     
-    def test_create_project_with_multiple_tech_stack(self, authenticated_driver):
+    def test_create_project_with_multiple_tech_stack(self, authenticated_driver, test_data):
         """Test creating project with many technologies"""
         portfolio_page = PortfolioPage(authenticated_driver)
         portfolio_page.navigate()
         
-        project_with_many_techs = {
+        project_with_many_techs = test_data.project({
             "title": "Full Stack Project",
             "description": "Project using many technologies",
             "techStack": ["React", "Vue", "Angular", "Node.js", "Python", "Django", "Flask", "Docker", "Kubernetes", "AWS"]
-        }
+        })
         
         success = portfolio_page.create_portfolio_project(project_with_many_techs)
         if success:
             portfolio_page.log_success("✓ Project with many technologies created")
     
-    def test_create_featured_project(self, authenticated_driver):
+    def test_create_featured_project(self, authenticated_driver, test_data):
         """Test creating a featured project"""
         portfolio_page = PortfolioPage(authenticated_driver)
         portfolio_page.navigate()
         
-        featured_project = {
+        featured_project = test_data.project({
             "title": "Featured Test Project",
             "description": "This is a featured project",
             "featured": True
-        }
+        })
         
         success = portfolio_page.create_portfolio_project(featured_project)
         if success:
@@ -124,15 +124,17 @@ class TestPortfolioCreate:
 
 
 @pytest.mark.portfolio
+@pytest.mark.usefixtures("backend_checkpoint")
 class TestPortfolioEdgeCases:
     """Edge case tests for portfolio"""
     
     @pytest.mark.parametrize("project_data", EDGE_CASE_PROJECTS,
                              ids=["special_chars", "very_long", "unicode", "invalid_urls"])
-    def test_create_project_edge_cases(self, authenticated_driver, project_data):
+    def test_create_project_edge_cases(self, authenticated_driver, test_data, project_data):
         """Test project creation with various edge cases"""
         portfolio_page = PortfolioPage(authenticated_driver)
         portfolio_page.navigate()
+        project_data = test_data.project(project_data)
         
         portfolio_page.log(f"Testing edge case: {project_data.get('title', 'N/A')[:50]}")
         
@@ -141,7 +143,7 @@ class TestPortfolioEdgeCases:
             portfolio_page.fill_portfolio_form(project_data)
             portfolio_page.click_save()
             
-            time.sleep(2)
+            portfolio_page.wait_for_dom_quiet(replaces=2)
             portfolio_page.log_success(f"✓ Edge case handled")
         except Exception as e:
             portfolio_page.log_error(f"Edge case failed: {str(e)}")
@@ -162,7 +164,7 @@ class TestPortfolioEdgeCases:
             portfolio_page.click_add_project()
             portfolio_page.fill_portfolio_form(empty_project)
             portfolio_page.click_save()
-            time.sleep(2)
+            portfolio_page.wait_for_dom_quiet(replaces=2)
             
             # Should still be in dialog or show validation error
             portfolio_page.log_success("✓ Empty fields validation handled")
@@ -174,7 +176,7 @@ class TestPortfolioEdgeCases:
 class TestPortfolioRead:
     """Portfolio reading/viewing tests"""
     
-    def test_view_portfolio_table(self, authenticated_driver):
+    def test_view_portfolio_table(self, authenticated_driver, seeded_project):
         """Test viewing portfolio in table"""
         portfolio_page = PortfolioPage(authenticated_driver)
         portfolio_page.navigate()
@@ -182,29 +184,28 @@ class TestPortfolioRead:
         count = portfolio_page.get_table_row_count()
         portfolio_page.log(f"Total projects in table: {count}")
         
-        if count > 0:
-            portfolio_page.log_success("✓ Portfolio projects displayed in table")
-        else:
-            portfolio_page.log_warning("⚠ No projects found (may be expected)")
+        assert count > 0, "No projects displayed in table"
+        assert portfolio_page.verify_project_in_table(seeded_project.lookup), "Seeded project not found in table"
+        portfolio_page.log_success("✓ Portfolio projects displayed in table")
 
 
 @pytest.mark.portfolio
 class TestPortfolioUpdate:
     """Portfolio update tests"""
     
-    def test_edit_project(self, authenticated_driver):
+    def test_edit_project(self, authenticated_driver, test_data, seeded_project):
         """Test editing an existing project"""
         portfolio_page = PortfolioPage(authenticated_driver)
         portfolio_page.navigate()
         
-        if portfolio_page.click_edit_on_first_row():
-            updated_data = {
-                "title": "Updated Project Title - " + str(time.time())
-            }
-            portfolio_page.fill_portfolio_form(updated_data)
-            portfolio_page.click_save()
-            
-            time.sleep(2)
-            portfolio_page.log_success("✓ Project edited successfully")
-        else:
-            portfolio_page.log_warning("⚠ No projects to edit")
+        assert portfolio_page.click_edit_on_row(seeded_project.lookup), "Seeded project not found"
+        
+        updated_data = {
+            "title": test_data.text("Updated Project Title", seeded_project.tag)
+        }
+        portfolio_page.fill_portfolio_form(updated_data)
+        portfolio_page.click_save()
+        
+        portfolio_page.wait_for_dom_quiet(replaces=2)
+        assert portfolio_page.verify_project_in_table(updated_data["title"]), "Updated title not found in table"
+        portfolio_page.log_success("✓ Project edited successfully")
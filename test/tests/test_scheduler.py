@@ -0,0 +1,154 @@
+"""
+Unit tests for duration history and longest-first worker assignment (python run_tests.py unit)
+"""
+import json
+import pytest
+from scheduler import DurationStore, LptScheduling, base_nodeid, plan_lpt, priority_order
+
+
+class FakeNode:
+    """Just what the xdist schedulers use of a worker node"""
+    
+    def __init__(self, name):
+        self.gateway = type("Gateway", (), {"id": name})()
+        self.sent = []
+        self.shutting_down = False
+    
+    def send_runtest_some(self, indexes):
+        self.sent.extend(indexes)
+    
+    def shutdown(self):
+        self.shutting_down = True
+
+
+class FakeConfig:
+    """The pytest options the xdist schedulers read"""
+    
+    def __init__(self, workers):
+        self.workers = workers
+    
+    def getvalue(self, name):
+        return [f"{self.workers}*popen"] if name == "tx" else None
+
+
+def store_with(tmp_path, durations):
+    """DurationStore backed by a temporary file holding durations"""
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps(durations), encoding="utf-8")
+    return DurationStore(str(path))
+
+
+@pytest.mark.unit
+class TestDurationStore:
+    """Smoothed per-test durations on disk"""
+    
+    def test_missing_or_corrupt_file_starts_empty(self, tmp_path):
+        """No history is not an error"""
+        assert DurationStore(str(tmp_path / "missing.json")).durations == {}
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json", encoding="utf-8")
+        assert DurationStore(str(corrupt)).durations == {}
+    
+    def test_update_blends_with_moving_average(self, tmp_path):
+        """New tests take the measured value, known tests move halfway towards it"""
+        store = store_with(tmp_path, {"a": 10.0})
+        store.update({"a": 20.0, "b": 4.0})
+        assert store.durations == {"a": 15.0, "b": 4.0}
+    
+    def test_save_round_trip(self, tmp_path):
+        """Saved durations load back unchanged"""
+        store = store_with(tmp_path, {})
+        store.update({"a": 1.5, "b": 2.5})
+        store.save()
+        assert DurationStore(store.path).durations == {"a": 1.5, "b": 2.5}
+    
+    def test_unknown_tests_get_the_median(self, tmp_path):
+        """Tests without history are estimated at the median of known ones"""
+        store = store_with(tmp_path, {"a": 1.0, "b": 3.0, "c": 10.0})
+        assert store.estimate("a") == 1.0
+        assert store.estimate("new") == 3.0
+        assert store.estimate("new", default=7.0) == 7.0
+
+
+@pytest.mark.unit
+class TestPlanLpt:
+    """Longest-processing-time-first assignment"""
+    
+    def test_longest_first_to_least_loaded(self, tmp_path):
+        """7, 6, 5, 4, 3 on two workers: 7+4+3 and 6+5"""
+        store = store_with(tmp_path, {"t3": 3, "t4": 4, "t5": 5, "t6": 6, "t7": 7})
+        assignment, loads = plan_lpt(["t3", "t4", "t5", "t6", "t7"], 2, store)
+        assert loads == [14.0, 11.0]
+        assert assignment == {"t7": 0, "t6": 1, "t5": 1, "t4": 0, "t3": 0}
+    
+    def test_first_tests_are_spread_over_workers(self, tmp_path):
+        """Prioritised tests are handed out before longer ones"""
+        store = store_with(tmp_path, {"short1": 1, "short2": 1, "long": 100})
+        assignment, _ = plan_lpt(["long", "short1", "short2"], 2, store, first={"short1", "short2"})
+        assert assignment["short1"] != assignment["short2"]
+    
+    def test_equal_estimates_keep_collection_order(self, tmp_path):
+        """Ties go round-robin in collection order"""
+        store = store_with(tmp_path, {})
+        assignment, loads = plan_lpt(["a", "b", "c", "d"], 2, store)
+        assert [assignment[nodeid] for nodeid in "abcd"] == [0, 1, 0, 1]
+        assert loads[0] == loads[1]
+
+
+@pytest.mark.unit
+class TestNodeIds:
+    """Node id helpers shared by the scheduler plugins"""
+    
+    @pytest.mark.parametrize("nodeid, expected", [
+        ("tests/test_a.py::test_x@lpt1", "tests/test_a.py::test_x"),
+        ("tests/test_a.py::test_x[p]@lpt0", "tests/test_a.py::test_x[p]"),
+        ("tests/test_a.py::test_x[user@example.com]", "tests/test_a.py::test_x[user@example.com]"),
+        ("tests/test_a.py::test_x", "tests/test_a.py::test_x"),
+    ])
+    def test_base_nodeid(self, nodeid, expected):
+        """Only a trailing @group suffix is removed"""
+        assert base_nodeid(nodeid) == expected
+    
+    def test_priority_order(self):
+        """Recent failures first (latest first), then edited files, then the rest"""
+        nodeids = ["a.py::t1", "b.py::t2", "c.py::t3", "a.py::t4"]
+        ordered = priority_order(nodeids, failures={"c.py::t3": 2, "a.py::t4": 0}, edited={"b.py"})
+        assert ordered == ["a.py::t4", "c.py::t3", "b.py::t2", "a.py::t1"]
+
+
+@pytest.mark.unit
+class TestLptScheduling:
+    """One longest-first bin per xdist worker"""
+    
+    def schedule(self, tmp_path, collection, durations, workers=2, first=None):
+        """Run the scheduler over fake workers; returns the node ids each one received"""
+        scheduler = LptScheduling(FakeConfig(workers), store=store_with(tmp_path, durations), first=first)
+        nodes = [FakeNode(f"gw{index}") for index in range(workers)]
+        for node in nodes:
+            scheduler.add_node(node)
+        for node in nodes:
+            scheduler.add_node_collection(node, collection)
+        scheduler.schedule()
+        return scheduler, [[collection[index] for index in node.sent] for node in nodes]
+    
+    def test_each_worker_receives_one_bin_in_collection_order(self, tmp_path):
+        """Bins follow plan_lpt and node ids stay unchanged"""
+        collection = ["t.py::a", "t.py::b", "t.py::c", "t.py::d"]
+        durations = {"t.py::a": 1, "t.py::b": 8, "t.py::c": 4, "t.py::d": 3}
+        scheduler, received = self.schedule(tmp_path, collection, durations)
+        assert sorted(received) == [["t.py::a", "t.py::c", "t.py::d"], ["t.py::b"]]
+        assert sorted(scheduler.loads) == [8.0, 8.0]
+    
+    def test_grouped_tests_stay_together(self, tmp_path):
+        """Tests with an xdist_group suffix form their own work unit"""
+        collection = ["t.py::a", "t.py::g1@db", "t.py::g2@db"]
+        scheduler, received = self.schedule(tmp_path, collection, {"t.py::a": 5}, first=lambda nodeids: set())
+        assert "t.py::g1@db" not in scheduler.assignment
+        assert sorted(received) == [["t.py::a"], ["t.py::g1@db", "t.py::g2@db"]]
+    
+    def test_first_tests_come_from_the_callback(self, tmp_path):
+        """Moved-up tests are spread over the workers ahead of longer ones"""
+        collection = ["t.py::a", "t.py::b", "t.py::c"]
+        durations = {"t.py::a": 1, "t.py::b": 1, "t.py::c": 10}
+        scheduler, _ = self.schedule(tmp_path, collection, durations, first=lambda nodeids: {"t.py::a", "t.py::b"})
+        assert scheduler.assignment["t.py::a"] != scheduler.assignment["t.py::b"]
@@ -3,7 +3,6 @@ Test suite for Site Configuration
 """
 import pytest
 from pages.site_config_page import SiteConfigPage
-import time
 
 
 @pytest.mark.site_config
@@ -53,12 +52,12 @@ class TestSiteConfigToggles:
         if num_switches > 0:
             # Toggle first switch
             site_config.toggle_switch_by_index(0)
-            time.sleep(0.5)
+            site_config.wait_for_dom_quiet(replaces=0.5)
             
             # Toggle last switch
             if num_switches > 1:
                 site_config.toggle_switch_by_index(num_switches - 1)
-                time.sleep(0.5)
+                site_config.wait_for_dom_quiet(replaces=0.5)
             
             site_config.log_success("✓ Toggle switches can be toggled")
     
@@ -71,7 +70,7 @@ class TestSiteConfigToggles:
         
         for i in range(len(switches)):
             site_config.toggle_switch_by_index(i)
-            time.sleep(0.3)
+            site_config.wait_for_dom_quiet(replaces=0.3)
         
         site_config.log_success(f"✓ Toggled all {len(switches)} switches")
     
@@ -82,7 +81,7 @@ class TestSiteConfigToggles:
         
         # Toggle a switch
         site_config.toggle_switch_by_index(0)
-        time.sleep(0.5)
+        site_config.wait_for_dom_quiet(replaces=0.5)
         
         # Save configuration
         success = site_config.save_configuration()
@@ -96,11 +95,11 @@ class TestSiteConfigToggles:
         
         # Save current configuration
         site_config.save_configuration()
-        time.sleep(1)
+        site_config.wait_for_dom_quiet(replaces=1)
         
         # Refresh page
         site_config.refresh_page()
-        time.sleep(2)
+        site_config.wait_for_dom_quiet(replaces=2)
         
         # Verify toggles are still present
         assert site_config.verify_toggles_present(), "Configuration not persisted after refresh"
@@ -122,7 +121,6 @@ class TestSiteConfigEdgeCases:
             # Rapidly toggle first switch multiple times
             for _ in range(5):
                 site_config.toggle_switch_by_index(0)
-                time.sleep(0.1)
             
             site_config.log_success("✓ Rapid toggling handled")
     
@@ -143,8 +141,8 @@ class TestSiteConfigEdgeCases:
         for i in range(3):
             site_config.log(f"Iteration {i+1}")
             site_config.toggle_switch_by_index(0)
-            time.sleep(0.5)
+            site_config.wait_for_dom_quiet(replaces=0.5)
             site_config.save_configuration()
-            time.sleep(1)
+            site_config.wait_for_dom_quiet(replaces=1)
         
         site_config.log_success("✓ Multiple toggle and save operations handled")
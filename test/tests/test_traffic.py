@@ -0,0 +1,149 @@
+"""
+Unit tests for traffic normalization, diffing and replay id mapping (python run_tests.py unit)
+"""
+import json
+import pytest
+from traffic import NAMESPACE, TrafficArchive, TrafficReplayer, diff, normalize, owned_only
+
+
+class FakeResponse:
+    """Just what TrafficReplayer reads from a requests response"""
+    
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.text = json.dumps(body)
+
+
+class FakeApi:
+    """AdminApiClient stand-in answering from a function and logging the requests"""
+    
+    base_url = "http://backend/api"
+    timeout = 5
+    
+    def __init__(self, respond):
+        self.respond = respond
+        self.sent = []
+        self.session = self
+    
+    def request(self, method, url, data=None, timeout=None):
+        path = url[len(self.base_url):]
+        self.sent.append((method, path, data))
+        return FakeResponse(*self.respond(method, path, data))
+
+
+def entry(method, path, status, content, post_data=None):
+    """One archived exchange"""
+    return {"request": {"method": method, "path": path, "postData": post_data},
+            "response": {"status": status, "content": content}}
+
+
+@pytest.mark.unit
+class TestNormalize:
+    """Run-specific values replaced before comparing"""
+    
+    def test_timestamps_uuids_and_namespace(self):
+        """ISO timestamps, UUIDs and the namespace become placeholders, nested too"""
+        value = {"items": [{
+            "title": "Blog [ab12cd-gw0-0001]",
+            "date": "2026-10-17T18:38:26.123Z",
+            "ref": "3F2504E0-4F89-11D3-9A0C-0305E82C3301",
+        }]}
+        assert normalize(value, "ab12cd-gw0") == {"items": [{
+            "title": f"Blog [{NAMESPACE}-0001]",
+            "date": "<timestamp>",
+            "ref": "<uuid>",
+        }]}
+    
+    @pytest.mark.parametrize("key, value, expected", [
+        ("createdAt", 1760726306, "<timestamp>"),
+        ("updated_at", 1760726306.5, "<timestamp>"),
+        ("readTime", 1760726306, "<timestamp>"),
+        ("count", 1760726306, 1760726306),
+        ("createdAt", 5, 5),
+        ("published", True, True),
+    ])
+    def test_epoch_numbers_only_under_time_keys(self, key, value, expected):
+        """Large numbers are timestamps only under time-like keys"""
+        assert normalize({key: value})[key] == expected
+    
+    def test_owned_only_keeps_the_tests_items(self):
+        """Collections are reduced to items carrying the namespace placeholder"""
+        items = [{"title": f"Mine [{NAMESPACE}-0001]"}, {"title": "Someone else's"}]
+        assert owned_only({"data": items}) == items[:1]
+        assert owned_only({"title": "single"}) == {"title": "single"}
+
+
+@pytest.mark.unit
+class TestDiff:
+    """JSON differences as path lines"""
+    
+    def test_equal(self):
+        """No lines for equal values"""
+        assert diff({"a": [1, {"b": "x"}]}, {"a": [1, {"b": "x"}]}) == []
+    
+    def test_lines(self):
+        """Missing, unexpected, changed and resized values"""
+        lines = diff({"a": 1, "b": 2, "c": [1, 2]}, {"a": 3, "d": 4, "c": [1]})
+        assert lines == ["$.a: 1 != 3", "$.b: missing", "$.c: 2 items != 1", "$.d: unexpected 4"]
+
+
+@pytest.mark.unit
+class TestArchive:
+    """Gzipped JSON archive of recordings"""
+    
+    def test_round_trip_and_suffix_dedupe(self, tmp_path):
+        """Recordings keyed by @lptN node ids load under their base node id"""
+        path = str(tmp_path / "traffic.json.gz")
+        archive = TrafficArchive(path)
+        archive.merge({"tests/test_a.py::test_x@lpt1": {"namespace": "ns", "entries": []}})
+        archive.save()
+        loaded = TrafficArchive(path).load()
+        assert list(loaded.tests) == ["tests/test_a.py::test_x"]
+        assert TrafficArchive(str(tmp_path / "missing.json.gz")).load().tests == {}
+
+
+@pytest.mark.unit
+class TestReplayer:
+    """Replay with namespace swap and id mapping"""
+    
+    RECORDING = {
+        "namespace": "old000-gw0",
+        "entries": [
+            entry("POST", "/blogs", 201, {"id": 100, "title": "Blog [old000-gw0-0001]"},
+                  json.dumps({"title": "Blog [old000-gw0-0001]"})),
+            entry("PUT", "/blogs/100", 200, {"id": 100, "title": "Edited [old000-gw0-0001]", "views": 100},
+                  json.dumps({"id": 100, "title": "Edited [old000-gw0-0001]", "views": 100})),
+            entry("GET", "/blogs", 200, [{"id": 100, "title": "Edited [old000-gw0-0001]"}, {"id": 7, "title": "Other"}]),
+        ],
+    }
+    
+    def backend(self, method, path, data):
+        """Answers like the recorded backend, but creates the blog as id 500"""
+        if method == "POST":
+            return 201, dict(json.loads(data), id=500)
+        if method == "PUT":
+            return 200, json.loads(data)
+        return 200, [{"id": 3, "title": "Unrelated"}, {"id": 500, "title": "Edited [new000-gw0-0001]"}]
+    
+    def test_ids_and_namespace_are_mapped(self):
+        """The created id is reused in paths and id-like keys; other numbers stay"""
+        api = FakeApi(self.backend)
+        assert TrafficReplayer(api).replay(self.RECORDING, "new000-gw0") == []
+        method, path, data = api.sent[1]
+        assert path == "/blogs/500"
+        assert json.loads(data) == {"id": 500, "title": "Edited [new000-gw0-0001]", "views": 100}
+        assert "old000" not in api.sent[0][2]
+    
+    def test_differences_are_reported(self):
+        """A changed field or status shows up with the entry and JSON path"""
+        def broken(method, path, data):
+            if method == "PUT":
+                return 500, {"error": "boom"}
+            status, body = self.backend(method, path, data)
+            if method == "POST":
+                body["title"] = "Renamed"
+            return status, body
+        
+        differences = TrafficReplayer(FakeApi(broken)).replay(self.RECORDING, "new000-gw0")
+        assert any(line.startswith("#0 POST /blogs: $.title") for line in differences)
+        assert "#1 PUT /blogs/100: status 200 != 500" in differences
@@ -0,0 +1,200 @@
+"""
+Timing spans around page object primitives, written as per-test timelines
+"""
+import functools
+import json
+import os
+import re
+import sys
+import time
+from config import TestConfig
+
+
+# Span categories in the end-of-run breakdown; "action" is page object code
+# between primitives, "test" is test code outside any page object
+CATEGORIES = ("setup", "teardown", "wait", "driver", "sleep", "action", "test")
+
+
+class SpanTracer:
+    """
+    Records nested timing spans for the test that is currently running.
+    
+    Time is attributed exclusively: a click that waits for its element
+    counts the wait as "wait" and only the rest as "driver". When disabled,
+    timed() methods cost one attribute check per call.
+    """
+    
+    def __init__(self, enabled=False, timeline_dir=None):
+        self.enabled = enabled
+        self.timeline_dir = timeline_dir or TestConfig.TIMELINE_DIR
+        self.nodeid = None
+        self.spans = []
+        self.stack = []
+        self.test_start = None
+        self.totals = dict.fromkeys(CATEGORIES, 0.0)
+    
+    def begin_test(self, nodeid):
+        """Start collecting spans for a test"""
+        self.nodeid = nodeid
+        self.spans = []
+        self.stack = []
+        self.test_start = time.perf_counter()
+    
+    def end_test(self):
+        """Write the test's timeline; returns its path"""
+        if self.nodeid is None:
+            return None
+        path = self.write_timeline()
+        self.nodeid = None
+        return path
+    
+    def start(self, category, name, page=None, target=None):
+        """Open a span; pass the returned span to finish()"""
+        span = {
+            "name": name,
+            "category": category,
+            "page": page,
+            "target": target,
+            "depth": len(self.stack),
+            "start": time.perf_counter(),
+            "children": 0.0,
+        }
+        self.stack.append(span)
+        return span
+    
+    def finish(self, span, error=None):
+        """Close a span and attribute its exclusive time to its category"""
+        end = time.perf_counter()
+        self.stack.pop()
+        duration = end - span["start"]
+        self.totals[span["category"]] += duration - span.pop("children")
+        if self.stack:
+            self.stack[-1]["children"] += duration
+        span["duration"] = duration
+        if error is not None:
+            span["error"] = error
+        if self.nodeid is not None:
+            self.spans.append(span)
+    
+    def span(self, category, name, page=None, target=None):
+        """Context manager version of start()/finish()"""
+        return _Span(self, category, name, page, target)
+    
+    def timeline_spans(self):
+        """Spans of the current (or just finished) test, ordered by start time"""
+        origin = self.test_start
+        return [
+            dict(
+                {k: v for k, v in s.items() if k not in ("start", "duration") and v is not None},
+                start_ms=round((s["start"] - origin) * 1000, 2),
+                duration_ms=round(s["duration"] * 1000, 2),
+            )
+            for s in sorted(self.spans, key=lambda s: s["start"])
+        ]
+    
+    def write_timeline(self):
+        """Dump the current test's spans as JSON"""
+        timeline = {
+            "test": self.nodeid,
+            "worker": os.getenv("PYTEST_XDIST_WORKER", "main"),
+            "spans": self.timeline_spans(),
+        }
+        os.makedirs(self.timeline_dir, exist_ok=True)
+        path = os.path.join(self.timeline_dir, re.sub(r"[^\w.-]+", "_", self.nodeid) + ".json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(timeline, f, indent=1)
+        return path
+    
+    def breakdown_ms(self):
+        """Exclusive milliseconds per category, for record_run_stats()"""
+        return {category: int(seconds * 1000) for category, seconds in self.totals.items()}
+    
+    @staticmethod
+    def format_breakdown(totals_ms):
+        """Human readable share of every category"""
+        total = sum(totals_ms.values()) or 1
+        return ", ".join(
+            f"{category} {totals_ms.get(category, 0) / 1000:.1f}s ({totals_ms.get(category, 0) * 100 / total:.0f}%)"
+            for category in CATEGORIES
+        )
+
+
+class _Span:
+    """Context manager around one tracer span"""
+    
+    def __init__(self, tracer, category, name, page, target):
+        self.tracer = tracer
+        self.args = (category, name, page, target)
+        self.span = None
+    
+    def __enter__(self):
+        if self.tracer.enabled:
+            self.span = self.tracer.start(*self.args)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if self.span is not None:
+            self.tracer.finish(self.span, exc_type.__name__ if exc_type else None)
+        return False
+
+
+tracer = SpanTracer(enabled=TestConfig.TIMING_SPANS)
+
+
+def describe_target(value):
+    """Short form of a locator or URL argument"""
+    if isinstance(value, tuple) and len(value) == 2:
+        return f"{value[0]}={value[1]}"
+    if isinstance(value, str):
+        return value
+    return None
+
+
+def timed(category):
+    """
+    Record every call of a page object method as a span
+    
+    The span carries the page object class and, when the first argument is
+    a locator or URL, that target.
+    """
+    def decorator(func):
+        name = func.__name__
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not tracer.enabled:
+                return func(self, *args, **kwargs)
+            target = describe_target(args[0]) if args else None
+            span = tracer.start(category, name, type(self).__name__, target)
+            try:
+                result = func(self, *args, **kwargs)
+            except BaseException as e:
+                tracer.finish(span, e.__class__.__name__)
+                raise
+            tracer.finish(span)
+            return result
+        return wrapper
+    return decorator
+
+
+def caller_name():
+    """
+    Name of the function that called the caller, skipping timed() wrappers
+    
+    Lets a decorated method label its measurements with the page object
+    method or test that used it instead of "wrapper".
+    """
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    return frame.f_code.co_name if frame is not None else "unknown"
+
+
+def traced_sleep(seconds):
+    """time.sleep() that shows up as a "sleep" span"""
+    if not tracer.enabled:
+        time.sleep(seconds)
+        return
+    span = tracer.start("sleep", "sleep", target=f"{seconds}s")
+    time.sleep(seconds)
+    tracer.finish(span)
@@ -0,0 +1,317 @@
+"""
+Admin API traffic recorded during browser tests and replayed without a browser
+"""
+import base64
+import gzip
+import json
+import os
+import re
+import time
+import requests
+from selenium.common.exceptions import WebDriverException
+from config import TestConfig
+from api_client import AdminApiClient
+from scheduler import base_nodeid
+from log_backend import get_logger
+
+
+logger = get_logger("TRAFFIC")
+
+# Values that differ between two runs of the same test
+TIMESTAMP_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T _-]\d{2}[:-]\d{2}[:-]\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+TIMESTAMP_KEY_RE = re.compile(r"(?:^|_)(?:at|time|timestamp|created|updated|modified)$|[a-z](?:At|Time)$")
+
+# Keys whose values are entity ids the backend may generate
+ID_KEY_RE = re.compile(r"^id$|_id$|[a-z]Id$")
+
+# Placeholder of the recording's data factory namespace after normalizing
+NAMESPACE = "<ns>"
+
+
+def parse_body(text):
+    """JSON body decoded, other bodies as text, empty bodies as None"""
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def normalize(value, namespace=None, key=None):
+    """
+    Copy of a response body with run-specific values replaced
+    
+    Timestamps (ISO strings, or epoch numbers under time-like keys) become
+    "<timestamp>", UUIDs "<uuid>" and the data factory namespace "<ns>".
+    """
+    if isinstance(value, dict):
+        return {k: normalize(v, namespace, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [normalize(v, namespace, key) for v in value]
+    if isinstance(value, str):
+        if namespace:
+            value = value.replace(namespace, NAMESPACE)
+        value = TIMESTAMP_RE.sub("<timestamp>", value)
+        return UUID_RE.sub("<uuid>", value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if key and TIMESTAMP_KEY_RE.search(key) and value > 1e9:
+            return "<timestamp>"
+    return value
+
+
+def owned_only(value):
+    """
+    Collections reduced to the items that belong to the test
+    
+    Lists in responses also hold data of other tests and of whoever used
+    the backend before, so only items carrying the test's namespace are
+    compared.
+    """
+    value = AdminApiClient.unwrap(value)
+    if isinstance(value, list):
+        return [item for item in value if NAMESPACE in json.dumps(item)]
+    return value
+
+
+def diff(expected, actual, path="$"):
+    """Differences between two JSON values, as "path: expected != actual" lines"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        lines = []
+        for key in sorted(set(expected) | set(actual), key=str):
+            if key not in actual:
+                lines.append(f"{path}.{key}: missing")
+            elif key not in expected:
+                lines.append(f"{path}.{key}: unexpected {json.dumps(actual[key])[:80]}")
+            else:
+                lines.extend(diff(expected[key], actual[key], f"{path}.{key}"))
+        return lines
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path}: {len(expected)} items != {len(actual)}"]
+        lines = []
+        for index, (e, a) in enumerate(zip(expected, actual)):
+            lines.extend(diff(e, a, f"{path}[{index}]"))
+        return lines
+    if expected != actual:
+        return [f"{path}: {json.dumps(expected)[:80]} != {json.dumps(actual)[:80]}"]
+    return []
+
+
+class TrafficArchive:
+    """
+    Recorded exchanges per test, stored as gzipped JSON.
+    
+    HAR-like but reduced to what a replay needs: per test the data factory
+    namespace and, in order, each request's source ("browser" or "api"),
+    method, path below API_URL and body, and the response status and body.
+    """
+    
+    def __init__(self, path=None):
+        self.path = path or TestConfig.TRAFFIC_ARCHIVE
+        self.tests = {}
+        self.api_url = None
+        self.recorded = None
+    
+    def load(self):
+        """Read the archive; a missing archive is empty"""
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return self
+        # Archives written before recordings were keyed by base node id
+        # may hold @lptN duplicates of a test; the last one wins
+        self.tests = {base_nodeid(nodeid): test for nodeid, test in data["tests"].items()}
+        self.api_url = data.get("api_url")
+        self.recorded = data.get("recorded")
+        return self
+    
+    def merge(self, tests):
+        """Add or replace the recordings of some tests, keeping the others"""
+        self.tests.update(tests)
+        self.recorded = time.time()
+        self.api_url = TestConfig.API_URL
+    
+    def save(self):
+        """Write atomically; returns the path"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"version": 1, "recorded": self.recorded, "api_url": self.api_url,
+                       "tests": self.tests}, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        return self.path
+
+
+class TrafficRecorder:
+    """
+    Collects the admin API exchanges of the test that is currently running.
+    
+    Browser requests come from the CDP Network events the NetworkMonitor
+    drains; their bodies are read with Network.getResponseBody while the
+    page is still open. Requests the suite itself sends (seeding, cleanup)
+    come from a response hook on the api_client session, so a replay
+    creates the same data. Only recordings of passing tests are kept.
+    """
+    
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.prefix = TestConfig.API_URL.rstrip("/")
+        self.nodeid = None
+        self.entries = []
+        self.failed = False
+        self.tests = {}
+    
+    def begin_test(self, nodeid):
+        """Start recording a test"""
+        self.nodeid = nodeid
+        self.entries = []
+        self.failed = False
+    
+    def end_test(self, namespace):
+        """Keep the test's recording, ordered by request start, unless it failed"""
+        if self.nodeid is None:
+            return
+        if not self.failed and self.entries:
+            self.entries.sort(key=lambda entry: entry["startedDateTime"])
+            self.tests[self.nodeid] = {"namespace": namespace, "entries": self.entries}
+        self.nodeid = None
+        self.entries = []
+    
+    def record_browser(self, driver, request):
+        """Store a finished fetch/XHR of the browser if it went to the admin API"""
+        if self.nodeid is None or not request.url.startswith(self.prefix):
+            return
+        post_data = request.post_data
+        try:
+            if post_data is None and request.has_post_data:
+                post_data = driver.execute_cdp_cmd(
+                    "Network.getRequestPostData", {"requestId": request.request_id}
+                )["postData"]
+            result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request.request_id})
+        except WebDriverException:
+            logger.warning(f"Body of {request.method} {request.url} no longer available")
+            return
+        body = result["body"]
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8", "replace")
+        self._add("browser", request.wall_time, request.method, request.url, post_data, request.status, body)
+    
+    def record_response(self, response, *args, **kwargs):
+        """requests response hook for the suite's own API calls"""
+        if self.nodeid is None or not response.url.startswith(self.prefix):
+            return
+        body = response.request.body
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
+        started = time.time() - response.elapsed.total_seconds()
+        self._add("api", started, response.request.method, response.url, body, response.status_code, response.text)
+    
+    def _add(self, source, started, method, url, post_data, status, body):
+        """Append one exchange in archive form"""
+        self.entries.append({
+            "startedDateTime": started,
+            "source": source,
+            "request": {"method": method, "path": url[len(self.prefix):], "postData": post_data},
+            "response": {"status": status, "content": parse_body(body)},
+        })
+
+
+class TrafficReplayer:
+    """
+    Sends a test's recorded requests straight to the backend and compares
+    the responses with the recording.
+    
+    The recording's namespace is swapped for a fresh one in paths and
+    bodies, so replayed entities do not collide with recorded ones. Ids the
+    backend generates are mapped from recorded to replayed values as the
+    creating responses come in. Both sides are normalized before the
+    comparison and collections are reduced to the test's own items.
+    """
+    
+    def __init__(self, api=None):
+        self.api = api or AdminApiClient()
+    
+    def replay(self, recording, namespace):
+        """
+        Replay one test's recording
+        
+        Args:
+            recording: {"namespace": ..., "entries": [...]} from the archive
+            namespace: Namespace used instead of the recorded one
+        
+        Returns:
+            List of difference lines, empty if every response matched
+        """
+        recorded_ns = recording.get("namespace")
+        ids = {}
+        differences = []
+        for index, entry in enumerate(recording["entries"]):
+            request, expected = entry["request"], entry["response"]
+            path = "/".join(
+                ids.get(segment, segment) for segment in self._renamed(request["path"], recorded_ns, namespace).split("/")
+            )
+            data = request["postData"]
+            if data is not None:
+                data = self._renamed(data, recorded_ns, namespace)
+                body = parse_body(data)
+                if isinstance(body, (dict, list)):
+                    data = json.dumps(self._mapped(body, ids))
+            label = f"#{index} {request['method']} {request['path']}"
+            try:
+                response = self.api.session.request(
+                    request["method"], self.api.base_url + path, data=data, timeout=self.api.timeout
+                )
+            except requests.RequestException as e:
+                differences.append(f"{label}: {e.__class__.__name__}")
+                continue
+            
+            actual = parse_body(response.text)
+            if response.status_code != expected["status"]:
+                differences.append(f"{label}: status {expected['status']} != {response.status_code}")
+                continue
+            if request["method"] == "POST":
+                self._map_id(expected["content"], actual, ids)
+            
+            recorded = self._mapped(expected["content"], ids)
+            lines = diff(
+                owned_only(normalize(recorded, recorded_ns)),
+                owned_only(normalize(actual, namespace)),
+            )
+            differences.extend(f"{label}: {line}" for line in lines)
+        return differences
+    
+    @staticmethod
+    def _map_id(expected, actual, ids):
+        """Remember the id the backend generated in place of the recorded one"""
+        expected, actual = AdminApiClient.unwrap(expected), AdminApiClient.unwrap(actual)
+        if isinstance(expected, dict) and isinstance(actual, dict):
+            if expected.get("id") is not None and actual.get("id") is not None:
+                ids[str(expected["id"])] = str(actual["id"])
+    
+    @staticmethod
+    def _renamed(text, recorded_ns, namespace):
+        """Path or request body with the recorded namespace swapped"""
+        return text.replace(recorded_ns, namespace) if recorded_ns else text
+    
+    def _mapped(self, value, ids, key=None):
+        """Copy with recorded ids under id-like keys replaced by the replayed ones"""
+        if isinstance(value, dict):
+            return {k: self._mapped(v, ids, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._mapped(v, ids, key) for v in value]
+        if key and ID_KEY_RE.search(key) and not isinstance(value, bool) and str(value) in ids:
+            new = ids[str(value)]
+            return int(new) if isinstance(value, int) and new.isdigit() else new
+        return value
+    
+    def close(self):
+        """Close the HTTP session"""
+        self.api.close()
+
+
+recorder = TrafficRecorder(enabled=TestConfig.RECORD_TRAFFIC)